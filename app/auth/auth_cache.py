@@ -0,0 +1,161 @@
+"""
+Prozess-lokale Caches für die Authentifizierung – ein authentifizierter Request braucht
+im Normalfall weder JWT-Prüfung noch Datenbank:
+
+- token_cache:     SHA-256(Token) → geprüfte Claims. Lebt höchstens bis zum `exp` des Tokens.
+- principal_cache: username → Principal(id, username), schlanker Ersatz für das User-Objekt.
+
+Beide sind LRU + absolute TTL über einem OrderedDict (wie LiveGameCache, aber ohne Verlängerung
+bei Zugriff – Änderungen an Usern sollen spätestens nach `ttl` Sekunden überall ankommen).
+Ungültige Tokens und unbekannte User werden nicht gecacht.
+
+Invalidierung: jedes UPDATE/DELETE eines User-Objekts über die ORM-Session verwirft den
+Principal (siehe Event-Listener unten); Bulk-Statements (update(User)/delete(User)) müssen
+`invalidate_user` selbst aufrufen.
+
+Konfiguration über AUTH_TOKEN_CACHE_SIZE / AUTH_TOKEN_CACHE_TTL und
+AUTH_PRINCIPAL_CACHE_SIZE / AUTH_PRINCIPAL_CACHE_TTL (TTL 0 = Cache aus).
+"""
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from sqlalchemy import event, inspect
+
+from app.auth.jwt_handler import decode_access_token
+from app.models.user import User
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """Der angemeldete User – nur was Routen zum Autorisieren brauchen."""
+    id: int
+    username: str
+
+
+class TTLCache:
+    """
+    LRU + absolute TTL pro Eintrag (älteste Einträge vorne).
+    Zähler für Hits / Misses / Evictions / Expirations / Invalidations.
+    """
+
+    def __init__(self, max_entries: int = 4096, ttl: float = 300.0, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict = OrderedDict()   # key → (Wert, läuft ab um)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        value, expires_at = entry
+        if self._clock() >= expires_at:
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value, ttl: float | None = None) -> None:
+        """`ttl` kürzer als der Default (z. B. Restlaufzeit eines Tokens); ≤ 0 → nicht cachen."""
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        self._entries[key] = (value, self._clock() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key) -> None:
+        if self._entries.pop(key, None) is not None:
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = self.expirations = self.invalidations = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+token_cache = TTLCache(
+    max_entries=int(os.getenv("AUTH_TOKEN_CACHE_SIZE", 4096)),
+    ttl=float(os.getenv("AUTH_TOKEN_CACHE_TTL", 300)),
+)
+principal_cache = TTLCache(
+    max_entries=int(os.getenv("AUTH_PRINCIPAL_CACHE_SIZE", 4096)),
+    ttl=float(os.getenv("AUTH_PRINCIPAL_CACHE_TTL", 300)),
+)
+
+
+# ============================================================
+# Tokens
+# ============================================================
+
+def token_digest(token: str) -> bytes:
+    """Schlüssel im Cache – das Token selbst wird nicht im Speicher gehalten."""
+    return hashlib.sha256(token.encode()).digest()
+
+
+def decode_token_cached(token: str) -> dict:
+    """Wie decode_access_token (401 bei ungültigem Token), geprüfte Claims aber aus dem Cache."""
+    key = token_digest(token)
+    payload = token_cache.get(key)
+    if payload is None:
+        payload = decode_access_token(token)
+        expires = payload.get("exp")
+        token_cache.put(key, payload, None if expires is None else expires - time.time())
+    return payload
+
+
+# ============================================================
+# Principals
+# ============================================================
+
+def invalidate_user(*usernames: str) -> None:
+    for username in usernames:
+        principal_cache.invalidate(username)
+
+
+@event.listens_for(User, "after_update")
+def _user_updated(mapper, connection, target: User) -> None:
+    # Bei Umbenennung auch den alten Namen verwerfen
+    history = inspect(target).attrs.username.history
+    invalidate_user(target.username, *(history.deleted or ()))
+
+
+@event.listens_for(User, "after_delete")
+def _user_deleted(mapper, connection, target: User) -> None:
+    invalidate_user(target.username)
+
+
+def auth_cache_stats() -> dict:
+    return {"tokens": token_cache.stats(), "principals": principal_cache.stats()}
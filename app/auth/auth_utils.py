@@ -1,3 +1,5 @@
+import os
+
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
@@ -5,10 +7,20 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.crud.user_crud import get_user_by_username
-from app.auth.jwt_handler import decode_access_token
+from app.auth.auth_cache import Principal, decode_token_cached, principal_cache
+from app.auth.password_pool import password_pool
 
 # Password hashing setup
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Kostenfaktor fest (min = max = default): Hashes mit anderem Faktor gelten als veraltet
+# und werden beim nächsten erfolgreichen Login neu berechnet (verify_password_async).
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=BCRYPT_ROUNDS,
+    bcrypt__min_rounds=BCRYPT_ROUNDS,
+    bcrypt__max_rounds=BCRYPT_ROUNDS,
+)
 
 # OAuth2 scheme
 #oauth2_scheme = OAuth2PasswordBearer(tokenUrl="users/login",scheme_name="JWT")
@@ -19,28 +31,56 @@ def hash_password(password: str) -> str:
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
+    # Kein gültiger Hash (z. B. importierte User ohne Passwort) → Login nicht möglich
+    if not pwd_context.identify(hashed_password):
+        return False
     return pwd_context.verify(plain_password, hashed_password)
 
 
-async def get_current_user(
-    creds: HTTPAuthorizationCredentials = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_db)
-):
-    token = creds.credentials   # JWT als string
-    print("🔑 Erhaltener Token:", token)
+def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """(Passwort korrekt?, neuer Hash falls der alte veraltet ist – sonst None)."""
+    if not pwd_context.identify(hashed_password):
+        return False, None
+    return pwd_context.verify_and_update(plain_password, hashed_password)
 
-    payload = decode_access_token(token)
-    print("📦 Decoded payload:", payload)
 
-    username: str = payload.get("sub")
-    print("👤 Username aus Token:", username)
+# ---------------------------------------------------------
+# Async-Varianten für Routen: bcrypt im password_pool statt im Event-Loop
+# ---------------------------------------------------------
+async def hash_password_async(password: str) -> str:
+    return await password_pool.run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """Wie verify_and_update_password; PasswordPoolBusy bei voller Warteschlange."""
+    return await password_pool.run(verify_and_update_password, plain_password, hashed_password)
+
 
+async def resolve_principal(db: AsyncSession, token: str) -> Principal:
+    """
+    Token → Principal(id, username), 401 bei ungültigem Token oder unbekanntem User.
+    Claims und Principal kommen aus den Auth-Caches (app/auth/auth_cache.py) –
+    nur bei einem Cache-Miss wird das Token geprüft bzw. der User geladen.
+    """
+    payload = decode_token_cached(token)
+
+    username: str = payload.get("sub")
     if username is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
-    user = await get_user_by_username(db, username=username)
-    if not user:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+    principal = principal_cache.get(username)
+    if principal is None:
+        user = await get_user_by_username(db, username=username)
+        if not user:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+        principal = Principal(id=user.id, username=user.username)
+        principal_cache.put(username, principal)
+
+    return principal
+
 
-    print("✅ Gefundener User:", user.username)
-    return user
\ No newline at end of file
+async def get_current_user(
+    creds: HTTPAuthorizationCredentials = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db)
+) -> Principal:
+    return await resolve_principal(db, creds.credentials)
@@ -0,0 +1,105 @@
+"""
+bcrypt außerhalb des Event-Loops.
+
+Ein bcrypt-Hash (Kostenfaktor 12) kostet ~100–300 ms CPU. Synchron im Request-Handler
+blockiert das den ganzen Event-Loop – bei einem Login-Ansturm (Turnierstart) stehen
+solange auch alle Würfe und Live-Kanäle.
+
+- Eigener ThreadPoolExecutor (BCRYPT_WORKERS Threads): das bcrypt-Paket gibt den GIL
+  während der Berechnung frei → echte Parallelität, ohne Prozess-Overhead.
+- Begrenzte Warteschlange: mehr als BCRYPT_MAX_PENDING angenommene Jobs (laufend + wartend)
+  → PasswordPoolBusy, die Route antwortet mit 503 + Retry-After statt den Rückstau zu vergrößern.
+- Zähler für Tiefe, Wartezeit und Rechenzeit: GET /metrics/passwords.
+"""
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class PasswordPoolBusy(Exception):
+    """Zu viele ausstehende Hash-Jobs – später erneut versuchen."""
+
+
+class PasswordHashPool:
+
+    def __init__(self, workers: int = 4, max_pending: int = 64):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: ThreadPoolExecutor | None = None
+
+        # Metriken
+        self.pending = 0          # angenommen, noch nicht fertig (laufend + wartend)
+        self.max_depth = 0        # größte Warteschlange seit dem Start
+        self.completed = 0
+        self.rejected = 0
+        self.wait_ms_total = 0.0
+        self.wait_ms_max = 0.0
+        self.run_ms_total = 0.0
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+        return self._executor
+
+    @property
+    def queue_depth(self) -> int:
+        """Jobs, die auf einen freien Thread warten."""
+        return max(0, self.pending - self.workers)
+
+    async def run(self, fn, *args):
+        """Führt `fn(*args)` in einem bcrypt-Thread aus. PasswordPoolBusy, wenn die Warteschlange voll ist."""
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise PasswordPoolBusy(f"{self.pending} password jobs pending")
+
+        submitted = time.perf_counter()
+
+        def job():
+            started = time.perf_counter()
+            return fn(*args), started, time.perf_counter()
+
+        def done(future: asyncio.Future) -> None:
+            # Erst wenn der Thread fertig ist – nicht schon, wenn der wartende Request abbricht
+            self.pending -= 1
+            if future.cancelled() or future.exception() is not None:
+                return
+            _, started, finished = future.result()
+            wait_ms = (started - submitted) * 1000
+            self.completed += 1
+            self.wait_ms_total += wait_ms
+            self.wait_ms_max = max(self.wait_ms_max, wait_ms)
+            self.run_ms_total += (finished - started) * 1000
+
+        self.pending += 1
+        self.max_depth = max(self.max_depth, self.queue_depth)
+        future = asyncio.get_running_loop().run_in_executor(self._pool(), job)
+        future.add_done_callback(done)
+        # shield: ein abgebrochener Request bricht den Job nicht ab, der Slot bleibt bis zum Ende belegt
+        result, _, _ = await asyncio.shield(future)
+        return result
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_depth,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_wait_ms": round(self.wait_ms_total / self.completed, 2) if self.completed else 0.0,
+            "max_wait_ms": round(self.wait_ms_max, 2),
+            "avg_hash_ms": round(self.run_ms_total / self.completed, 2) if self.completed else 0.0,
+        }
+
+
+password_pool = PasswordHashPool(
+    workers=int(os.getenv("BCRYPT_WORKERS", min(4, os.cpu_count() or 1))),
+    max_pending=int(os.getenv("BCRYPT_MAX_PENDING", 64)),
+)
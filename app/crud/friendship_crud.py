@@ -3,6 +3,9 @@ from sqlalchemy.future import select
 from app.models.friendship import Friendship
 from app.schemas.friendship_schemas import FriendshipCreate
 from typing import List, Optional
+from heapq import merge
+
+from app.crud.pagination import decode_cursor, page_of
 
 
 async def create_friendship(db: AsyncSession, data: FriendshipCreate) -> Friendship:
@@ -17,4 +20,28 @@ async def get_friendships_for_user(db: AsyncSession, user_id: int) -> List[Frien
     result = await db.execute(
         select(Friendship).where((Friendship.user_id1 == user_id) | (Friendship.user_id2 == user_id))
     )
-    return result.scalars().all()
\ No newline at end of file
+    return result.scalars().all()
+
+
+async def get_friendships_page_for_user(db: AsyncSession, user_id: int, limit: int, cursor: Optional[str] = None):
+    """
+    Eine Seite der Freundschaften eines Users. Statt EINER Query mit OR (kein Index nutzbar
+    für die Sortierung) zwei Range-Scans über (user_id1, id) bzw. (user_id2, id), je
+    höchstens limit + 1 Zeilen, sortiert zusammengeführt.
+    """
+    after = decode_cursor(cursor)
+    sides = []
+    for column in (Friendship.user_id1, Friendship.user_id2):
+        query = select(Friendship).where(column == user_id)
+        if after is not None:
+            query = query.where(Friendship.id > after)
+        result = await db.execute(query.order_by(Friendship.id).limit(limit + 1))
+        sides.append(result.scalars().all())
+
+    rows, seen = [], set()
+    for friendship in merge(*sides, key=lambda f: f.id):
+        # Freundschaft mit sich selbst stünde in beiden Listen
+        if friendship.id not in seen:
+            seen.add(friendship.id)
+            rows.append(friendship)
+    return page_of(rows[:limit + 1], limit)
@@ -1,28 +1,81 @@
 from typing import Optional, List
 from datetime import datetime, timezone
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.models.game import Game
 from app.models.game_participant import GameParticipant
 from app.models.game_mode import GameMode
+from app.models.user import User
+from app.crud.load_profiles import load_profile
+from app.crud.pagination import keyset_page
 
 
-# Vollständiges Game inkl. Relationen
-async def get_game_entity(db: AsyncSession, game_id: int) -> Optional[Game]:
+# Game inkl. Relationen laut Loader-Profil (Teilnehmer + User + Modus)
+async def get_game_entity(db: AsyncSession, game_id: int, profile: str = "game_list") -> Optional[Game]:
     result = await db.execute(
         select(Game)
-        .options(
-            selectinload(Game.participants).selectinload(GameParticipant.user),
-            selectinload(Game.participants).selectinload(GameParticipant.throws),
-            selectinload(Game.game_mode),
-        )
+        .options(*load_profile(profile))
         .where(Game.id == game_id)
     )
     return result.scalars().first()
 
 
+# Kompakter Live-Zustand eines Spiels inkl. Scoreboard-Projektion: EINE Query, nur Spalten
+# (keine ORM-Objekte/Relationen). Eine Zeile pro Teilnehmer, sortiert nach Spielreihenfolge.
+async def get_live_game_rows(db: AsyncSession, game_id: int):
+    result = await db.execute(
+        select(
+            Game.id.label("game_id"),
+            Game.game_mode_id,
+            Game.status,
+            Game.current_turn_user_id,
+            Game.start_time,
+            Game.end_time,
+            GameMode.scoring_type,
+            GameMode.starting_score.label("mode_starting_score"),
+            GameMode.checkout_rule,
+            GameMode.checkin_rule,
+            GameParticipant.id.label("participant_id"),
+            GameParticipant.user_id,
+            User.username,
+            GameParticipant.starting_score,
+            GameParticipant.current_score,
+            GameParticipant.cricket_marks,
+            GameParticipant.turn_number,
+            GameParticipant.throw_in_turn,
+            GameParticipant.darts_thrown,
+            GameParticipant.darts,
+            GameParticipant.turn_start_score.label("sb_turn_start_score"),
+            GameParticipant.score_last_turn.label("sb_score_last_turn"),
+            GameParticipant.dart1_score.label("sb_dart1_score"),
+            GameParticipant.dart2_score.label("sb_dart2_score"),
+            GameParticipant.dart3_score.label("sb_dart3_score"),
+            GameParticipant.turns_completed.label("sb_turns_completed"),
+            GameParticipant.first9_points.label("sb_first9_points"),
+            GameParticipant.highest_score.label("sb_highest_score"),
+            GameParticipant.checkout_attempts.label("sb_checkout_attempts"),
+            GameParticipant.checkouts.label("sb_checkouts"),
+            GameParticipant.best_leg.label("sb_best_leg"),
+        )
+        .join(GameMode, GameMode.id == Game.game_mode_id)
+        .outerjoin(GameParticipant, GameParticipant.game_id == Game.id)
+        .outerjoin(User, User.id == GameParticipant.user_id)
+        .where(Game.id == game_id)
+        .order_by(GameParticipant.id)
+    )
+    return result.all()
+
+
+# Turn-Zeiger/Status schreiben (ohne Commit – Teil der Wurf-Transaktion)
+async def save_game_turn(db: AsyncSession, game_id: int, current_turn_user_id: int | None, status: str | None) -> None:
+    await db.execute(
+        update(Game)
+        .where(Game.id == game_id)
+        .values(current_turn_user_id=current_turn_user_id, status=status)
+    )
+
+
 # --- WICHTIG ---
 async def get_game(db: AsyncSession, game_id: int) -> Optional[Game]:
     """Von Tests und Services erwartete Wrapper-Funktion."""
@@ -34,12 +87,7 @@ async def get_game_raw(db: AsyncSession, game_id: int) -> Optional[Game]:
 
 
 async def get_game_with_participants(db: AsyncSession, game_id: int):
-    result = await db.execute(
-        select(Game)
-        .options(selectinload(Game.participants).selectinload(GameParticipant.user))
-        .where(Game.id == game_id)
-    )
-    return result.scalars().first()
+    return await get_game_entity(db, game_id, profile="game_list")
 
 
 async def create_game(
@@ -90,8 +138,9 @@ async def create_game(
 
     db.add_all(participants)
     await db.commit()
-    await db.refresh(new_game)
-    return new_game
+
+    # Statt refresh: einmal mit Profil laden (Teilnehmer + User + Modus für die Response)
+    return await get_game_entity(db, new_game.id, profile="game_list")
 
 
 async def update_game(db: AsyncSession, game: Game) -> Game:
@@ -102,25 +151,26 @@ async def update_game(db: AsyncSession, game: Game) -> Game:
 
 
 async def finish_game(db: AsyncSession, game_id: int) -> Optional[Game]:
-    game = await get_game_entity(db, game_id)
+    game = await get_game_entity(db, game_id, profile="game_list")
     if not game:
         return None
 
     game.end_time = datetime.now(timezone.utc)
     game.status = "finished"
-    db.add(game)
     await db.commit()
-    await db.refresh(game)
     return game
 
 
 async def get_games_by_user_entity(db: AsyncSession, user_id: int) -> List[Game]:
     result = await db.execute(
         select(Game)
-        .options(
-            selectinload(Game.participants).selectinload(GameParticipant.user),
-            selectinload(Game.game_mode),
-        )
+        .options(*load_profile("game_list"))
         .where(Game.user_id == user_id)
     )
-    return result.scalars().unique().all()
\ No newline at end of file
+    return result.scalars().unique().all()
+
+
+async def get_games_page_by_user(db: AsyncSession, user_id: int, limit: int, cursor: Optional[str] = None):
+    """Eine Seite der Spiele eines Users (Range-Scan über ix_games_user_id_id)."""
+    query = select(Game).options(*load_profile("game_list")).where(Game.user_id == user_id)
+    return await keyset_page(db, query, Game.id, limit, cursor)
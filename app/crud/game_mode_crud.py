@@ -3,7 +3,9 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.game_mode import GameMode
+from app.crud.load_profiles import load_profile
 from app.schemas.game_mode_schemas import GameModeCreate
+from app.services.game_rules import invalidate_rules
 
 
 async def get_game_mode(db: AsyncSession, id: int) -> Optional[GameMode]:
@@ -27,13 +29,18 @@ async def update_game_mode(db: AsyncSession, mode: GameMode) -> GameMode:
     db.add(mode)
     await db.commit()
     await db.refresh(mode)
+    invalidate_rules(mode.id)
     return mode
 
 
 async def delete_game_mode(db: AsyncSession, mode_id: int) -> bool:
-    mode = await db.get(GameMode, mode_id)
+    # Cascade-Delete braucht die abhängigen Games/Statistiken geladen
+    mode = await db.scalar(
+        select(GameMode).options(*load_profile("game_mode_delete")).where(GameMode.id == mode_id)
+    )
     if not mode:
         return False
     await db.delete(mode)
     await db.commit()
+    invalidate_rules(mode_id)
     return True
\ No newline at end of file
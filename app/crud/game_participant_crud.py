@@ -1,9 +1,11 @@
 from typing import Optional, List
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.models.game_participant import GameParticipant
+from app.crud import scoreboard_crud
+from app.crud.load_profiles import load_profile
+from app.crud.pagination import keyset_page
 
 
 # -------------------------------
@@ -28,12 +30,11 @@ async def create_participant(
 
     db.add(participant)
     await db.commit()
-    await db.refresh(participant)
-    return participant
+    return await get_participant(db, participant.id)
 
 
 # -------------------------------
-# READ: by participant_id
+# READ: by participant_id (inkl. User, ohne Würfe)
 # -------------------------------
 async def get_participant(
     db: AsyncSession,
@@ -42,17 +43,14 @@ async def get_participant(
 
     result = await db.execute(
         select(GameParticipant)
-        .options(
-            selectinload(GameParticipant.user),
-            selectinload(GameParticipant.throws)
-        )
+        .options(*load_profile("participant"))
         .where(GameParticipant.id == participant_id)
     )
     return result.scalars().first()
 
 
 # -------------------------------
-# READ: all by game_id
+# READ: all by game_id (inkl. User, ohne Würfe)
 # -------------------------------
 async def get_participants_by_game(
     db: AsyncSession,
@@ -61,15 +59,18 @@ async def get_participants_by_game(
 
     result = await db.execute(
         select(GameParticipant)
-        .options(
-            selectinload(GameParticipant.user),
-            selectinload(GameParticipant.throws),
-        )
+        .options(*load_profile("participant"))
         .where(GameParticipant.game_id == game_id)
     )
     return result.scalars().unique().all()
 
 
+async def get_participants_page_by_game(db: AsyncSession, game_id: int, limit: int, cursor: Optional[str] = None):
+    """Eine Seite der Teilnehmer eines Spiels inkl. User (Keyset über die id)."""
+    query = select(GameParticipant).options(*load_profile("participant")).where(GameParticipant.game_id == game_id)
+    return await keyset_page(db, query, GameParticipant.id, limit, cursor)
+
+
 # -------------------------------
 # UPDATE: Participant speichern
 # -------------------------------
@@ -83,6 +84,40 @@ async def update_participant(
     await db.refresh(participant)
     return participant
 
+
+def darts_values(state) -> dict:
+    """
+    Den Dart-Puffer nur schreiben, wenn eine Aufnahme abgeschlossen ist (throw_in_turn 0 oder 3)
+    oder seit dem letzten Schreiben eine beendet wurde (`turn_closed`, z. B. Batch über den
+    Turnwechsel hinweg) – nicht bei jedem Dart den ganzen Blob. Die Darts einer offenen Aufnahme
+    stehen in throws und werden beim Laden angehängt (siehe game_state_cache.restore_open_turns).
+    """
+    if state.throw_in_turn not in (0, 3) and not getattr(state, "turn_closed", False):
+        return {}
+    return {"darts": bytes(state.darts or b"")}
+
+
+async def save_participant_state(db: AsyncSession, state, scoreboard=None) -> None:
+    """
+    Schreibt Score + Wurfposition eines Teilnehmers (ohne Commit – Teil der Wurf-Transaktion).
+    `state` ist ein GameParticipant oder ein ParticipantState aus dem Live-Cache,
+    `scoreboard` (optional) sein ScoreboardState – im selben UPDATE.
+    """
+    await db.execute(
+        update(GameParticipant)
+        .where(GameParticipant.id == state.id)
+        .values(
+            current_score=state.current_score,
+            cricket_marks=state.cricket_marks,
+            turn_number=state.turn_number,
+            throw_in_turn=state.throw_in_turn,
+            darts_thrown=state.darts_thrown,
+            **darts_values(state),
+            **scoreboard_crud.entry_values(scoreboard),
+        )
+    )
+
+
 async def get_participant_by_game_and_user(
     db: AsyncSession,
     game_id: int,
@@ -94,7 +129,7 @@ async def get_participant_by_game_and_user(
     """
     result = await db.execute(
         select(GameParticipant)
-        .options(selectinload(GameParticipant.user))
+        .options(*load_profile("participant"))
         .where(GameParticipant.game_id == game_id)
         .where(GameParticipant.user_id == user_id)
     )
@@ -0,0 +1,47 @@
+"""
+Benannte Loader-Profile.
+
+Alle Relationen sind in den Models `lazy="raise_on_sql"` – es wird nichts mehr implizit
+nachgeladen. Wer Relationen braucht, wählt explizit ein Profil:
+
+    select(Game).options(*load_profile("game_list"))
+
+Ein Zugriff auf eine nicht geladene Relation wirft sofort einen Fehler
+(statt still N Queries abzusetzen) – in Tests fällt so jeder unerwartete Lazy-Load auf.
+"""
+from sqlalchemy.orm import raiseload, selectinload
+
+from app.models.game import Game
+from app.models.game_mode import GameMode
+from app.models.game_participant import GameParticipant
+
+PROFILES = {
+    # 🔑 Authentifizierung: nur die Spalten des Users
+    "auth": (raiseload("*"),),
+
+    # 📋 Spiele mit Teilnehmern (Listen, Details):
+    #    Teilnehmer + Usernamen + Modus, KEINE Würfe. Scoreboard und Live-Wurfpfad lesen
+    #    Spalten (get_live_game_rows) und brauchen kein Profil.
+    "game_list": (
+        selectinload(Game.participants).selectinload(GameParticipant.user),
+        selectinload(Game.game_mode),
+    ),
+
+    # 👤 Einzelner Teilnehmer inkl. Username
+    "participant": (selectinload(GameParticipant.user),),
+
+    # 🗑️ GameMode löschen: alles laden, was per Cascade mitgelöscht wird
+    "game_mode_delete": (
+        selectinload(GameMode.games).selectinload(Game.participants).selectinload(GameParticipant.throws),
+        selectinload(GameMode.games).selectinload(Game.throws),
+        selectinload(GameMode.statistics),
+    ),
+}
+
+
+def load_profile(name: str) -> tuple:
+    """Loader-Optionen eines Profils (ValueError bei unbekanntem Namen)."""
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown load profile: {name}") from None
@@ -0,0 +1,56 @@
+"""
+Keyset-Pagination für Listen-Endpunkte.
+
+Statt OFFSET (liest und verwirft alle vorherigen Zeilen) merkt sich der Cursor die id
+der letzten ausgelieferten Zeile:
+
+    WHERE <filter> AND id > :after ORDER BY id LIMIT :limit + 1
+
+Mit einem Index auf (<filter-spalte>, id) ist jede Seite ein kurzer Range-Scan –
+Seite 1 und Seite 1000 kosten gleich viel. Die (limit + 1)-te Zeile zeigt nur an,
+dass es weitergeht; sie wird nicht ausgeliefert.
+
+Der Cursor ist für Clients opak (URL-sicheres Base64 über JSON) und wird unverändert
+als `cursor` zurückgeschickt.
+"""
+import base64
+import binascii
+import json
+from typing import Callable, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def encode_cursor(last_id: int) -> str:
+    raw = json.dumps({"id": last_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str | None) -> int | None:
+    """id der letzten Zeile der vorherigen Seite (ValueError bei ungültigem Cursor)."""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        after = json.loads(raw)["id"]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ValueError("Invalid cursor") from None
+    if not isinstance(after, int) or isinstance(after, bool):
+        raise ValueError("Invalid cursor")
+    return after
+
+
+def page_of(rows: Sequence, limit: int, key: Callable = lambda row: row.id) -> tuple[list, str | None]:
+    """(Seite, next_cursor) aus bis zu limit + 1 aufsteigend sortierten Zeilen."""
+    items = list(rows[:limit])
+    next_cursor = encode_cursor(key(items[-1])) if len(rows) > limit else None
+    return items, next_cursor
+
+
+async def keyset_page(db: AsyncSession, query, column, limit: int, cursor: str | None) -> tuple[list, str | None]:
+    """Eine Seite von `query`, sortiert nach `column` (eindeutig, indiziert – i. d. R. die id)."""
+    after = decode_cursor(cursor)
+    if after is not None:
+        query = query.where(column > after)
+    result = await db.execute(query.order_by(column).limit(limit + 1))
+    return page_of(result.scalars().unique().all(), limit)
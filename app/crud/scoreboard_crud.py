@@ -0,0 +1,21 @@
+# Spalten der Scoreboard-Projektion in game_participants (siehe ScoreboardService.record_dart)
+COLUMNS = (
+    "turn_start_score",
+    "score_last_turn",
+    "dart1_score",
+    "dart2_score",
+    "dart3_score",
+    "turns_completed",
+    "first9_points",
+    "highest_score",
+    "checkout_attempts",
+    "checkouts",
+    "best_leg",
+)
+
+
+def entry_values(entry) -> dict:
+    """Spaltenwerte eines ScoreboardState (Live-Cache) – Teil des UPDATE/INSERT des Teilnehmers."""
+    if entry is None:
+        return {}
+    return {name: getattr(entry, name) for name in COLUMNS}
@@ -1,8 +1,10 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from app.models.statistic import Statistic
+from app.models.statistic_rollup import StatisticRollup
 from app.schemas.statistic_schemas import StatisticCreate
 from typing import Optional
+from datetime import date
 
 
 async def create_statistic(db: AsyncSession, data: StatisticCreate) -> Statistic:
@@ -13,6 +15,30 @@ async def create_statistic(db: AsyncSession, data: StatisticCreate) -> Statistic
     return stat
 
 
-async def get_statistic_by_user(db: AsyncSession, user_id: int) -> Optional[Statistic]:
-    result = await db.execute(select(Statistic).where(Statistic.user_id == user_id))
-    return result.scalars().first()
\ No newline at end of file
+async def get_statistic_by_user(db: AsyncSession, user_id: int, game_mode_id: Optional[int] = None) -> Optional[Statistic]:
+    query = select(Statistic).where(Statistic.user_id == user_id)
+    if game_mode_id is not None:
+        query = query.where(Statistic.game_mode_id == game_mode_id)
+    result = await db.execute(query.order_by(Statistic.id))
+    return result.scalars().first()
+
+
+async def get_rollups(
+    db: AsyncSession,
+    user_id: int,
+    period: str,
+    start: date,
+    end: date,
+    game_mode_id: Optional[int] = None,
+) -> list[StatisticRollup]:
+    """Ein Range-Scan über (user, [modus,] period, bucket_start) – ohne Modus: alle Modi."""
+    query = select(StatisticRollup).where(
+        StatisticRollup.user_id == user_id,
+        StatisticRollup.period == period,
+        StatisticRollup.bucket_start >= start,
+        StatisticRollup.bucket_start <= end,
+    )
+    if game_mode_id is not None:
+        query = query.where(StatisticRollup.game_mode_id == game_mode_id)
+    result = await db.execute(query.order_by(StatisticRollup.bucket_start))
+    return list(result.scalars().all())
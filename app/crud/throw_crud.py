@@ -1,9 +1,10 @@
 from typing import List, Optional
 from datetime import datetime, timezone
-from sqlalchemy import select, desc
+from sqlalchemy import select, desc, insert, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.throw import Throw
+from app.crud.pagination import keyset_page
 
 
 async def create_throw(
@@ -40,6 +41,28 @@ async def create_throw(
     return new_throw
 
 
+async def bulk_create_throws(db: AsyncSession, rows: list[dict]) -> List[Throw]:
+    """
+    Legt viele Throws mit einem einzigen INSERT an (ohne Commit – das macht der Aufrufer).
+    Gibt die ORM-Objekte in derselben Reihenfolge zurück.
+    """
+    if not rows:
+        return []
+    stmt = insert(Throw).returning(Throw, sort_by_parameter_order=True)
+    result = await db.scalars(stmt, rows)
+    return result.all()
+
+
+async def get_open_turn_darts(db: AsyncSession, turns: list[tuple[int, int]]):
+    """(participant_id, value, multiplier) der Würfe in den angegebenen (participant_id, turn_number), in Wurfreihenfolge."""
+    result = await db.execute(
+        select(Throw.participant_id, Throw.value, Throw.multiplier)
+        .where(tuple_(Throw.participant_id, Throw.turn_number).in_(turns))
+        .order_by(Throw.id)
+    )
+    return result.all()
+
+
 async def get_throws_by_game(db: AsyncSession, game_id: int) -> List[Throw]:
     result = await db.execute(
         select(Throw)
@@ -49,6 +72,15 @@ async def get_throws_by_game(db: AsyncSession, game_id: int) -> List[Throw]:
     return result.scalars().all()
 
 
+async def get_throws_page_by_game(db: AsyncSession, game_id: int, limit: int, cursor: Optional[str] = None):
+    """
+    Eine Seite der Würfe eines Spiels in Wurfreihenfolge.
+    Würfe werden in Wurfreihenfolge eingefügt → id-Reihenfolge = Wurfreihenfolge.
+    """
+    query = select(Throw).where(Throw.game_id == game_id)
+    return await keyset_page(db, query, Throw.id, limit, cursor)
+
+
 async def get_throws_for_participant(db: AsyncSession, game_id: int, participant_id: int) -> List[Throw]:
     result = await db.execute(
         select(Throw)
@@ -1,12 +1,15 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from app.models.user import User
+from app.crud.load_profiles import load_profile
+from app.crud.pagination import keyset_page
 from datetime import datetime, UTC
 
 
 
 async def get_user_by_username(db: AsyncSession, username: str):
-    result = await db.execute(select(User).where(User.username == username))
+    # Profil "auth": nur die User-Spalten, keine Spiele/Statistiken/Freundschaften
+    result = await db.execute(select(User).options(*load_profile("auth")).where(User.username == username))
     return result.scalars().first()
 
 
@@ -26,6 +29,17 @@ async def create_user(db: AsyncSession, username: str, email: str, password_hash
     return new_user
 
 
+async def update_password_hash(db: AsyncSession, user: User, password_hash: str) -> None:
+    """Neuer Hash für dasselbe Passwort (z. B. nach Änderung des bcrypt-Kostenfaktors)."""
+    user.password_hash = password_hash
+    await db.commit()
+
+
 async def get_all_users(db: AsyncSession):
     result = await db.execute(select(User))
     return result.scalars().all()
+
+
+async def get_users_page(db: AsyncSession, limit: int, cursor: str | None = None):
+    """Eine Seite aller User (Keyset über die id)."""
+    return await keyset_page(db, select(User).options(*load_profile("auth")), User.id, limit, cursor)
@@ -1,5 +1,8 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from dataclasses import dataclass
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import StaticPool
 from dotenv import load_dotenv
 import os
 
@@ -7,6 +10,10 @@ import os
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+# Optional: Read-Replica (Scoreboards, Statistiken, Spiellisten) und eigene Analytics-DB
+DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
+DATABASE_ANALYTICS_URL = os.getenv("DATABASE_ANALYTICS_URL")
+DB_ECHO = os.getenv("DB_ECHO") == "1"
 
 # 👉 Tests setzen TESTING=1 → dann bauen wir KEIN Postgres-Engine
 TESTING = os.getenv("TESTING") == "1"
@@ -14,18 +21,126 @@ TESTING = os.getenv("TESTING") == "1"
 if not DATABASE_URL and not TESTING:
     raise ValueError("DATABASE_URL is not set in the environment.")
 
-# 2) Engine nur erstellen, wenn wir NICHT im Test laufen
-engine = None
-if not TESTING:
-    engine = create_async_engine(DATABASE_URL, echo=True)
 
+# ---------------------------------------------------------
+# Pool-Profile pro Workload
+# (Override per Env, z. B. DB_INGEST_POOL_SIZE=30, DB_READ_POOL_RECYCLE=900)
+# ---------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class PoolProfile:
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_pre_ping: bool = True
+    pool_recycle: int = 1800          # Sekunden; < Idle-Timeout von Proxy/Postgres
+    pool_timeout: int = 30
+    statement_cache_size: int = 100   # asyncpg Prepared Statements (0 hinter PgBouncer)
+
+
+POOL_PROFILES: dict[str, PoolProfile] = {
+    # 🎯 Würfe schreiben: viele kurze Transaktionen
+    "ingest": PoolProfile(pool_size=20, max_overflow=10, pool_timeout=10),
+    # 📊 Scoreboards, Statistiken, Listen: viele parallele Lesezugriffe
+    "read": PoolProfile(pool_size=10, max_overflow=20),
+    # 🧮 Auswertungen/Exporte: wenige, lange Queries
+    "analytics": PoolProfile(pool_size=2, max_overflow=2, pool_timeout=60, pool_recycle=3600),
+}
+
+
+def pool_profile(workload: str) -> PoolProfile:
+    """Pool-Profil eines Workloads inkl. Env-Overrides (DB_<WORKLOAD>_<FELD>)."""
+    base = POOL_PROFILES.get(workload, PoolProfile())
+    values = {}
+    for name, default in (
+        ("pool_size", base.pool_size),
+        ("max_overflow", base.max_overflow),
+        ("pool_recycle", base.pool_recycle),
+        ("pool_timeout", base.pool_timeout),
+        ("statement_cache_size", base.statement_cache_size),
+    ):
+        raw = os.getenv(f"DB_{workload.upper()}_{name.upper()}")
+        values[name] = int(raw) if raw is not None else default
+    raw = os.getenv(f"DB_{workload.upper()}_POOL_PRE_PING")
+    values["pool_pre_ping"] = raw == "1" if raw is not None else base.pool_pre_ping
+    return PoolProfile(**values)
+
+
+def create_engine_for(url: str, profile: PoolProfile, echo: bool = False) -> AsyncEngine:
+    """
+    Baut eine AsyncEngine mit den Pool-Einstellungen des Profils.
+    SQLite (z. B. als Replica-Ersatz in Tests) bekommt nur die Einstellungen, die es versteht.
+    """
+    parsed = make_url(url)
+    kwargs = {"echo": echo, "pool_pre_ping": profile.pool_pre_ping}
+
+    if parsed.get_backend_name() == "sqlite":
+        if parsed.database in (None, "", ":memory:"):
+            kwargs.update(poolclass=StaticPool, connect_args={"check_same_thread": False})
+            return create_async_engine(url, **kwargs)
+    elif parsed.get_driver_name() == "asyncpg":
+        kwargs["connect_args"] = {"statement_cache_size": profile.statement_cache_size}
+
+    kwargs.update(
+        pool_size=profile.pool_size,
+        max_overflow=profile.max_overflow,
+        pool_recycle=profile.pool_recycle,
+        pool_timeout=profile.pool_timeout,
+    )
+    return create_async_engine(url, **kwargs)
+
+
+class EngineFactory:
+    """
+    Eine Engine + Session-Factory pro Workload:
+    - ingest:    Primary (Schreiben)
+    - read:      Replica, sonst Primary
+    - analytics: Analytics-DB, sonst Replica, sonst Primary
+    Engines werden erst beim ersten Zugriff gebaut.
+    """
+
+    def __init__(self, primary_url: str, replica_url: str | None = None,
+                 analytics_url: str | None = None, echo: bool = False):
+        self.urls = {
+            "ingest": primary_url,
+            "read": replica_url or primary_url,
+            "analytics": analytics_url or replica_url or primary_url,
+        }
+        self.echo = echo
+        self._engines: dict[str, AsyncEngine] = {}
+        self._sessions: dict[str, sessionmaker] = {}
+
+    def engine(self, workload: str = "ingest") -> AsyncEngine:
+        if workload not in self._engines:
+            self._engines[workload] = create_engine_for(self.urls[workload], pool_profile(workload), self.echo)
+        return self._engines[workload]
+
+    def sessionmaker(self, workload: str = "ingest") -> sessionmaker:
+        if workload not in self._sessions:
+            self._sessions[workload] = sessionmaker(
+                bind=self.engine(workload),
+                expire_on_commit=False,
+                class_=AsyncSession,
+            )
+        return self._sessions[workload]
+
+    async def dispose(self) -> None:
+        for engine in self._engines.values():
+            await engine.dispose()
+        self._engines.clear()
+        self._sessions.clear()
+
+
+# 2) Engines nur erstellen, wenn wir NICHT im Test laufen
+engines = None
+engine = None
 AsyncSessionLocal = None
+ReadSessionLocal = None
+AnalyticsSessionLocal = None
 if not TESTING:
-    AsyncSessionLocal = sessionmaker(
-        bind=engine,
-        expire_on_commit=False,
-        class_=AsyncSession,
-    )
+    engines = EngineFactory(DATABASE_URL, DATABASE_REPLICA_URL, DATABASE_ANALYTICS_URL, echo=DB_ECHO)
+    engine = engines.engine("ingest")
+    AsyncSessionLocal = engines.sessionmaker("ingest")
+    ReadSessionLocal = engines.sessionmaker("read")
+    AnalyticsSessionLocal = engines.sessionmaker("analytics")
 
 Base = declarative_base()
 
@@ -41,6 +156,50 @@ async def get_db():
         yield session
 
 
+async def get_read_db():
+    """
+    Lesender DB-Zugriff (Replica, falls DATABASE_REPLICA_URL gesetzt ist).
+    Nur für Endpoints, die nichts schreiben und leicht veraltete Daten vertragen.
+    """
+    if TESTING:
+        raise RuntimeError("get_read_db should be overridden during testing.")
+
+    async with ReadSessionLocal() as session:
+        yield session
+
+
+async def get_analytics_db():
+    """Lange Auswertungen/Exporte mit eigenem, kleinem Pool."""
+    if TESTING:
+        raise RuntimeError("get_analytics_db should be overridden during testing.")
+
+    async with AnalyticsSessionLocal() as session:
+        yield session
+
+
+def get_analytics_session_factory():
+    """
+    Session-Factory statt Session – für StreamingResponses: Dependencies mit yield werden
+    geschlossen, BEVOR der Body gestreamt wird; der Stream öffnet seine Session daher selbst.
+    """
+    if TESTING:
+        raise RuntimeError("get_analytics_session_factory should be overridden during testing.")
+
+    return AnalyticsSessionLocal
+
+
+def get_background_session_factory():
+    """
+    Session-Factory für Hintergrund-Tasks der Lifespan (Statistik-Flush, Bestenlisten).
+    None → keine Hintergrund-Tasks. Tests überschreiben das per dependency_overrides,
+    damit TestClient(app) nicht gegen die globale Engine läuft.
+    """
+    if TESTING:
+        return None
+
+    return AsyncSessionLocal
+
+
 async def init_db():
     """
     Nur für Entwicklung.
@@ -50,4 +209,4 @@ async def init_db():
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
-        await conn.run_sync(Base.metadata.create_all)
\ No newline at end of file
+        await conn.run_sync(Base.metadata.create_all)
@@ -1,6 +1,7 @@
 import sys, os
 sys.path.append(os.path.dirname(__file__))
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse
 
@@ -14,12 +15,48 @@ from app.routes import (
     friendships,
     game_participants,
     game_simulation,
+    metrics,
+    game_ws,
+    leaderboards,
+    imports,
 )
+from app.services.throw_writer import throw_writer
+from app.services.broadcaster import scoreboard_broadcaster
+from app.services.statistics_service import stat_accumulators
+from app.services.leaderboard_service import leaderboards as leaderboard_index
+from app.auth.password_pool import password_pool
+from app.database import engines, get_background_session_factory
+
+
+# ----------- LIFESPAN -----------
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await scoreboard_broadcaster.start()
+    # Hintergrund-Tasks nur mit Session-Factory (Tests: per dependency_overrides abgeschaltet)
+    resolve = app.dependency_overrides.get(get_background_session_factory, get_background_session_factory)
+    session_factory = resolve()
+    # 📈 Statistik-Akkumulatoren periodisch schreiben
+    stat_accumulators.start(session_factory)
+    # 🏆 Bestenlisten aus der statistics-Tabelle aufbauen
+    await leaderboard_index.start(session_factory)
+    yield
+    await leaderboard_index.stop()
+    # 📡 Zuschauer-Streams beenden
+    await scoreboard_broadcaster.close()
+    # 💾 Noch offene Group-Commit-Batches schreiben, bevor der Prozess endet
+    await throw_writer.drain()
+    await stat_accumulators.stop()
+    # 🔐 bcrypt-Threads beenden
+    password_pool.shutdown()
+    if engines is not None:
+        await engines.dispose()
+
 
 # ----------- APP CONFIG -----------
 app = FastAPI(
     title="DartUp API",
     version="1.0.0",
+    lifespan=lifespan,
     description="""
 **DartUp API** – A modern and fully asynchronous backend for managing dart games, players, and statistics.  
 
@@ -44,6 +81,10 @@ app.include_router(statistics.router, prefix="/statistics", tags=["Statistics"])
 app.include_router(friendships.router, prefix="/friendships", tags=["Friendships"])
 app.include_router(game_participants.router, prefix="/participants", tags=["Participants"])
 app.include_router(game_simulation.router, prefix="/game-simulation", tags=["Game Simulation"])
+app.include_router(metrics.router, prefix="/metrics", tags=["Metrics"])
+app.include_router(game_ws.router, prefix="/ws", tags=["Live"])
+app.include_router(leaderboards.router, prefix="/leaderboards", tags=["Leaderboards"])
+app.include_router(imports.router, prefix="/imports", tags=["Imports"])
 
 # ----------- ROOT ENDPOINT -----------
 @app.get("/", tags=["Welcome"])
@@ -5,3 +5,5 @@ from app.models.game_mode import GameMode
 from app.models.game_participant import GameParticipant
 from app.models.friendship import Friendship
 from app.models.statistic import Statistic
+from app.models.statistic_rollup import StatisticRollup
+from app.models.import_job import ImportJob
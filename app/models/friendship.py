@@ -1,10 +1,15 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, func
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, func
 from sqlalchemy.orm import relationship
 from app.database import Base
 
 
 class Friendship(Base):
     __tablename__ = "friendships"
+    # Keyset-Pagination: je ein Range-Scan pro Seite der Freundschaft
+    __table_args__ = (
+        Index("ix_friendships_user_id1_id", "user_id1", "id"),
+        Index("ix_friendships_user_id2_id", "user_id2", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id1 = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -15,5 +20,5 @@ class Friendship(Base):
     accepted_at = Column(DateTime(timezone=True), nullable=True)
 
     # Relationships
-    user1 = relationship("User", foreign_keys=[user_id1], back_populates="friendships_sent")
-    user2 = relationship("User", foreign_keys=[user_id2], back_populates="friendships_received")
\ No newline at end of file
+    user1 = relationship("User", foreign_keys=[user_id1], back_populates="friendships_sent", lazy="raise_on_sql")
+    user2 = relationship("User", foreign_keys=[user_id2], back_populates="friendships_received", lazy="raise_on_sql")
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 from datetime import datetime, UTC
@@ -6,6 +6,8 @@ from datetime import datetime, UTC
 
 class Game(Base):
     __tablename__ = "games"
+    # Keyset-Pagination: Spiele eines Users
+    __table_args__ = (Index("ix_games_user_id_id", "user_id", "id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     game_mode_id = Column(Integer, ForeignKey("game_modes.id"), nullable=False)
@@ -19,13 +21,13 @@ class Game(Base):
     # 🆕 Wer gerade dran ist
     current_turn_user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
 
-    # ---------- Relationships ----------
-    user = relationship("User", back_populates="games", foreign_keys=[user_id], lazy="selectin")
-    game_mode = relationship("GameMode", back_populates="games", lazy="selectin")
+    # ---------- Relationships (laden nur explizit, siehe app/crud/load_profiles.py) ----------
+    user = relationship("User", back_populates="games", foreign_keys=[user_id], lazy="raise_on_sql")
+    game_mode = relationship("GameMode", back_populates="games", lazy="raise_on_sql")
     participants = relationship("GameParticipant", back_populates="game",
-                                cascade="all, delete-orphan", lazy="selectin")
+                                cascade="all, delete-orphan", lazy="raise_on_sql")
     throws = relationship("Throw", back_populates="game",
-                          cascade="all, delete-orphan", lazy="selectin")
+                          cascade="all, delete-orphan", lazy="raise_on_sql")
 
     # 🆕 Relation zum aktiven Spieler
-    current_turn_user = relationship("User", foreign_keys=[current_turn_user_id], lazy="selectin")
\ No newline at end of file
+    current_turn_user = relationship("User", foreign_keys=[current_turn_user_id], lazy="raise_on_sql")
\ No newline at end of file
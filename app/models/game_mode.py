@@ -19,10 +19,12 @@ class GameMode(Base):
     scoring_type = Column(String, nullable=False, default="subtract")
     # "subtract" = X01 (501, 301), "add" = Cricket/Shanghai
     checkout_rule = Column(String, nullable=True)
-    # z. B. "double", "straight", None
+    # z. B. "double", "master", "straight", None
+    checkin_rule = Column(String, nullable=True)
+    # z. B. "double" (Double-In), None = Straight-In
 
     # Relationships
     games = relationship("Game", back_populates="game_mode",
-                         cascade="all, delete-orphan", lazy="selectin")
+                         cascade="all, delete-orphan", lazy="raise_on_sql")
     statistics = relationship("Statistic", back_populates="game_mode",
-                              cascade="all, delete-orphan", lazy="selectin")
\ No newline at end of file
+                              cascade="all, delete-orphan", lazy="raise_on_sql")
\ No newline at end of file
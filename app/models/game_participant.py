@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Index, LargeBinary
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -10,6 +10,8 @@ class GameParticipant(Base):
     Speichert aktuellen Score + Reihenfolge + Timestamps.
     """
     __tablename__ = "game_participants"
+    # Keyset-Pagination: Teilnehmer eines Spiels
+    __table_args__ = (Index("ix_game_participants_game_id_id", "game_id", "id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     game_id = Column(Integer, ForeignKey("games.id"), nullable=False)
@@ -19,10 +21,34 @@ class GameParticipant(Base):
     current_score = Column(Integer, nullable=False)
     finish_order = Column(Integer, nullable=True)
 
+    # Cricket: gepackte Marks + Closed-Maske (siehe CricketEngine)
+    cricket_marks = Column(Integer, nullable=False, default=0)
+
+    # Wurfposition (wird mit jedem Throw in derselben Transaktion fortgeschrieben)
+    turn_number = Column(Integer, nullable=False, default=0)    # aktuelle Aufnahme
+    throw_in_turn = Column(Integer, nullable=False, default=0)  # letzter Dart der Aufnahme (3 = abgeschlossen)
+    darts_thrown = Column(Integer, nullable=False, default=0)   # Darts im Spiel insgesamt
+    # Alle Darts als Feld-Codes, 1 Byte pro Dart + Bust-Marker (siehe app/services/dart_codec.py)
+    darts = Column(LargeBinary, nullable=False, default=b"")
+
+    # 📊 Scoreboard-Projektion (ScoreboardService.record_dart) – in derselben Zeile, damit
+    # sie mit dem UPDATE des Teilnehmers pro Dart geschrieben wird (kein eigenes Statement)
+    turn_start_score = Column(Integer, nullable=True)      # Score vor der aktuellen/letzten Aufnahme (None = noch kein Dart)
+    score_last_turn = Column(Integer, nullable=True)       # Punkte der letzten abgeschlossenen Aufnahme
+    dart1_score = Column(Integer, nullable=True)
+    dart2_score = Column(Integer, nullable=True)
+    dart3_score = Column(Integer, nullable=True)
+    turns_completed = Column(Integer, nullable=False, default=0)
+    first9_points = Column(Integer, nullable=False, default=0)      # Punkte der ersten 3 Aufnahmen
+    highest_score = Column(Integer, nullable=False, default=0)
+    checkout_attempts = Column(Integer, nullable=False, default=0)  # Darts mit möglichem 1-Dart-Finish
+    checkouts = Column(Integer, nullable=False, default=0)
+    best_leg = Column(Integer, nullable=True)                       # wenigste Darts für ein gewonnenes Leg
+
     joined_at = Column(DateTime(timezone=True), server_default=func.now())
     finished_at = Column(DateTime(timezone=True), nullable=True)
 
     # Relationships
-    game = relationship("Game", back_populates="participants", lazy="selectin")
-    user = relationship("User", back_populates="participants", lazy="selectin")
-    throws = relationship("Throw", back_populates="participant", cascade="all, delete-orphan", lazy="selectin")
\ No newline at end of file
+    game = relationship("Game", back_populates="participants", lazy="raise_on_sql")
+    user = relationship("User", back_populates="participants", lazy="raise_on_sql")
+    throws = relationship("Throw", back_populates="participant", cascade="all, delete-orphan", lazy="raise_on_sql")
\ No newline at end of file
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class ImportJob(Base):
+    """
+    Fortschritt eines Match-Imports (siehe app/services/import_service.py).
+    `records_done` wird in derselben Transaktion wie jeder Block hochgezählt –
+    nach einem Abbruch setzt ein erneuter Lauf mit gleichem Namen genau dort wieder auf.
+    """
+    __tablename__ = "import_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, unique=True, nullable=False)
+    format = Column(String(10), nullable=False)                 # "ndjson" | "csv"
+    status = Column(String(10), nullable=False, default="running")   # running | failed | completed
+    records_done = Column(Integer, nullable=False, default=0)   # gelesene Matches (importiert + abgelehnt)
+    matches_imported = Column(Integer, nullable=False, default=0)
+    matches_rejected = Column(Integer, nullable=False, default=0)
+    throws_imported = Column(Integer, nullable=False, default=0)
+    users_created = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
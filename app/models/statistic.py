@@ -1,14 +1,53 @@
-from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, func
+from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, UniqueConstraint, func
 from sqlalchemy.orm import relationship
 from app.database import Base
 
 
-class Statistic(Base):
+class StatisticAccumulatorColumns:
+    """
+    Akkumulator-Spalten (gemeinsam für statistics und statistic_rollups).
+
+    Mittelwerte/Varianzen sind laufende Akkumulatoren (Welford): Anzahl + Mittelwert + M2
+    (Summe der quadrierten Abweichungen). Sie werden per Merge fortgeschrieben, nie aus
+    allen Würfen neu berechnet – siehe StatisticsService.
+    """
+    # 🎯 pro Dart (Rohpunkte value × multiplier)
+    total_throws = Column(Integer, default=0, nullable=False)
+    average_score_per_throw = Column(Float, default=0.0, nullable=False)
+    throw_m2 = Column(Float, default=0.0, nullable=False)
+    highest_score_per_throw = Column(Integer, default=0, nullable=False)
+
+    # 🔁 pro Aufnahme (erzielte Punkte, Bust-Darts zählen nicht)
+    total_turns = Column(Integer, default=0, nullable=False)
+    average_score_per_turn = Column(Float, default=0.0, nullable=False)
+    turn_m2 = Column(Float, default=0.0, nullable=False)
+    highest_score_per_turn = Column(Integer, default=0, nullable=False)
+    total_100s = Column(Integer, default=0, nullable=False)   # 100–139
+    total_140s = Column(Integer, default=0, nullable=False)   # 140–179
+    total_180s = Column(Integer, default=0, nullable=False)
+
+    # ✅ Checkouts (Versuch = Dart auf ein 1-Dart-Finish)
+    checkout_attempts = Column(Integer, default=0, nullable=False)
+    checkouts_hit = Column(Integer, default=0, nullable=False)
+    highest_checkout = Column(Integer, default=0, nullable=False)
+    checkout_percentage = Column(Float, default=0.0, nullable=False)
+
+    @property
+    def throw_variance(self) -> float:
+        return self.throw_m2 / self.total_throws if self.total_throws else 0.0
+
+    @property
+    def turn_variance(self) -> float:
+        return self.turn_m2 / self.total_turns if self.total_turns else 0.0
+
+
+class Statistic(StatisticAccumulatorColumns, Base):
     """
     SQLAlchemy model for statistics table.
-    Stores aggregated user statistics.
+    Stores aggregated user statistics (one row per user and game mode).
     """
     __tablename__ = "statistics"
+    __table_args__ = (UniqueConstraint("user_id", "game_mode_id", name="uq_statistics_user_mode"),)
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -17,15 +56,9 @@ class Statistic(Base):
     games_played = Column(Integer, default=0, nullable=False)
     wins = Column(Integer, default=0, nullable=False)
     losses = Column(Integer, default=0, nullable=False)
-    total_throws = Column(Integer, default=0, nullable=False)
-    average_score_per_throw = Column(Float, default=0.0, nullable=False)
-    highest_score_per_turn = Column(Integer, default=0, nullable=False)
-    total_180s = Column(Integer, default=0, nullable=False)
-    highest_checkout = Column(Integer, default=0, nullable=False)
-    checkout_percentage = Column(Float, default=0.0, nullable=False)
 
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
-    user = relationship("User", back_populates="statistics")
-    game_mode = relationship("GameMode", back_populates="statistics")
\ No newline at end of file
+    user = relationship("User", back_populates="statistics", lazy="raise_on_sql")
+    game_mode = relationship("GameMode", back_populates="statistics", lazy="raise_on_sql")
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, String, Date, ForeignKey, UniqueConstraint
+from app.database import Base
+from app.models.statistic import StatisticAccumulatorColumns
+
+
+class StatisticRollup(StatisticAccumulatorColumns, Base):
+    """
+    Vorverdichtete Statistik pro User, Modus und Zeitraum (Tag / Woche / Monat).
+    Wird beim Statistik-Flush mit denselben Akkumulatoren fortgeschrieben wie `statistics`;
+    Zeitreihen lesen damit nur noch ein paar Dutzend Zeilen statt aller Würfe.
+
+    bucket_start: Tag selbst, Montag der (ISO-)Woche bzw. Monatserster – jeweils UTC.
+    """
+    __tablename__ = "statistic_rollups"
+    __table_args__ = (
+        UniqueConstraint("user_id", "game_mode_id", "period", "bucket_start", name="uq_statistic_rollups_bucket"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    game_mode_id = Column(Integer, ForeignKey("game_modes.id"), nullable=True)
+    period = Column(String(5), nullable=False)   # "day" | "week" | "month"
+    bucket_start = Column(Date, nullable=False)
@@ -1,10 +1,12 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 
 
 class Throw(Base):
     __tablename__ = "throws"
+    # Keyset-Pagination: WHERE game_id = ? AND id > ? ORDER BY id
+    __table_args__ = (Index("ix_throws_game_id_id", "game_id", "id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     game_id = Column(Integer, ForeignKey("games.id"), nullable=False)
@@ -19,5 +21,10 @@ class Throw(Base):
     timestamp = Column(DateTime(timezone=True), nullable=True)
 
     # Relationships
-    game = relationship("Game", back_populates="throws", lazy="selectin")
-    participant = relationship("GameParticipant", back_populates="throws", lazy="selectin")
\ No newline at end of file
+    game = relationship("Game", back_populates="throws", lazy="raise_on_sql")
+    participant = relationship("GameParticipant", back_populates="throws", lazy="raise_on_sql")
+
+    @property
+    def score(self) -> int:
+        """Punkte dieses Darts (value × multiplier), z. B. für ThrowOut."""
+        return self.value * (self.multiplier or 1)
\ No newline at end of file
@@ -13,24 +13,24 @@ class User(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
-    # Relationships
+    # Relationships (laden nur explizit, siehe app/crud/load_profiles.py)
     games = relationship(
         "Game", back_populates="user", cascade="all, delete-orphan",
-        foreign_keys="Game.user_id", lazy="selectin"
+        foreign_keys="Game.user_id", lazy="raise_on_sql"
     )
     statistics = relationship("Statistic", back_populates="user",
-                              cascade="all, delete-orphan", lazy="selectin")
+                              cascade="all, delete-orphan", lazy="raise_on_sql")
     participants = relationship("GameParticipant", back_populates="user",
-                                cascade="all, delete-orphan", lazy="selectin")
+                                cascade="all, delete-orphan", lazy="raise_on_sql")
 
     friendships_sent = relationship(
         "Friendship",
         foreign_keys="Friendship.user_id1",
         back_populates="user1",
-        lazy="selectin"
+        lazy="raise_on_sql"
     )
     friendships_received = relationship(
         "Friendship",
         foreign_keys="Friendship.user_id2",
-        back_populates="user2", lazy="selectin"
+        back_populates="user2", lazy="raise_on_sql"
     )
\ No newline at end of file
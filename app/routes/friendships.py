@@ -1,10 +1,10 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.schemas.friendship_schemas import FriendshipCreate, FriendshipOut
-from app.crud.friendship_crud import create_friendship, get_friendships_for_user
+from app.crud.friendship_crud import create_friendship, get_friendships_page_for_user
+from app.schemas.pagination_schemas import Page, PageParams
 
 router = APIRouter(tags=["Friendships"])
 
@@ -14,6 +14,10 @@ async def add_friendship(data: FriendshipCreate, db: AsyncSession = Depends(get_
     return await create_friendship(db, data)
 
 
-@router.get("/user/{user_id}", response_model=List[FriendshipOut])
-async def read_friendships(user_id: int, db: AsyncSession = Depends(get_db)):
-    return await get_friendships_for_user(db, user_id)
\ No newline at end of file
+@router.get("/user/{user_id}", response_model=Page[FriendshipOut])
+async def read_friendships(user_id: int, page: PageParams = Depends(), db: AsyncSession = Depends(get_read_db)):
+    try:
+        items, next_cursor = await get_friendships_page_for_user(db, user_id, page.limit, page.cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": items, "next_cursor": next_cursor}
\ No newline at end of file
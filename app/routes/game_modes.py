@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models.game_mode import GameMode
 from app.schemas.game_mode_schemas import GameModeCreate, GameModeOut
 from app.crud.game_mode_crud import create_game_mode, get_game_mode, get_all_game_modes
@@ -30,7 +30,7 @@ async def init_default_modes(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/{mode_id}", response_model=GameModeOut)
-async def read_game_mode(mode_id: int, db: AsyncSession = Depends(get_db)):
+async def read_game_mode(mode_id: int, db: AsyncSession = Depends(get_read_db)):
     mode = await get_game_mode(db, mode_id)
     if not mode:
         raise HTTPException(status_code=404, detail="Game mode not found")
@@ -38,5 +38,5 @@ async def read_game_mode(mode_id: int, db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/", response_model=List[GameModeOut])
-async def read_all_modes(db: AsyncSession = Depends(get_db)):
+async def read_all_modes(db: AsyncSession = Depends(get_read_db)):
     return await get_all_game_modes(db)
\ No newline at end of file
@@ -1,14 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.schemas.game_participant_schemas import GameParticipantCreate, GameParticipantOut
 from app.crud.game_participant_crud import (
     create_participant,
     get_participant,
-    get_participants_by_game
+    get_participants_page_by_game
 )
+from app.schemas.pagination_schemas import Page, PageParams
 
 router = APIRouter(tags=["Participants"])
 
@@ -32,7 +32,7 @@ async def add_participant(data: GameParticipantCreate, db: AsyncSession = Depend
 
 
 @router.get("/{participant_id}", response_model=GameParticipantOut)
-async def read_participant(participant_id: int, db: AsyncSession = Depends(get_db)):
+async def read_participant(participant_id: int, db: AsyncSession = Depends(get_read_db)):
     """
     Hole einen einzelnen Teilnehmer inkl. Username.
     """
@@ -52,16 +52,23 @@ async def read_participant(participant_id: int, db: AsyncSession = Depends(get_d
     )
 
 
-@router.get("/game/{game_id}", response_model=List[GameParticipantOut])
-async def read_participants_for_game(game_id: int, db: AsyncSession = Depends(get_db)):
+@router.get("/game/{game_id}", response_model=Page[GameParticipantOut])
+async def read_participants_for_game(
+    game_id: int,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_read_db),
+):
     """
-    Hole alle Teilnehmer eines bestimmten Spiels inkl. Username und Scores.
+    Hole die Teilnehmer eines bestimmten Spiels inkl. Username und Scores (seitenweise).
     """
-    participants = await get_participants_by_game(db, game_id)
-    if not participants:
+    try:
+        participants, next_cursor = await get_participants_page_by_game(db, game_id, page.limit, page.cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not participants and page.cursor is None:
         raise HTTPException(status_code=404, detail="No participants found")
 
-    return [
+    items = [
         GameParticipantOut(
             id=p.id,
             game_id=p.game_id,
@@ -73,4 +80,5 @@ async def read_participants_for_game(game_id: int, db: AsyncSession = Depends(ge
             finished_at=p.finished_at
         )
         for p in participants
-    ]
\ No newline at end of file
+    ]
+    return {"items": items, "next_cursor": next_cursor}
\ No newline at end of file
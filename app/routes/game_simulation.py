@@ -1,15 +1,14 @@
 import random
+from datetime import datetime, UTC
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
 
 from app.database import get_db
-from app.models.game import Game
-from app.models.game_participant import GameParticipant
-from app.models.throw import Throw
-from app.services.turn_service import TurnService
-from app.services.game_engine import GameEngine
+from app.crud import game_crud
+from app.services.game_state_cache import live_games
+from app.services.throw_service import ThrowService
+from app.services.statistics_service import StatsBatch
+from app.services.scoreboard_service import ScoreboardService
 from app.services.throw_validation_service import ValidationService  # ✅ für gültige Würfe
 from app.schemas.game_schemas import GameScoreboardOut
 
@@ -42,104 +41,76 @@ async def simulate_turn(
     Führt danach ggf. Turnwechsel durch und gibt Debug-Infos in der Konsole aus.
     """
 
-    # 🧠 Spiel mit Kontext laden
-    result = await db.execute(
-        select(Game)
-        .options(
-            selectinload(Game.game_mode),
-            selectinload(Game.participants).selectinload(GameParticipant.user),
-            selectinload(Game.participants).selectinload(GameParticipant.throws),
-        )
-        .where(Game.id == game_id)
-    )
-    game = result.scalar_one_or_none()
-    if not game:
+    # 🧠 Spielzustand aus dem Live-Cache (Miss → eine Query)
+    state = await live_games.load(db, game_id)
+    if not state:
         raise HTTPException(status_code=404, detail="Game not found")
 
     # 🧩 Aktuellen Teilnehmer finden
-    current_participant = next(
-        (p for p in game.participants if p.user_id == game.current_turn_user_id),
-        None,
-    )
+    current_participant = state.participant_by_user(state.current_turn_user_id)
     if not current_participant:
         raise HTTPException(status_code=404, detail="Current participant not found")
 
-    print(f"\n🎯 --- Simuliere Turn für {current_participant.user.username} ---")
+    print(f"\n🎯 --- Simuliere Turn für {current_participant.username} ---")
 
-    all_throws = list(current_participant.throws or [])
     debug_log = []  # 👉 Sammeln für schöne Ausgabe
-    result = {"status": "OK"}
-    throw_number_in_turn = 0
-
-    # 🏹 Simuliere bis zu 3 Würfe oder bis BUST/WIN
-    for _ in range(3):
-        turn_number, throw_number_in_turn, _ = TurnService.get_throw_position(all_throws)
-
-        # 🎯 Versuche gezielten Checkout, falls möglich
-        possible_checkout = get_checkout_throw(current_participant.current_score)
-        if possible_checkout:
-            value, multiplier = possible_checkout
-        else:
-            # 🧩 Zufälliger gültiger Wurf (mit Validierung)
-            while True:
-                value = random.choice([1, 5, 12, 16, 19, 20, 25])
-                multiplier = random.choice([1, 2, 3])
-                try:
-                    ValidationService.validate_throw(value, multiplier)
-                    break
-                except ValueError:
-                    continue
-
-        throw = Throw(
-            game_id=game.id,
-            participant_id=current_participant.id,
-            value=value,
-            multiplier=multiplier,
-            turn_number=turn_number,
-            throw_number_in_turn=throw_number_in_turn,
-        )
-        db.add(throw)
-        all_throws.append(throw)
-
-        # 🔢 Spiellogik anwenden
-        old_score = current_participant.current_score
-        result = GameEngine.apply_throw(game, current_participant, throw)
-        new_score = current_participant.current_score
-        status = result["status"]
-
-        debug_log.append(
-            f"🎯 {current_participant.user.username} wirft {value}x{multiplier} = {value * multiplier} "
-            f"Punkte | Score: {old_score} → {new_score} ({status})"
-        )
-
-        if status in ["BUST", "WIN"]:
-            break
-
-    # 🔁 Turnwechsel nur bei Turnende
-    if result["status"] in ["BUST", "WIN"] or throw_number_in_turn == 3:
-        participants = game.participants
-        current_index = participants.index(current_participant)
-        next_index = (current_index + 1) % len(participants)
-        next_participant = participants[next_index]
-        game.current_turn_user_id = next_participant.user_id
-        debug_log.append(f"🔁 Nächster Spieler: {next_participant.user.username}")
-
-    # 🏆 Spiel beenden, falls gewonnen
-    if result["status"] == "WIN":
-        game.status = "finished"
-        debug_log.append(f"🏆 {current_participant.user.username} gewinnt das Spiel!")
+    rows = []
+    stats = StatsBatch()
+    now = datetime.now(UTC)
+
+    async with state.lock:
+        # 🏹 Simuliere bis zu 3 Würfe oder bis BUST/WIN (Turnwechsel macht apply_to_state)
+        for _ in range(3):
+            # 🎯 Versuche gezielten Checkout, falls möglich
+            possible_checkout = get_checkout_throw(current_participant.current_score)
+            if possible_checkout:
+                value, multiplier = possible_checkout
+            else:
+                # 🧩 Zufälliger gültiger Wurf (mit Validierung)
+                while True:
+                    value = random.choice([1, 5, 12, 16, 19, 20, 25])
+                    multiplier = random.choice([1, 2, 3])
+                    try:
+                        ValidationService.validate_throw_values(value, multiplier)
+                        break
+                    except HTTPException:  # ValidationService meldet ungültige Würfe als HTTPException
+                        continue
+
+            # 🔢 Spiellogik anwenden
+            old_score = current_participant.current_score
+            row, result = ThrowService.apply_to_state(state, current_participant, value, multiplier, now, stats)
+            rows.append(row)
+            status = result["status"]
+
+            debug_log.append(
+                f"🎯 {current_participant.username} wirft {value}x{multiplier} = {value * multiplier} "
+                f"Punkte | Score: {old_score} → {current_participant.current_score} ({status})"
+            )
+
+            if current_participant.throw_in_turn == 3:
+                break
+
+        if current_participant.throw_in_turn == 3:
+            debug_log.append(f"🔁 Nächster Spieler: {result['next']}")
+
+        # 🏆 Spiel beenden, falls gewonnen
+        if status == "WIN":
+            state.status = "finished"
+            state.dirty = True
+            debug_log.append(f"🏆 {current_participant.username} gewinnt das Spiel!")
+
+        # 💾 Write-through: Würfe + Scores + Turn-Zeiger in einer Transaktion
+        await ThrowService.write_through(db, [state], [current_participant], rows, stats)
 
     # 📊 Zwischenstand
     debug_log.append("📊 Aktueller Spielstand:")
-    for p in game.participants:
-        debug_log.append(f"  {p.user.username}: {p.current_score} Punkte")
+    for p in state.participants:
+        debug_log.append(f"  {p.username}: {p.current_score} Punkte")
 
     print("\n".join(debug_log))
     print("—" * 60)
 
-    await db.commit()
-    await db.refresh(game)
-    return await get_scoreboard(game.id, db)
+    return ScoreboardService.build(state)
 
 
 @router.post("/{game_id}/simulate-game", response_model=GameScoreboardOut)
@@ -152,20 +123,11 @@ async def simulate_game(
     Gibt alle Aktionen als Debug-Output in der Konsole aus.
     """
 
-    result = await db.execute(
-        select(Game)
-        .options(
-            selectinload(Game.game_mode),
-            selectinload(Game.participants).selectinload(GameParticipant.user),
-            selectinload(Game.participants).selectinload(GameParticipant.throws),
-        )
-        .where(Game.id == game_id)
-    )
-    game = result.scalar_one_or_none()
-    if not game:
+    state = await live_games.load(db, game_id)
+    if not state:
         raise HTTPException(status_code=404, detail="Game not found")
 
-    print(f"\n🎮 --- Starte vollständige Simulation für Spiel {game.id} ---\n")
+    print(f"\n🎮 --- Starte vollständige Simulation für Spiel {game_id} ---\n")
 
     winner = None
     scoreboard = None
@@ -175,19 +137,18 @@ async def simulate_game(
     while not winner and turn_counter < max_turns:
         turn_counter += 1
         print(f"\n🏁 Turn {turn_counter}")
-        scoreboard = await simulate_turn(game.id, db)
+        scoreboard = await simulate_turn(game_id, db)
 
         for p in scoreboard.participants:
             if p.new_score == 0:
                 winner = p.username
-                game.status = "finished"
                 print(f"\n🏆 {winner} gewinnt das Spiel nach {turn_counter} Turns!\n")
                 break
 
     if not winner:
-        game.status = "aborted"
+        state.status = "aborted"
+        await game_crud.save_game_turn(db, game_id, state.current_turn_user_id, state.status)
+        await db.commit()
         print("\n⚠️  Max turn limit reached — Simulation aborted.\n")
 
-    await db.commit()
-    await db.refresh(game)
     return scoreboard
\ No newline at end of file
@@ -0,0 +1,135 @@
+import asyncio
+import json
+
+from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.auth_utils import resolve_principal
+from app.database import get_db, get_read_db
+from app.services.broadcaster import scoreboard_broadcaster
+from app.services.scoreboard_service import ScoreboardService
+from app.services.throw_channel import ThrowChannel
+
+router = APIRouter(tags=["Live"])
+
+# Close-Codes (4000–4999 = anwendungsspezifisch, analog zu HTTP 401/403/404)
+WS_UNAUTHORIZED = 4401
+WS_FORBIDDEN = 4403
+WS_NOT_FOUND = 4404
+WS_TOO_SLOW = 4408
+
+
+async def _authenticate(websocket: WebSocket, db: AsyncSession):
+    """
+    Token aus ?token=…, dem Authorization-Header oder (Browser) der ersten Nachricht
+    {"type": "auth", "token": "…"}. Gibt den Principal (id, username) zurück oder None.
+    """
+    token = websocket.query_params.get("token")
+    header = websocket.headers.get("authorization", "")
+    if not token and header.lower().startswith("bearer "):
+        token = header[7:]
+    if not token:
+        try:
+            first = json.loads(await websocket.receive_text())
+        except ValueError:
+            return None
+        if isinstance(first, dict) and first.get("type") == "auth":
+            token = first.get("token")
+    if not token:
+        return None
+
+    try:
+        return await resolve_principal(db, token)
+    except HTTPException:
+        return None
+
+
+# ---------------------------------------------------------
+# 📡 Persistenter Wurf-Kanal pro Spiel
+# ---------------------------------------------------------
+@router.websocket("/games/{game_id}")
+async def game_channel(
+    websocket: WebSocket,
+    game_id: int,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Einmal authentifizieren, dann Darts streamen:
+    - jede Nachricht = ein Dart, jede Antwort = Engine-Ergebnis (status, remaining, next)
+    - Spielzustand, Teilnehmer und Regeln bleiben für die Verbindung resident
+    - Fehler einzelner Darts kommen als {"type": "error"} zurück, die Verbindung bleibt offen
+    """
+    await websocket.accept()
+
+    user = await _authenticate(websocket, db)
+    if user is None:
+        await websocket.close(code=WS_UNAUTHORIZED, reason="Invalid or expired token")
+        return
+
+    channel = ThrowChannel(game_id, user.id)
+    try:
+        await channel.open(db)
+    except ValueError as e:
+        await websocket.close(code=WS_NOT_FOUND, reason=str(e))
+        return
+    except PermissionError as e:
+        await websocket.close(code=WS_FORBIDDEN, reason=str(e))
+        return
+
+    await websocket.send_json({"type": "ready", "game_id": game_id, "participant_id": channel.participant.id})
+
+    try:
+        while True:
+            try:
+                message = json.loads(await websocket.receive_text())
+            except ValueError:
+                await websocket.send_json({"type": "error", "detail": "Invalid JSON"})
+                continue
+            await websocket.send_json(await channel.handle(db, message))
+    except WebSocketDisconnect:
+        pass
+
+
+# ---------------------------------------------------------
+# 👀 Zuschauer: Scoreboard-Snapshot + Deltas
+# ---------------------------------------------------------
+@router.websocket("/games/{game_id}/spectate")
+async def spectate_game(
+    websocket: WebSocket,
+    game_id: int,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Wie GET /games/{id}/scoreboard/stream, nur als WebSocket:
+    erst {"type": "snapshot"}, danach {"type": "delta"} (gebündelt pro Intervall).
+    Zu langsame Zuschauer werden mit Close-Code 4408 getrennt.
+    """
+    await websocket.accept()
+
+    scoreboard = await ScoreboardService.get_scoreboard(db, game_id, populate=False)
+    if not scoreboard:
+        await websocket.close(code=WS_NOT_FOUND, reason="Game not found")
+        return
+
+    sub = scoreboard_broadcaster.subscribe(game_id, scoreboard.model_dump(mode="json"))
+
+    async def watch_client():
+        # Zuschauer senden nichts – receive() dient nur dazu, ein Trennen sofort zu bemerken
+        try:
+            while (await websocket.receive())["type"] != "websocket.disconnect":
+                pass
+        finally:
+            sub.close()
+
+    watcher = asyncio.create_task(watch_client())
+    try:
+        while (frame := await sub.next()) is not None:
+            await websocket.send_json(frame)
+        if not watcher.done():
+            # None ohne Client-Trennung → Broadcaster hat den Zuschauer als zu langsam getrennt
+            await websocket.close(code=WS_TOO_SLOW, reason="Consumer too slow")
+    except WebSocketDisconnect:
+        pass
+    finally:
+        watcher.cancel()
+        scoreboard_broadcaster.unsubscribe(sub)
@@ -1,14 +1,19 @@
+import json
+
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.auth.auth_utils import get_current_user
-from app.models.user import User
+from app.auth.auth_cache import Principal
 from app.models.game_mode import GameMode
-from app.schemas.game_schemas import GameCreate, GameOut
+from app.schemas.game_schemas import GameCreate, GameOut, GameScoreboardOut
 from app.services.game_service import GameService
-from app.crud.game_crud import get_games_by_user_entity
+from app.services.scoreboard_service import ScoreboardService
+from app.services.broadcaster import scoreboard_broadcaster, Subscription
+from app.crud.game_crud import get_games_page_by_user
+from app.schemas.pagination_schemas import Page, PageParams
 
 router = APIRouter(tags=["Games"])
 
@@ -20,7 +25,7 @@ router = APIRouter(tags=["Games"])
 async def start_new_game(
     data: GameCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Erstellt ein neues Spiel und gibt die initialen Spielinformationen zurück.
@@ -50,8 +55,8 @@ async def start_new_game(
 @router.get("/{game_id}", response_model=GameOut)
 async def read_game(
     game_id: int,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_read_db),
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Lädt ein Spiel inklusive Prüfungen, ob der User teilnehmen darf.
@@ -60,15 +65,73 @@ async def read_game(
     return game   # Nur das Spiel zurückgeben
 
 
+# -------------------------------------------------------------
+# 2b. Scoreboard (Projektion, unabhängig von der Anzahl Würfe)
+# -------------------------------------------------------------
+@router.get("/{game_id}/scoreboard", response_model=GameScoreboardOut)
+async def read_scoreboard(game_id: int, db: AsyncSession = Depends(get_read_db)):
+    """
+    Aktueller Spielstand inkl. Darts der Aufnahme, Averages und Checkout-Vorschlag.
+    Live-Cache-Hit ohne Query, sonst genau eine Query (Replica-Stand wird nicht gecacht).
+    """
+    scoreboard = await ScoreboardService.get_scoreboard(db, game_id, populate=False)
+    if not scoreboard:
+        raise HTTPException(status_code=404, detail="Game not found")
+    return scoreboard
+
+
+# -------------------------------------------------------------
+# 2c. Scoreboard-Stream für Zuschauer (Server-Sent Events)
+# -------------------------------------------------------------
+SSE_KEEPALIVE_SECONDS = 15
+
+
+async def _sse_frames(sub: Subscription):
+    try:
+        while True:
+            try:
+                frame = await sub.next(timeout=SSE_KEEPALIVE_SECONDS)
+            except TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if frame is None:  # zu langsam → vom Broadcaster getrennt
+                break
+            yield f"event: {frame['type']}\nid: {frame['seq']}\ndata: {json.dumps(frame)}\n\n"
+    finally:
+        scoreboard_broadcaster.unsubscribe(sub)
+
+
+@router.get("/{game_id}/scoreboard/stream")
+async def stream_scoreboard(game_id: int, db: AsyncSession = Depends(get_read_db)):
+    """
+    Erst ein vollständiger Snapshot, danach nur noch Deltas (höchstens ein Frame pro Intervall).
+    Statt GET /scoreboard zu pollen: EventSource("/games/{id}/scoreboard/stream").
+    """
+    scoreboard = await ScoreboardService.get_scoreboard(db, game_id, populate=False)
+    if not scoreboard:
+        raise HTTPException(status_code=404, detail="Game not found")
+
+    sub = scoreboard_broadcaster.subscribe(game_id, scoreboard.model_dump(mode="json"))
+    return StreamingResponse(
+        _sse_frames(sub),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # -------------------------------------------------------------
 # 3. Spiele eines Users
 # -------------------------------------------------------------
-@router.get("/user/{user_id}", response_model=List[GameOut])
-async def read_games_by_user(user_id: int, db: AsyncSession = Depends(get_db)):
+@router.get("/user/{user_id}", response_model=Page[GameOut])
+async def read_games_by_user(user_id: int, page: PageParams = Depends(), db: AsyncSession = Depends(get_read_db)):
     """
-    Liste aller Spiele eines Users.
+    Spiele eines Users, seitenweise.
     """
-    return await get_games_by_user_entity(db, user_id)
+    try:
+        items, next_cursor = await get_games_page_by_user(db, user_id, page.limit, page.cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": items, "next_cursor": next_cursor}
 
 
 # -------------------------------------------------------------
@@ -78,7 +141,7 @@ async def read_games_by_user(user_id: int, db: AsyncSession = Depends(get_db)):
 async def finish_game_endpoint(
     game_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Endet ein Spiel (setzt Status + Endzeit).
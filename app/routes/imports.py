@@ -0,0 +1,62 @@
+import io
+import tempfile
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.auth_utils import get_current_user
+from app.auth.auth_cache import Principal
+from app.database import get_db
+from app.schemas.import_schemas import ImportFormat, ImportSummaryOut
+from app.services.import_service import ImportService, summary
+
+router = APIRouter(tags=["Imports"])
+
+# Uploads bis zu dieser Größe bleiben im Speicher, größere werden auf Platte gepuffert
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+
+# ---------------------------------------------------------
+# 📥 1. Match-Datei importieren
+# ---------------------------------------------------------
+@router.post("/matches", response_model=ImportSummaryOut)
+async def import_matches(
+    request: Request,
+    name: str = Query(..., min_length=1, max_length=200),
+    format: ImportFormat = "ndjson",
+    chunk_size: int = Query(200, ge=1, le=10_000),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    """
+    Importiert historische Matches aus dem Request-Body (NDJSON oder CSV, siehe import_service).
+    Der Body wird gepuffert und blockweise geladen; ein erneuter Aufruf mit gleichem `name`
+    setzt einen abgebrochenen Import fort. Große Dateien besser per
+    `python -m app.scripts.import_matches`.
+    """
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES) as spool:
+        async for chunk in request.stream():
+            spool.write(chunk)
+        spool.seek(0)
+        lines = io.TextIOWrapper(spool, encoding="utf-8", newline="")
+        try:
+            return await ImportService.run(db, lines, format, name, chunk_size)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        finally:
+            lines.detach()
+
+
+# ---------------------------------------------------------
+# 📋 2. Status eines Imports
+# ---------------------------------------------------------
+@router.get("/{name}", response_model=ImportSummaryOut)
+async def read_import(
+    name: str,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    job = await ImportService.get_job(db, name)
+    if not job:
+        raise HTTPException(status_code=404, detail="Import not found")
+    return summary(job)
@@ -0,0 +1,64 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.database import get_read_db
+from app.models.user import User
+from app.schemas.leaderboard_schemas import LeaderboardMetric, LeaderboardOut, LeaderboardRankOut
+from app.services.leaderboard_service import leaderboards
+
+router = APIRouter(tags=["Leaderboards"])
+
+
+# ---------------------------------------------------------
+# 🏆 Seite einer Bestenliste
+# ---------------------------------------------------------
+@router.get("/{metric}", response_model=LeaderboardOut)
+async def read_leaderboard(
+    metric: LeaderboardMetric,
+    game_mode_id: int | None = None,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Bestenliste nach Siegen, 3-Dart-Average oder höchstem Checkout – ohne game_mode_id über alle Modi.
+    Liest aus dem In-Memory-Index; nur die Usernamen der Seite kommen aus der DB.
+    """
+    board = leaderboards.board(metric, game_mode_id)
+    page = board.page(offset, limit)
+
+    names = {}
+    if page:
+        result = await db.execute(select(User.id, User.username).where(User.id.in_([u for _, u, _ in page])))
+        names = dict(result.all())
+
+    return {
+        "metric": metric,
+        "game_mode_id": game_mode_id,
+        "total": len(board),
+        "offset": offset,
+        "entries": [
+            {"rank": rank, "user_id": user_id, "username": names.get(user_id), "value": value}
+            for rank, user_id, value in page
+        ],
+    }
+
+
+# ---------------------------------------------------------
+# 🔎 Rang eines Users
+# ---------------------------------------------------------
+@router.get("/{metric}/users/{user_id}", response_model=LeaderboardRankOut)
+async def read_leaderboard_rank(metric: LeaderboardMetric, user_id: int, game_mode_id: int | None = None):
+    board = leaderboards.board(metric, game_mode_id)
+    rank = board.rank(user_id)
+    if rank is None:
+        raise HTTPException(status_code=404, detail="User not ranked")
+    return {
+        "metric": metric,
+        "game_mode_id": game_mode_id,
+        "user_id": user_id,
+        "rank": rank,
+        "value": board.values[user_id],
+        "total": len(board),
+    }
@@ -0,0 +1,98 @@
+from fastapi import APIRouter
+
+from app.services.game_state_cache import live_games
+from app.services.throw_writer import throw_writer
+from app.services.broadcaster import scoreboard_broadcaster
+from app.services.statistics_service import stat_accumulators
+from app.services.leaderboard_service import leaderboards
+from app.services.export_service import export_metrics
+from app.auth.auth_cache import auth_cache_stats
+from app.auth.password_pool import password_pool
+
+router = APIRouter(tags=["Metrics"])
+
+
+# ---------------------------------------------------------
+# 🧠 Live-Game-Cache (Größe, Hit-Rate, Verdrängungen)
+# ---------------------------------------------------------
+@router.get("/live-games")
+async def live_game_cache_metrics():
+    """
+    Zähler des prozess-lokalen Spielzustand-Caches – zum Dimensionieren
+    von LIVE_GAME_CACHE_SIZE / LIVE_GAME_CACHE_TTL.
+    """
+    return live_games.stats()
+
+
+# ---------------------------------------------------------
+# 💾 Group-Commit der Würfe (Batch-Größe, Flush-Latenz)
+# ---------------------------------------------------------
+@router.get("/throw-writer")
+async def throw_writer_metrics():
+    """
+    Zähler des ThrowWriteBatcher: Batches, Darts pro Batch und Flush-Dauer in ms.
+    """
+    return throw_writer.stats()
+
+
+# ---------------------------------------------------------
+# 📡 Zuschauer-Fan-out (Abonnenten, Frames, verworfene Frames)
+# ---------------------------------------------------------
+@router.get("/broadcaster")
+async def broadcaster_metrics():
+    """
+    Zähler des ScoreboardBroadcaster: Zuschauer pro Spiel, verteilte und
+    (bei langsamen Zuschauern) verworfene Frames.
+    """
+    return scoreboard_broadcaster.stats()
+
+
+# ---------------------------------------------------------
+# 📈 Statistik-Akkumulatoren (ausstehend, Flushes)
+# ---------------------------------------------------------
+@router.get("/statistics")
+async def statistics_metrics():
+    """
+    Ausstehende (User, Modus)-Akkumulatoren und Flush-Zähler.
+    """
+    return stat_accumulators.stats()
+
+
+# ---------------------------------------------------------
+# 🏆 Bestenlisten (Listen, Spieler, Updates, Neuaufbauten)
+# ---------------------------------------------------------
+@router.get("/leaderboards")
+async def leaderboard_metrics():
+    return leaderboards.stats()
+
+
+# ---------------------------------------------------------
+# 📦 Wurf-Exporte (Zeilen, Zeilen/s des letzten Exports)
+# ---------------------------------------------------------
+@router.get("/exports")
+async def exports_metrics():
+    return export_metrics.stats()
+
+
+# ---------------------------------------------------------
+# 🔑 Auth-Caches (geprüfte Tokens, Principals)
+# ---------------------------------------------------------
+@router.get("/auth")
+async def auth_metrics():
+    """
+    Hit-Raten der Token- und Principal-Caches – zum Dimensionieren von
+    AUTH_TOKEN_CACHE_* / AUTH_PRINCIPAL_CACHE_*.
+    """
+    return auth_cache_stats()
+
+
+# ---------------------------------------------------------
+# 🔐 bcrypt-Pool (Warteschlange, Wartezeit, abgewiesene Jobs)
+# ---------------------------------------------------------
+@router.get("/passwords")
+async def password_pool_metrics():
+    """
+    Tiefe der bcrypt-Warteschlange und Warte-/Rechenzeiten – zum Dimensionieren
+    von BCRYPT_WORKERS / BCRYPT_MAX_PENDING.
+    """
+    return password_pool.stats()
@@ -1,9 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
-from app.schemas.statistic_schemas import StatisticCreate, StatisticOut
+from app.database import get_db, get_read_db
+from app.schemas.statistic_schemas import StatisticCreate, StatisticOut, StatisticTimeseriesOut
 from app.crud.statistic_crud import create_statistic, get_statistic_by_user
+from app.services.statistics_service import StatisticsService
 
 router = APIRouter(tags=["Statistics"])
 
@@ -14,8 +17,24 @@ async def add_statistic(data: StatisticCreate, db: AsyncSession = Depends(get_db
 
 
 @router.get("/user/{user_id}", response_model=StatisticOut)
-async def read_user_statistic(user_id: int, db: AsyncSession = Depends(get_db)):
-    stat = await get_statistic_by_user(db, user_id)
+async def read_user_statistic(user_id: int, game_mode_id: int | None = None, db: AsyncSession = Depends(get_read_db)):
+    stat = await get_statistic_by_user(db, user_id, game_mode_id)
     if not stat:
         raise HTTPException(status_code=404, detail="Statistics not found")
-    return stat
\ No newline at end of file
+    return stat
+
+
+@router.get("/user/{user_id}/timeseries", response_model=StatisticTimeseriesOut)
+async def read_user_timeseries(
+    user_id: int,
+    game_mode_id: int | None = None,
+    period: Literal["day", "week", "month"] = "day",
+    buckets: int = Query(30, ge=1, le=366),
+    window: int = Query(7, ge=1, le=90),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Zeitreihe aus den vorverdichteten Rollups (statistic_rollups) – ohne game_mode_id über alle Modi.
+    Pro Zeitraum: Ø pro Aufnahme, 180er, Checkout-%; dazu rollende Fenster über `window` Zeiträume.
+    """
+    return await StatisticsService.timeseries(db, user_id, game_mode_id, period, buckets, window)
@@ -1,9 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
-from app.schemas.throw_schemas import ThrowCreate, ThrowResponse
+from app.auth.auth_utils import get_current_user
+from app.auth.auth_cache import Principal
+from app.database import get_db, get_read_db, get_analytics_session_factory
+from app.schemas.throw_schemas import ThrowCreate, ThrowBatchCreate, ThrowResponse, ThrowOut
+from app.schemas.pagination_schemas import Page, PageParams
+from app.crud.throw_crud import get_throws_page_by_game
 from app.services.throw_service import ThrowService
+from app.services.export_service import ExportService, ExportFilter, ExportRun, FORMATS
 
 router = APIRouter(tags=["Throws"])
 
@@ -25,7 +34,10 @@ async def add_throw(
     - Nächsten Spieler bestimmen
     - API-Response zurückgeben
     """
-    result = await ThrowService.process_throw(db, data)
+    try:
+        result = await ThrowService.process_throw(db, data)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
 
     if result is None:
         raise HTTPException(status_code=400, detail="Invalid throw input")
@@ -34,20 +46,81 @@ async def add_throw(
 
 
 # ---------------------------------------------------------
-# 📜 2. Alle Würfe eines Spiels abrufen
+# 🎯🎯🎯 2. Mehrere Würfe auf einmal (z. B. E-Dartboard)
+# ---------------------------------------------------------
+@router.post("/batch", response_model=list[ThrowResponse])
+async def add_throw_batch(
+    data: ThrowBatchCreate,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Führt eine komplette Aufnahme (oder mehrere, auch über mehrere Spiele) aus:
+    - alle Würfe validieren
+    - GameEngine im Speicher anwenden
+    - alles in EINER Transaktion per Bulk-Insert speichern
+    - Ergebnis pro Dart im ThrowResponse-Format zurückgeben
+    """
+    try:
+        return await ThrowService.process_throw_batch(db, data)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+# ---------------------------------------------------------
+# 📦 3. Export der Wurf-Historie (Streaming, NDJSON/CSV)
 # ---------------------------------------------------------
-@router.get("/game/{game_id}", response_model=list[ThrowResponse])
+@router.get("/export")
+async def export_throws(
+    format: Literal["ndjson", "csv"] = "ndjson",
+    game_id: int | None = None,
+    user_id: int | None = None,
+    game_mode_id: int | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    chunk_size: int = Query(5000, ge=100, le=50_000),
+    session_factory=Depends(get_analytics_session_factory),
+    current_user: Principal = Depends(get_current_user),
+):
+    """
+    Streamt alle passenden Würfe (sortiert nach id) als NDJSON oder CSV – nur aus Spielen,
+    an denen der angemeldete User teilnimmt (alle Spiele: `python -m app.scripts.export_throws`).
+    Liest blockweise über einen serverseitigen Cursor der Analytics-DB – der Speicherbedarf
+    hängt nur von chunk_size ab, nicht von der Anzahl Würfe. Zeilen/s: GET /metrics/exports.
+    """
+    filters = ExportFilter(game_id, user_id, game_mode_id, since, until, member_id=current_user.id)
+
+    async def body():
+        async with session_factory() as db:
+            async for chunk in ExportService.stream(db, filters, format, chunk_size, ExportRun(format)):
+                yield chunk
+
+    extension = "ndjson" if format == "ndjson" else "csv"
+    return StreamingResponse(
+        body(),
+        media_type=FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="throws.{extension}"'},
+    )
+
+
+# ---------------------------------------------------------
+# 📜 4. Alle Würfe eines Spiels abrufen
+# ---------------------------------------------------------
+@router.get("/game/{game_id}", response_model=Page[ThrowOut])
 async def get_throws_for_game(
     game_id: int,
-    db: AsyncSession = Depends(get_db)
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
-    Gibt alle gespeicherten Würfe für ein Game zurück.
+    Gibt die gespeicherten Würfe eines Games seitenweise in Wurfreihenfolge zurück.
     (ohne Spiellogik)
     """
-    throws = await ThrowService.list_throws_for_game(db, game_id)
+    try:
+        throws, next_cursor = await get_throws_page_by_game(db, game_id, page.limit, page.cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    if not throws:
+    if not throws and page.cursor is None:
         raise HTTPException(status_code=404, detail="No throws found")
 
-    return throws
\ No newline at end of file
+    return {"items": throws, "next_cursor": next_cursor}
\ No newline at end of file
@@ -1,14 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
 from datetime import timedelta
 
 from app.models.user import User
 from app.schemas.user_schemas import UserCreate, UserOut, UserLogin
-from app.auth.auth_utils import hash_password, verify_password, get_current_user
+from app.auth.auth_utils import hash_password_async, verify_password_async, get_current_user
+from app.auth.password_pool import PasswordPoolBusy
+from app.auth.auth_cache import Principal
 from app.auth.jwt_handler import create_access_token, ACCESS_TOKEN_EXPIRE_MINUTES
-from app.database import get_db
-from app.crud.user_crud import get_user_by_username, create_user, get_all_users
+from app.database import get_db, get_read_db
+from app.crud.user_crud import get_user_by_username, create_user, get_users_page, update_password_hash
+from app.schemas.pagination_schemas import Page, PageParams
 
 router = APIRouter(tags=["Users"])
 
@@ -22,7 +24,10 @@ async def register(user: UserCreate, db: AsyncSession = Depends(get_db)):
     if existing_user:
         raise HTTPException(status_code=400, detail="Username already exists")
 
-    hashed_pw = hash_password(user.password)
+    try:
+        hashed_pw = await hash_password_async(user.password)
+    except PasswordPoolBusy:
+        raise HTTPException(status_code=503, detail="Too many password operations, retry shortly", headers={"Retry-After": "1"})
     new_user = await create_user(db, user.username, user.email, hashed_pw)
     return new_user
 
@@ -38,16 +43,17 @@ async def login(login_data: UserLogin, db: AsyncSession = Depends(get_db)):
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
 
-    # Debug-Ausgaben
-    print("👉 Eingabe-PW:", login_data.password)
-    print("👉 Hash aus DB:", user.password_hash)
-
-    # Passwort prüfen
-    if not verify_password(login_data.password, user.password_hash):
-        print("❌ Passwortprüfung fehlgeschlagen")
+    # Passwort prüfen (bcrypt im password_pool, nicht im Event-Loop)
+    try:
+        valid, new_hash = await verify_password_async(login_data.password, user.password_hash)
+    except PasswordPoolBusy:
+        raise HTTPException(status_code=503, detail="Too many password operations, retry shortly", headers={"Retry-After": "1"})
+    if not valid:
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
-    print("✅ Passwortprüfung erfolgreich")
+    # 🔁 Kostenfaktor geändert (BCRYPT_ROUNDS) → Hash transparent erneuern
+    if new_hash:
+        await update_password_hash(db, user, new_hash)
 
     # Token erstellen
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -59,17 +65,24 @@ async def login(login_data: UserLogin, db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/me", response_model=UserOut)
-async def get_my_profile(current_user: User = Depends(get_current_user)):
+async def get_my_profile(current_user: Principal = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
     """
-    Gibt das Profil des eingeloggten Users zurück.
+    Gibt das Profil des eingeloggten Users zurück (Authentifizierung aus dem Cache, Profil frisch aus der DB).
     """
-    return UserOut.model_validate(current_user)
+    user = await get_user_by_username(db, current_user.username)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    return UserOut.model_validate(user)
 
 
-@router.get("/", response_model=List[UserOut])
-async def get_all_users_endpoint(db: AsyncSession = Depends(get_db)):
+@router.get("/", response_model=Page[UserOut])
+async def get_all_users_endpoint(page: PageParams = Depends(), db: AsyncSession = Depends(get_read_db)):
     """
-    Gibt alle User zurück (ohne Passwörter).
+    Gibt die User seitenweise zurück (ohne Passwörter).
     """
-    return await get_all_users(db)
+    try:
+        items, next_cursor = await get_users_page(db, page.limit, page.cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": items, "next_cursor": next_cursor}
 
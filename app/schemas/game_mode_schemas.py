@@ -7,7 +7,8 @@ class GameModeBase(BaseModel):
     description: Optional[str] = None
     starting_score: Optional[int] = None
     scoring_type: str  # "subtract" oder "add"
-    checkout_rule: Optional[str] = None  # "double", "straight", None
+    checkout_rule: Optional[str] = None  # "double", "master", "straight", None
+    checkin_rule: Optional[str] = None  # "double", "master", None
 
 
 class GameModeCreate(GameModeBase):
@@ -0,0 +1,25 @@
+from pydantic import BaseModel
+from typing import Literal, Optional
+
+
+ImportFormat = Literal["ndjson", "csv"]
+
+
+class RejectedMatch(BaseModel):
+    record: int
+    external_id: Optional[str] = None
+    reason: str
+
+
+class ImportSummaryOut(BaseModel):
+    name: str
+    format: ImportFormat
+    status: Literal["running", "failed", "completed"]
+    records_done: int
+    matches_imported: int
+    matches_rejected: int
+    throws_imported: int
+    users_created: int
+    error: Optional[str] = None
+    rejected: list[RejectedMatch] = []
+    seconds: float = 0.0
@@ -0,0 +1,29 @@
+from pydantic import BaseModel
+from typing import Literal, Optional
+
+
+LeaderboardMetric = Literal["wins", "average", "highest_checkout"]
+
+
+class LeaderboardEntry(BaseModel):
+    rank: int
+    user_id: int
+    username: Optional[str] = None
+    value: float
+
+
+class LeaderboardOut(BaseModel):
+    metric: LeaderboardMetric
+    game_mode_id: Optional[int]
+    total: int
+    offset: int
+    entries: list[LeaderboardEntry]
+
+
+class LeaderboardRankOut(BaseModel):
+    metric: LeaderboardMetric
+    game_mode_id: Optional[int]
+    user_id: int
+    rank: int
+    value: float
+    total: int
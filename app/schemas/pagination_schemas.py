@@ -0,0 +1,24 @@
+from pydantic import BaseModel
+from typing import Generic, List, Optional, TypeVar
+
+from fastapi import Query
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """Eine Seite einer Liste; next_cursor = None → letzte Seite."""
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+
+class PageParams:
+    """Einheitlicher limit/cursor-Vertrag aller Listen-Endpunkte (als Dependency)."""
+
+    def __init__(
+        self,
+        limit: int = Query(50, ge=1, le=200, description="Maximale Anzahl Einträge pro Seite"),
+        cursor: Optional[str] = Query(None, description="next_cursor der vorherigen Seite"),
+    ):
+        self.limit = limit
+        self.cursor = cursor
@@ -1,6 +1,6 @@
 from pydantic import BaseModel
-from typing import Optional
-from datetime import datetime
+from typing import Literal, Optional
+from datetime import date, datetime
 
 
 class StatisticBase(BaseModel):
@@ -9,8 +9,15 @@ class StatisticBase(BaseModel):
     losses: int = 0
     total_throws: int = 0
     average_score_per_throw: float = 0.0
+    highest_score_per_throw: int = 0
+    total_turns: int = 0
+    average_score_per_turn: float = 0.0
     highest_score_per_turn: int = 0
+    total_100s: int = 0
+    total_140s: int = 0
     total_180s: int = 0
+    checkout_attempts: int = 0
+    checkouts_hit: int = 0
     highest_checkout: int = 0
     checkout_percentage: float = 0.0
 
@@ -24,7 +31,33 @@ class StatisticOut(StatisticBase):
     id: int
     user_id: int
     game_mode_id: Optional[int]
+    throw_variance: float = 0.0
+    turn_variance: float = 0.0
     updated_at: datetime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class TimeseriesPoint(BaseModel):
+    bucket_start: date
+    # Werte des Zeitraums selbst
+    throws: int = 0
+    turns: int = 0
+    average_score_per_turn: float = 0.0
+    total_180s: int = 0
+    checkout_attempts: int = 0
+    checkouts_hit: int = 0
+    checkout_percentage: float = 0.0
+    # Rollendes Fenster über die letzten `window` Zeiträume (inkl. diesem)
+    rolling_average_score_per_turn: float = 0.0
+    rolling_checkout_percentage: float = 0.0
+    rolling_180s: int = 0
+
+
+class StatisticTimeseriesOut(BaseModel):
+    user_id: int
+    game_mode_id: Optional[int]
+    period: Literal["day", "week", "month"]
+    window: int
+    points: list[TimeseriesPoint]
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
 
 
 # ---------- Basis ----------
@@ -14,6 +14,14 @@ class ThrowCreate(ThrowBase):
     participant_id: int
 
 
+class ThrowBatchCreate(BaseModel):
+    """
+    Mehrere Würfe auf einmal (z. B. eine komplette Aufnahme eines E-Dartboards).
+    Darf Würfe aus mehreren Spielen enthalten; Reihenfolge = Wurfreihenfolge.
+    """
+    throws: List[ThrowCreate] = Field(..., min_length=1, max_length=300)
+
+
 # ---------- Ausgabe ----------
 class ThrowOut(ThrowBase):
     id: int
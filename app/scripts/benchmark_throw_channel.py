@@ -0,0 +1,141 @@
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+"""
+Benchmark: Darts über HTTP (POST /throws/) vs. WebSocket-Kanal (/ws/games/{id}).
+1.	Legt eine eigene Benchmark-DB an (Default: temporäre SQLite-Datei, NIE die DATABASE_URL aus .env).
+2.	Startet die App in-process (Starlette TestClient) – beide Pfade laufen durch denselben Stack.
+3.	Sendet N Darts sequentiell pro Pfad und misst pro Dart die Round-Trip-Zeit.
+4.	Gibt Durchsatz (Darts/s) sowie p50/p99 in ms aus.
+
+Beispiel:
+    python -m app.scripts.benchmark_throw_channel --darts 2000
+    python -m app.scripts.benchmark_throw_channel --url postgresql+asyncpg://…/dartup_bench
+"""
+
+# Riesiger Startscore + 1er-Darts → das Leg endet während des Benchmarks nicht
+BENCH_STARTING_SCORE = 10_000_000
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(name: str, samples: list[float], duration: float) -> dict:
+    stats = {
+        "path": name,
+        "darts": len(samples),
+        "throughput": round(len(samples) / duration, 1),
+        "p50_ms": round(percentile(samples, 50) * 1000, 3),
+        "p99_ms": round(percentile(samples, 99) * 1000, 3),
+        "mean_ms": round(statistics.fmean(samples) * 1000, 3),
+    }
+    print(
+        f"  {name:<5} {stats['throughput']:>9.1f} Darts/s   "
+        f"p50 {stats['p50_ms']:>7.3f} ms   p99 {stats['p99_ms']:>7.3f} ms"
+    )
+    return stats
+
+
+async def _prepare(engines, Base) -> dict:
+    """Schema + User + Modus + ein Spiel je Pfad (damit sich die Pfade nicht gegenseitig beeinflussen)."""
+    from app.crud.user_crud import create_user
+    from app.crud.game_mode_crud import create_game_mode
+    from app.schemas.game_mode_schemas import GameModeCreate
+    from app.services.game_service import GameService
+
+    async with engines.engine().begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with engines.sessionmaker()() as db:
+        user = await create_user(db, username="bench", email="bench@example.com", password_hash="x")
+        mode = await create_game_mode(
+            db,
+            GameModeCreate(name="Benchmark", starting_score=BENCH_STARTING_SCORE, scoring_type="subtract"),
+        )
+        games = {}
+        for path in ("http", "ws"):
+            game = await GameService.start_game(
+                db=db, host=user, game_mode=mode, opponent_ids=[], first_to=None, first_shot=user.id
+            )
+            games[path] = (game.id, game.participants[0].id)
+    return games
+
+
+def benchmark(num_darts: int = 1000, warmup: int = 50, url: str | None = None) -> dict:
+    """Misst beide Pfade nacheinander und gibt die Kennzahlen zurück."""
+    tmpdir = None
+    if url is None:
+        tmpdir = tempfile.TemporaryDirectory()
+        url = f"sqlite+aiosqlite:///{os.path.join(tmpdir.name, 'bench.db')}"
+    # Vor dem Import der App setzen: app.database baut die Engines beim Import
+    os.environ["DATABASE_URL"] = url
+    os.environ.pop("TESTING", None)
+
+    from starlette.testclient import TestClient
+    from app.auth.jwt_handler import create_access_token
+    from app.database import Base, engines
+    from app.main import app
+
+    games = asyncio.run(_prepare(engines, Base))
+    asyncio.run(engines.dispose())  # Pools gehören zum Loop von asyncio.run → im App-Loop neu aufbauen
+    token = create_access_token({"sub": "bench"})
+
+    results = {}
+    with TestClient(app) as client:
+        # 🌐 HTTP: pro Dart ein Request
+        game_id, participant_id = games["http"]
+        payload = {"value": 1, "multiplier": 1, "game_id": game_id, "participant_id": participant_id}
+        for _ in range(warmup):
+            client.post("/throws/", json=payload)
+        samples = []
+        started = time.perf_counter()
+        for _ in range(num_darts):
+            t0 = time.perf_counter()
+            response = client.post("/throws/", json=payload)
+            samples.append(time.perf_counter() - t0)
+            response.raise_for_status()
+        results["http"] = summarize("HTTP", samples, time.perf_counter() - started)
+
+        # 📡 WebSocket: einmal verbinden + authentifizieren, dann Darts streamen
+        game_id, _ = games["ws"]
+        with client.websocket_connect(f"/ws/games/{game_id}?token={token}") as ws:
+            ws.receive_json()  # ready
+            for _ in range(warmup):
+                ws.send_json({"value": 1, "multiplier": 1})
+                ws.receive_json()
+            samples = []
+            started = time.perf_counter()
+            for seq in range(num_darts):
+                t0 = time.perf_counter()
+                ws.send_json({"value": 1, "multiplier": 1, "seq": seq})
+                reply = ws.receive_json()
+                samples.append(time.perf_counter() - t0)
+                if reply["type"] != "result":
+                    raise RuntimeError(f"WebSocket-Dart fehlgeschlagen: {reply}")
+            results["ws"] = summarize("WS", samples, time.perf_counter() - started)
+
+    speedup = results["ws"]["throughput"] / results["http"]["throughput"]
+    print(f"\n  WS/HTTP Durchsatz: {speedup:.2f}×")
+    results["speedup"] = round(speedup, 2)
+
+    if tmpdir is not None:
+        tmpdir.cleanup()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HTTP vs. WebSocket: Durchsatz und p99 pro Dart")
+    parser.add_argument("--darts", type=int, default=1000, help="Darts pro Pfad")
+    parser.add_argument("--warmup", type=int, default=50, help="Aufwärm-Darts pro Pfad (nicht gemessen)")
+    parser.add_argument("--url", default=None, help="Benchmark-DB (Default: temporäre SQLite-Datei)")
+    args = parser.parse_args()
+
+    print(f"\n🎯 {args.darts} Darts pro Pfad:")
+    benchmark(args.darts, args.warmup, args.url)
@@ -0,0 +1,53 @@
+import argparse
+import asyncio
+import sys
+from datetime import datetime
+
+from app.database import AnalyticsSessionLocal
+from app.services.export_service import ExportService, ExportFilter, ExportRun
+
+"""
+Export der Wurf-Historie (z. B. fürs Data Warehouse) – dieselbe Streaming-Logik wie GET /throws/export:
+1.	Liest über die Analytics-DB (DATABASE_ANALYTICS_URL, sonst Replica/Primary) blockweise per Server-Cursor.
+2.	Schreibt NDJSON oder CSV Block für Block nach stdout oder in eine Datei – konstanter Speicherbedarf.
+3.	Meldet am Ende Zeilen, Dauer und Zeilen/s auf stderr.
+
+Beispiel:
+    python -m app.scripts.export_throws --format csv --output throws.csv
+    python -m app.scripts.export_throws --game-mode-id 1 --since 2025-01-01 --until 2025-02-01 > jan.ndjson
+"""
+
+
+async def export_throws(filters: ExportFilter, fmt: str, chunk_size: int, out) -> ExportRun:
+    run = ExportRun(fmt)
+    async with AnalyticsSessionLocal() as db:
+        async for chunk in ExportService.stream(db, filters, fmt, chunk_size, run):
+            out.write(chunk)
+    out.flush()
+    return run
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Wurf-Historie als NDJSON/CSV exportieren")
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    parser.add_argument("--game-id", type=int)
+    parser.add_argument("--user-id", type=int)
+    parser.add_argument("--game-mode-id", type=int)
+    parser.add_argument("--since", type=datetime.fromisoformat, help="ISO-Datum/Zeit, inklusive")
+    parser.add_argument("--until", type=datetime.fromisoformat, help="ISO-Datum/Zeit, exklusive")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="Zeilen pro Block")
+    parser.add_argument("--output", help="Zieldatei (Default: stdout)")
+    args = parser.parse_args()
+
+    filters = ExportFilter(args.game_id, args.user_id, args.game_mode_id, args.since, args.until)
+    out = open(args.output, "w", newline="", encoding="utf-8") if args.output else sys.stdout
+    try:
+        run = asyncio.run(export_throws(filters, args.format, args.chunk_size, out))
+    finally:
+        if args.output:
+            out.close()
+
+    print(
+        f"✅ {run.rows} Würfe in {run.seconds:.2f}s exportiert ({run.rows_per_second:,.0f} Zeilen/s, {run.chunks} Blöcke)",
+        file=sys.stderr,
+    )
@@ -0,0 +1,49 @@
+import argparse
+import asyncio
+import os
+import sys
+
+from app.database import AsyncSessionLocal
+from app.services.import_service import ImportService
+
+"""
+Import historischer Matches – dieselbe Logik wie POST /imports/matches:
+1.	Liest die Datei zeilenweise (NDJSON: ein Match pro Zeile, CSV: ein Dart pro Zeile).
+2.	Spielt jedes Match im Speicher nach; ungültige Matches werden abgelehnt und aufgelistet.
+3.	Lädt Blöcke von --chunk-size Matches (Throws per COPY auf Postgres), ein Commit pro Block.
+4.	Schreibt Dart-Statistiken und Bestenlisten pro Block mit (kein Neuaufbau am Ende).
+
+Bricht der Import ab, einfach denselben Befehl erneut starten – der Job (--name, Default: Dateiname)
+setzt nach dem letzten committeten Block wieder auf.
+
+Beispiel:
+    python -m app.scripts.import_matches liga_2023.ndjson
+    python -m app.scripts.import_matches export.csv --name liga-2022 --chunk-size 500
+"""
+
+
+async def import_matches(path: str, fmt: str, name: str, chunk_size: int) -> dict:
+    with open(path, newline="", encoding="utf-8") as lines:
+        async with AsyncSessionLocal() as db:
+            return await ImportService.run(db, lines, fmt, name, chunk_size)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Historische Matches aus NDJSON/CSV importieren")
+    parser.add_argument("path", help="Importdatei")
+    parser.add_argument("--format", choices=["ndjson", "csv"], help="Default: aus der Dateiendung")
+    parser.add_argument("--name", help="Job-Name für die Wiederaufnahme (Default: Dateiname)")
+    parser.add_argument("--chunk-size", type=int, default=200, help="Matches pro Commit")
+    args = parser.parse_args()
+
+    fmt = args.format or ("csv" if args.path.lower().endswith(".csv") else "ndjson")
+    name = args.name or os.path.basename(args.path)
+    result = asyncio.run(import_matches(args.path, fmt, name, args.chunk_size))
+
+    for rejected in result["rejected"]:
+        print(f"  ⚠️ Datensatz {rejected['record']} ({rejected['external_id']}): {rejected['reason']}", file=sys.stderr)
+    print(
+        f"✅ {result['matches_imported']} Matches / {result['throws_imported']} Würfe importiert, "
+        f"{result['matches_rejected']} abgelehnt, {result['users_created']} neue User ({result['seconds']:.2f}s)",
+        file=sys.stderr,
+    )
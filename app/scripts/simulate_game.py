@@ -9,6 +9,7 @@ from app.models.game_participant import GameParticipant
 from app.models.throw import Throw
 
 from app.services.game_engine import GameEngine
+from app.services.game_rules import compile_rules
 
 """
 Simuliert ein einzelnes Spiel über die GameEngine + CRUD-Funktionen (umgeht Auth & API!):
@@ -70,6 +71,9 @@ async def simulate_game():
         print(f"Teilnehmer: {[u.username for u in users]}")
 
         # 5) Würfe simulieren, bis jemand gewinnt
+        # (Relationen werden nicht nachgeladen → Regeln + Namen einmal vorab)
+        rules = compile_rules(mode)
+        names = {p.id: u.username for p, u in zip(participants, users)}
         turn = 1
         winner = None
         while not winner:
@@ -87,12 +91,12 @@ async def simulate_game():
                 db.add(throw)
 
                 # Spiellogik anwenden
-                result = GameEngine.apply_throw(new_game, participant, throw)
+                result = GameEngine.apply_throw(new_game, participant, throw, rules)
 
-                print(f"{participant.user.username} wirft {throw_value}x{multiplier} → {result}")
+                print(f"{names[participant.id]} wirft {throw_value}x{multiplier} → {result}")
 
                 if result["status"] == "WIN":
-                    winner = participant.user.username
+                    winner = names[participant.id]
                     break
 
             turn += 1
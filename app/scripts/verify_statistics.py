@@ -0,0 +1,52 @@
+import argparse
+import asyncio
+import time
+
+from app.database import AsyncSessionLocal
+from app.services.statistics_service import StatisticsService
+
+"""
+Gegenprobe für die inkrementellen Statistik-Akkumulatoren:
+1.	Spielt jedes Spiel Wurf für Wurf nach (frischer Zustand, gleiche Engine wie live).
+2.	Berechnet Mittelwerte/Varianzen/Maxima/Zähler direkt aus allen Einzelwerten (NumPy, zwei Pässe).
+3.	Vergleicht mit den gespeicherten statistics- und statistic_rollups-Zeilen (relative Toleranz, Default 1e-9).
+4.	--repair überschreibt abweichende Zeilen mit der Neuberechnung.
+
+Vorher sollte der Server gestoppt sein (oder der periodische Flush gelaufen), sonst
+stehen noch Darts in den In-Memory-Akkumulatoren aus.
+
+Beispiel:
+    python -m app.scripts.verify_statistics
+    python -m app.scripts.verify_statistics --repair
+"""
+
+
+async def verify_statistics(repair: bool = False, rel_tol: float = 1e-9) -> list[dict]:
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        mismatches = await StatisticsService.verify(db, repair=repair, rel_tol=rel_tol)
+    duration = time.perf_counter() - started
+
+    if not mismatches:
+        print(f"✅ Alle Statistiken stimmen mit der Neuberechnung überein ({duration:.2f}s)")
+        return mismatches
+
+    print(f"❌ {len(mismatches)} Abweichung(en) ({duration:.2f}s):")
+    for m in mismatches:
+        scope = "gesamt" if m["period"] == "total" else f"{m['period']} ab {m['bucket_start']}"
+        print(f"  User {m['user_id']} / Modus {m['game_mode_id']} ({scope}):")
+        for name, values in m["fields"].items():
+            print(f"    {name}: gespeichert={values['actual']} neu berechnet={values['expected']}")
+    if repair:
+        print("🔧 Abweichende Zeilen wurden überschrieben.")
+    return mismatches
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Statistik-Akkumulatoren gegen Neuberechnung prüfen")
+    parser.add_argument("--repair", action="store_true", help="Abweichende Zeilen überschreiben")
+    parser.add_argument("--rel-tol", type=float, default=1e-9, help="Relative Toleranz für Float-Werte")
+    args = parser.parse_args()
+
+    mismatches = asyncio.run(verify_statistics(args.repair, args.rel_tol))
+    raise SystemExit(1 if mismatches and not args.repair else 0)
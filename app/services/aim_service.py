@@ -0,0 +1,244 @@
+"""
+Skill-basierte Checkout-Empfehlung.
+
+Ein Dartboard-Modell übersetzt Zielpunkt + Streuung eines Spielers (2D-Gauß, σ in mm)
+in Trefferwahrscheinlichkeiten pro Feld – für das ganze Board auf einmal per
+FFT-Faltung auf einem Raster. Daraus entsteht per DP eine Tabelle
+"Wahrscheinlichkeit, mit d Darts von Score s auszuchecken" + bester Zielpunkt.
+Die Tabellen werden pro Skill-Bucket (σ gerundet) und Checkout-Regel gecacht.
+
+Eine Tabelle kostet je nach σ 0,15–0,6 s CPU. Im Request-Pfad (Scoreboard, Checkout-Hinweis)
+wird deshalb nie synchron gerechnet: `table_ready` stößt die Berechnung für einen kalten
+Bucket im Executor an, bis dahin nimmt checkout_service die statische DP-Tabelle.
+"""
+import asyncio
+from functools import lru_cache
+
+import numpy as np
+
+from app.services import dart_codec
+
+# ---------------------------------------------------------
+# Board-Geometrie (Standard-Steeldartboard, Maße in mm)
+# ---------------------------------------------------------
+R_BULL_INNER = 6.35
+R_BULL_OUTER = 15.9
+R_TRIPLE_INNER = 99.0
+R_TRIPLE_OUTER = 107.0
+R_DOUBLE_INNER = 162.0
+R_DOUBLE_OUTER = 170.0
+SECTORS = [20, 1, 18, 4, 13, 6, 10, 15, 2, 17, 3, 19, 7, 16, 8, 11, 14, 9, 12, 5]
+
+RESOLUTION_MM = 2.0
+SIGMA_BUCKETS = (10, 15, 20, 25, 30, 40, 50, 60)
+MAX_SCORE = 180
+
+# Feld-Codes (siehe dart_codec): 0 = Miss, 1–20 Single, 21–40 Double, 41–60 Triple, 61 = 25, 62 = Bull
+NUM_SEGMENTS = dart_codec.NUM_CODES
+SEGMENT_VALUE = np.array(dart_codec.VALUES)
+SEGMENT_MULTIPLIER = np.array(dart_codec.MULTIPLIERS)
+SEGMENT_POINTS = SEGMENT_VALUE * SEGMENT_MULTIPLIER
+
+# Skill-Profile der Spieler (user_id → σ in mm), werden aus den Statistiken befüllt
+_PLAYER_SIGMA: dict[int, float] = {}
+
+# Fertige Erfolgstabellen pro (σ-Bucket, Checkout-Regel) und laufende Berechnungen im Executor
+_TABLES: dict[tuple[int, str | None], tuple[np.ndarray, np.ndarray]] = {}
+_BUILDING: dict[tuple[int, str | None], asyncio.Future] = {}
+
+
+def _segment_codes(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Feld-Code für jeden Punkt (x, y) in mm, Ursprung = Bullseye, y nach oben."""
+    r = np.hypot(x, y)
+    angle = (90.0 - np.degrees(np.arctan2(y, x))) % 360.0  # 0° = oben, im Uhrzeigersinn
+    sector = np.asarray(SECTORS)[((angle + 9.0) // 18.0).astype(int) % 20]
+
+    codes = np.where(r <= R_DOUBLE_OUTER, sector, 0)
+    codes = np.where((r >= R_TRIPLE_INNER) & (r <= R_TRIPLE_OUTER), sector + 40, codes)
+    codes = np.where((r >= R_DOUBLE_INNER) & (r <= R_DOUBLE_OUTER), sector + 20, codes)
+    codes = np.where(r <= R_BULL_OUTER, 61, codes)
+    codes = np.where(r <= R_BULL_INNER, 62, codes)
+    return codes
+
+
+def _aim_points() -> tuple[np.ndarray, list[str], np.ndarray]:
+    """
+    Kandidaten-Zielpunkte: Mitte von Triple, Double, großem und kleinem Single jedes Sektors + Bull.
+    Gibt (Koordinaten (A, 2), Labels, beabsichtigter Feld-Code) zurück.
+    """
+    rings = [
+        ("T", (R_TRIPLE_INNER + R_TRIPLE_OUTER) / 2, 40),
+        ("D", (R_DOUBLE_INNER + R_DOUBLE_OUTER) / 2, 20),
+        ("", (R_TRIPLE_OUTER + R_DOUBLE_INNER) / 2, 0),
+        ("", (R_BULL_OUTER + R_TRIPLE_INNER) / 2, 0),
+    ]
+    coords, labels, codes = [(0.0, 0.0)], ["Bull"], [62]
+    for i, value in enumerate(SECTORS):
+        angle = np.radians(90.0 - 18.0 * i)
+        for prefix, radius, offset in rings:
+            coords.append((radius * np.cos(angle), radius * np.sin(angle)))
+            labels.append(f"{prefix}{value}")
+            codes.append(value + offset)
+    return np.array(coords), labels, np.array(codes)
+
+
+AIM_COORDS, AIM_LABELS, AIM_CODES = _aim_points()
+
+
+def skill_bucket(sigma_mm: float) -> int:
+    """Rundet eine Streuung auf den nächsten Skill-Bucket (damit Tabellen geteilt werden)."""
+    return min(SIGMA_BUCKETS, key=lambda b: abs(b - sigma_mm))
+
+
+@lru_cache(maxsize=len(SIGMA_BUCKETS))
+def hit_probabilities(sigma_mm: int) -> np.ndarray:
+    """
+    Matrix P (A, 63): Wahrscheinlichkeit, Feld k zu treffen, wenn auf Zielpunkt a gezielt wird.
+    Berechnet per FFT-Faltung von Feld-Indikatoren mit dem Gauß-Kernel über das ganze Board.
+    Das Raster hat 3σ Rand außerhalb des Boards (nur Miss), daher stört die zyklische Faltung nicht.
+    """
+    half = int(np.ceil((R_DOUBLE_OUTER + 3 * sigma_mm) / RESOLUTION_MM))
+    axis = np.arange(-half, half + 1) * RESOLUTION_MM
+    x, y = np.meshgrid(axis, axis)
+    codes = _segment_codes(x, y)
+
+    kernel = np.exp(-(x ** 2 + y ** 2) / (2.0 * sigma_mm ** 2))
+    kernel_fft = np.fft.rfft2(np.fft.ifftshift(kernel / kernel.sum()))
+
+    aim_idx = np.rint(AIM_COORDS / RESOLUTION_MM).astype(int) + half
+    probs = np.zeros((len(AIM_LABELS), NUM_SEGMENTS))
+
+    for start in range(1, NUM_SEGMENTS, 8):
+        segs = np.arange(start, min(start + 8, NUM_SEGMENTS))
+        indicators = (codes[None, :, :] == segs[:, None, None]).astype(np.float64)
+        blurred = np.fft.irfft2(np.fft.rfft2(indicators) * kernel_fft, s=codes.shape)
+        probs[:, segs] = blurred[:, aim_idx[:, 1], aim_idx[:, 0]].T
+
+    probs = np.clip(probs, 0.0, 1.0)
+    probs[:, 0] = np.clip(1.0 - probs[:, 1:].sum(axis=1), 0.0, 1.0)
+    return probs
+
+
+def success_table(sigma_mm: int, checkout_rule: str | None) -> tuple[np.ndarray, np.ndarray]:
+    """Erfolgstabelle aus dem Cache oder synchron berechnet (Skripte, Tests, Executor-Threads)."""
+    key = (sigma_mm, checkout_rule)
+    table = _TABLES.get(key)
+    if table is None:
+        table = _TABLES[key] = _build_success_table(sigma_mm, checkout_rule)
+    return table
+
+
+def table_ready(sigma_mm: float, checkout_rule: str | None) -> bool:
+    """
+    Liegt die Tabelle für diese Streuung schon vor? Falls nicht, wird sie im Executor
+    berechnet (einmal pro Bucket) – der Aufrufer blockiert nicht und nimmt solange den Fallback.
+    """
+    key = (skill_bucket(sigma_mm), checkout_rule)
+    if key in _TABLES:
+        return True
+    if key not in _BUILDING:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False  # kein Event-Loop → nichts anstoßen, Fallback
+        future = _BUILDING[key] = loop.run_in_executor(None, success_table, *key)
+
+        def done(f: asyncio.Future) -> None:
+            _BUILDING.pop(key, None)
+            if not f.cancelled():
+                f.exception()  # fehlgeschlagen → beim nächsten Zugriff neu versuchen
+
+        future.add_done_callback(done)
+    return False
+
+
+def _build_success_table(sigma_mm: int, checkout_rule: str | None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    DP über die verbleibenden Darts einer Aufnahme:
+      V[d][s] = max_a Σ_k P[a, k] · Ergebnis(s, k, d)
+    Ergebnis = 1 bei gültigem Finish, 0 bei BUST, sonst V[d-1][s - Punkte(k)].
+    Gibt (V (4, S), bester Zielpunkt-Index (4, S)) zurück.
+    """
+    probs = hit_probabilities(sigma_mm)
+    scores = np.arange(MAX_SCORE + 1)
+    rest = scores[:, None] - SEGMENT_POINTS[None, :]  # (S, 63)
+
+    if checkout_rule == "double":
+        valid_finish = SEGMENT_MULTIPLIER == 2
+    elif checkout_rule == "master":
+        valid_finish = SEGMENT_MULTIPLIER >= 2
+    else:
+        valid_finish = np.ones(NUM_SEGMENTS, dtype=bool)
+    bust_on_one = checkout_rule in ("double", "master")
+
+    win = (rest == 0) & valid_finish[None, :]
+    bust = (rest < 0) | ((rest == 0) & ~valid_finish[None, :])
+    if bust_on_one:
+        bust |= rest == 1
+
+    values = np.zeros((4, MAX_SCORE + 1))
+    best_aim = np.zeros((4, MAX_SCORE + 1), dtype=int)
+    for darts in range(1, 4):
+        following = values[darts - 1][np.clip(rest, 0, MAX_SCORE)]
+        outcome = np.where(win, 1.0, np.where(bust, 0.0, following))  # (S, 63)
+        expected = probs @ outcome.T  # (A, S)
+        best_aim[darts] = expected.argmax(axis=0)
+        values[darts] = expected.max(axis=0)
+        values[darts][0] = 0.0
+
+    return values, best_aim
+
+
+def sigma_from_average(three_dart_average: float) -> float:
+    """
+    Grobe Schätzung der Streuung aus dem 3-Dart-Average
+    (Profi ~100 → ~15 mm, Hobby ~40 → ~50 mm).
+    """
+    return float(np.interp(three_dart_average, [20, 40, 60, 80, 100], [60, 50, 32, 22, 15]))
+
+
+def set_player_sigma(user_id: int, sigma_mm: float) -> None:
+    _PLAYER_SIGMA[user_id] = sigma_mm
+
+
+def update_player_skill(user_id: int, three_dart_average: float) -> None:
+    """Aktualisiert das Skill-Profil eines Spielers anhand seines 3-Dart-Averages."""
+    if three_dart_average > 0:
+        set_player_sigma(user_id, sigma_from_average(three_dart_average))
+
+
+def get_player_sigma(user_id: int) -> float | None:
+    return _PLAYER_SIGMA.get(user_id)
+
+
+def clear_player_skills() -> None:
+    _PLAYER_SIGMA.clear()
+
+
+def recommend_checkout(
+    score: int,
+    darts_left: int,
+    checkout_rule: str | None,
+    sigma_mm: float,
+) -> dict | None:
+    """
+    Empfiehlt den Weg mit der höchsten Finish-Wahrscheinlichkeit für diese Streuung.
+    {"path": "T20, D20", "aim": "T20", "probability": 0.18} oder None, wenn kein Finish möglich ist.
+    """
+    if not (0 < score <= MAX_SCORE) or not (0 < darts_left <= 3):
+        return None
+
+    values, best_aim = success_table(skill_bucket(sigma_mm), checkout_rule)
+    probability = float(values[darts_left][score])
+    if probability <= 0.0:
+        return None
+
+    # Pfad: jeweils bestes Ziel, unter der Annahme, dass es getroffen wird
+    path, remaining, darts = [], score, darts_left
+    while remaining > 0 and darts > 0 and values[darts][remaining] > 0.0:
+        aim = best_aim[darts][remaining]
+        path.append(AIM_LABELS[aim])
+        remaining -= int(SEGMENT_POINTS[AIM_CODES[aim]])
+        darts -= 1
+
+    return {"path": ", ".join(path), "aim": path[0], "probability": round(probability, 4)}
@@ -0,0 +1,186 @@
+import numpy as np
+
+from app.services.game_rules import GameRules, build_rules
+
+# Status-Codes als kleine Integer (statt Strings), damit ganze Arrays verglichen werden können.
+STATUS_SKIPPED = -1  # Dart wurde nicht mehr geworfen (Turn schon vorbei)
+STATUS_OK = 0
+STATUS_BUST = 1
+STATUS_WIN = 2
+STATUS_NAMES = {STATUS_OK: "OK", STATUS_BUST: "BUST", STATUS_WIN: "WIN"}
+
+
+class RandomThrowModel:
+    """
+    Einfaches Wurfmodell für Simulationen (entspricht dem Wurf-Pool der Simulations-Skripte):
+    - Scoring-Darts zufällig aus einem Pool von Feldern + Multiplikatoren
+    - Liegt ein Finish mit einem Double an, wird das Double anvisiert
+      und mit `double_hit_rate` getroffen (sonst Single-Feld bzw. daneben).
+    """
+
+    def __init__(
+        self,
+        values=(1, 5, 12, 16, 19, 20, 25),
+        multipliers=(1, 2, 3),
+        double_hit_rate: float = 0.35,
+    ):
+        self.values = np.asarray(values, dtype=np.int16)
+        self.multipliers = np.asarray(multipliers, dtype=np.int16)
+        self.double_hit_rate = double_hit_rate
+
+    def sample(self, scores: np.ndarray, rng: np.random.Generator):
+        n = scores.shape[0]
+        values = rng.choice(self.values, size=n)
+        multipliers = rng.choice(self.multipliers, size=n)
+
+        # Bull darf kein Triple sein → auf Double korrigieren (wie ValidationService)
+        multipliers = np.where((values == 25) & (multipliers == 3), 2, multipliers)
+
+        # 🎯 Checkout-Versuch: gerade Scores bis 40 oder Bull (50)
+        finishable = ((scores <= 40) & (scores >= 2) & (scores % 2 == 0)) | (scores == 50)
+        target = np.where(scores == 50, 25, scores // 2)
+        hit = rng.random(n) < self.double_hit_rate
+        miss_single = rng.random(n) < 0.5  # daneben: Single-Feld oder außerhalb des Boards
+
+        values = np.where(finishable, np.where(hit | miss_single, target, 0), values)
+        multipliers = np.where(finishable, np.where(hit, 2, 1), multipliers)
+        return values.astype(np.int16), multipliers.astype(np.int16)
+
+
+class BatchX01Engine:
+    """
+    Vektorisierte X01-Spiellogik — spielt viele Legs gleichzeitig.
+    Gleiche Regeln wie GameEngine._play_subtract_mode, aber Scores als NumPy-Arrays
+    und BUST / Double-Out / WIN als Masken.
+    Führt KEINE DB-Aktionen aus.
+    """
+
+    def __init__(
+        self,
+        starting_score: int = 501,
+        checkout_rule: str | None = "double",
+        checkin_rule: str | None = None,
+    ):
+        self.rules = build_rules("subtract", starting_score, checkout_rule, checkin_rule)
+        self.starting_score = starting_score
+        self.checkout_rule = checkout_rule
+
+        finish = self.rules.finish_multipliers
+        checkin = self.rules.checkin_multipliers
+        self._finish_multipliers = np.array(sorted(finish)) if finish is not None else None
+        self._checkin_multipliers = np.array(sorted(checkin)) if checkin is not None else None
+
+    @classmethod
+    def from_rules(cls, rules: GameRules) -> "BatchX01Engine":
+        return cls(rules.starting_score, rules.checkout_rule, rules.checkin_rule)
+
+    # -------------------------------------------------------------------------
+    # 1️⃣ Ein Dart für alle Legs
+    # -------------------------------------------------------------------------
+    def apply_darts(self, scores: np.ndarray, values: np.ndarray, multipliers: np.ndarray):
+        """
+        Wendet je einen Dart auf jeden Score an.
+        Gibt (neue Scores, Status-Codes) zurück – bei BUST bleibt der alte Score stehen.
+        """
+        points = values * multipliers
+        if self._checkin_multipliers is not None:
+            # Double-In: vor dem ersten gültigen Check-in zählt kein Dart
+            not_in = (scores == self.starting_score) & ~np.isin(multipliers, self._checkin_multipliers)
+            points = np.where(not_in, 0, points)
+        new_scores = scores - points
+
+        bust = new_scores < 0
+        if self.rules.bust_on_one:
+            # 1 Punkt ist bei Double-/Master-Out nicht auscheckbar
+            bust |= new_scores == 1
+
+        finish = new_scores == 0
+        if self._finish_multipliers is not None:
+            invalid_checkout = finish & ~np.isin(multipliers, self._finish_multipliers)
+            bust |= invalid_checkout
+            finish &= ~invalid_checkout
+
+        status = np.full(scores.shape, STATUS_OK, dtype=np.int8)
+        status[bust] = STATUS_BUST
+        status[finish] = STATUS_WIN
+
+        return np.where(bust, scores, new_scores), status
+
+    # -------------------------------------------------------------------------
+    # 2️⃣ Eine komplette Aufnahme (max. 3 Darts)
+    # -------------------------------------------------------------------------
+    def play_turn(self, scores: np.ndarray, values: np.ndarray, multipliers: np.ndarray):
+        """
+        Spielt eine Aufnahme pro Leg. values/multipliers haben die Form (N, 3).
+        Nach BUST oder WIN endet die Aufnahme (wie TurnService.should_change_player),
+        die restlichen Darts bekommen STATUS_SKIPPED.
+        Gibt (neue Scores, Status-Matrix (N, 3)) zurück.
+        """
+        scores = np.array(scores, copy=True)
+        n = scores.shape[0]
+        status = np.full((n, 3), STATUS_SKIPPED, dtype=np.int8)
+        in_turn = np.ones(n, dtype=bool)
+
+        for dart in range(3):
+            new_scores, dart_status = self.apply_darts(scores, values[:, dart], multipliers[:, dart])
+            scores = np.where(in_turn, new_scores, scores)
+            status[:, dart] = np.where(in_turn, dart_status, STATUS_SKIPPED)
+            in_turn &= dart_status == STATUS_OK
+
+        return scores, status
+
+    # -------------------------------------------------------------------------
+    # 3️⃣ Viele komplette Legs simulieren
+    # -------------------------------------------------------------------------
+    def simulate_legs(
+        self,
+        num_legs: int,
+        num_players: int = 2,
+        rng: np.random.Generator | None = None,
+        throw_model: RandomThrowModel | None = None,
+        max_turns: int = 150,
+    ) -> dict:
+        """
+        Simuliert `num_legs` unabhängige Legs mit `num_players` Spielern.
+        Spieler 0 beginnt jedes Leg. Gibt Arrays zurück:
+        {
+            "winner": Index des Gewinners pro Leg (-1 = abgebrochen),
+            "darts":  geworfene Darts pro Leg und Spieler (N, P),
+            "busts":  Anzahl BUSTs pro Leg und Spieler (N, P),
+            "turns":  Anzahl Aufnahmen bis zum Ende pro Leg,
+        }
+        """
+        rng = rng or np.random.default_rng()
+        throw_model = throw_model or RandomThrowModel()
+
+        scores = np.full((num_legs, num_players), self.starting_score, dtype=np.int32)
+        darts = np.zeros((num_legs, num_players), dtype=np.int32)
+        busts = np.zeros((num_legs, num_players), dtype=np.int32)
+        winner = np.full(num_legs, -1, dtype=np.int32)
+        turns = np.zeros(num_legs, dtype=np.int32)
+
+        for turn in range(1, max_turns + 1):
+            for player in range(num_players):
+                running = np.flatnonzero(winner < 0)
+                if running.size == 0:
+                    return {"winner": winner, "darts": darts, "busts": busts, "turns": turns}
+
+                current = scores[running, player]
+                in_turn = np.ones(running.size, dtype=bool)
+
+                for _ in range(3):
+                    values, multipliers = throw_model.sample(current, rng)
+                    new_scores, status = self.apply_darts(current, values, multipliers)
+
+                    current = np.where(in_turn, new_scores, current)
+                    darts[running, player] += in_turn
+                    busts[running, player] += in_turn & (status == STATUS_BUST)
+
+                    won = in_turn & (status == STATUS_WIN)
+                    winner[running[won]] = player
+                    in_turn &= status == STATUS_OK
+
+                scores[running, player] = current
+                turns[running] = turn
+
+        return {"winner": winner, "darts": darts, "busts": busts, "turns": turns}
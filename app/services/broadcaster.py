@@ -0,0 +1,300 @@
+"""
+Scoreboard-Fan-out für Zuschauer (SSE / WebSocket).
+
+Statt dass hunderte Zuschauer dieselben Spiele pollen, meldet der Wurf-Pfad nach jedem
+erfolgreichen Write-through nur "Spiel X hat sich geändert" (notify – O(1), ohne Query,
+ohne Serialisierung). Der Broadcaster
+- bündelt Änderungen: höchstens EIN Frame pro Spiel und Intervall (`interval`)
+- baut den Snapshot einmal pro Flush und schickt nur die Differenz zum letzten Frame
+- hält pro Zuschauer eine begrenzte Queue: läuft sie voll, wird sie verworfen und durch
+  einen vollständigen Snapshot ersetzt (Downsampling); wer zu oft überläuft, fliegt raus.
+  Der Wurf-Pfad wartet dabei nie auf einen Zuschauer.
+
+Mehrere Worker: Snapshots laufen über ein BroadcastBackend. In-Process (Default) liefert
+direkt an die lokalen Zuschauer; ein Backend für mehrere Prozesse (z. B. Redis Pub/Sub)
+implementiert publish() und ruft für empfangene Nachrichten `deliver(game_id, snapshot)` auf.
+
+Konfiguration über BROADCAST_INTERVAL_MS / BROADCAST_QUEUE_SIZE / BROADCAST_MAX_OVERFLOWS.
+"""
+import abc
+import asyncio
+import os
+from typing import Callable
+
+from app.services.game_state_cache import LiveGameState
+from app.services.scoreboard_service import ScoreboardService
+
+
+def scoreboard_snapshot(state: LiveGameState) -> dict:
+    """JSON-fähiger Scoreboard-Snapshot (gleiches Format wie GET /games/{id}/scoreboard)."""
+    return ScoreboardService.build(state).model_dump(mode="json")
+
+
+def scoreboard_delta(old: dict, new: dict) -> dict:
+    """
+    Differenz zweier Snapshots: geänderte Top-Level-Felder + pro Teilnehmer nur die
+    geänderten Felder (immer mit participant_id). Leeres Dict = keine Änderung.
+    """
+    changes = {k: v for k, v in new.items() if k != "participants" and old.get(k) != v}
+
+    before = {p["participant_id"]: p for p in old.get("participants", ())}
+    participants = []
+    for p in new.get("participants", ()):
+        previous = before.get(p["participant_id"])
+        if previous is None:
+            participants.append(p)
+            continue
+        diff = {k: v for k, v in p.items() if previous.get(k) != v}
+        if diff:
+            participants.append({"participant_id": p["participant_id"], **diff})
+
+    if participants:
+        changes["participants"] = participants
+    return changes
+
+
+# ============================================================
+# Backends
+# ============================================================
+
+class BroadcastBackend(abc.ABC):
+    """
+    Transportiert Snapshots zu allen Workern.
+    `local_only = True`: Publisher und Zuschauer leben im selben Prozess → ohne lokale
+    Zuschauer muss gar kein Snapshot gebaut werden.
+    """
+    local_only = False
+
+    def bind(self, deliver: Callable[[int, dict], None]) -> None:
+        self.deliver = deliver
+
+    @abc.abstractmethod
+    def publish(self, game_id: int, snapshot: dict) -> None:
+        """Snapshot an alle Worker verteilen (dort → `deliver`)."""
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+
+class InProcessBackend(BroadcastBackend):
+    local_only = True
+
+    def publish(self, game_id: int, snapshot: dict) -> None:
+        self.deliver(game_id, snapshot)
+
+
+# ============================================================
+# Zuschauer
+# ============================================================
+
+class Subscription:
+    """Ein Zuschauer eines Spiels. Frames: {"type": "snapshot"|"delta", ...}; None = getrennt."""
+
+    def __init__(self, game_id: int, queue_size: int, max_overflows: int):
+        self.game_id = game_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.max_overflows = max_overflows
+        self.overflows = 0
+        self.dropped = 0
+        self.closed = False
+
+    def offer(self, frame: dict, snapshot_frame: Callable[[], dict]) -> bool:
+        """Nicht blockierend. False → Zuschauer ist zu langsam und wurde getrennt."""
+        if self.closed:
+            return False
+        try:
+            self.queue.put_nowait(frame)
+            return True
+        except asyncio.QueueFull:
+            pass
+
+        # 🐢 Zu langsam: Rückstand verwerfen, stattdessen den aktuellen Stand schicken
+        self.dropped += self.queue.qsize() + 1
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.overflows += 1
+        if self.overflows > self.max_overflows:
+            self.close()
+            return False
+        self.queue.put_nowait(snapshot_frame())
+        return True
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+    async def next(self, timeout: float | None = None) -> dict | None:
+        """Nächster Frame (TimeoutError nach `timeout` Sekunden → Keepalive senden)."""
+        frame = await asyncio.wait_for(self.queue.get(), timeout)
+        if self.queue.empty():
+            self.overflows = 0  # aufgeholt
+        return frame
+
+
+# ============================================================
+# Broadcaster
+# ============================================================
+
+class ScoreboardBroadcaster:
+
+    def __init__(self, interval: float = 0.25, queue_size: int = 16, max_overflows: int = 3,
+                 backend: BroadcastBackend | None = None, snapshot=scoreboard_snapshot):
+        self.interval = interval
+        self.queue_size = queue_size
+        self.max_overflows = max_overflows
+        self.snapshot = snapshot
+
+        self._subscribers: dict[int, set[Subscription]] = {}
+        self._last: dict[int, dict] = {}           # zuletzt verteilter Snapshot pro Spiel
+        self._seq: dict[int, int] = {}
+        self._pending: dict[int, LiveGameState] = {}
+        self._timer: asyncio.TimerHandle | None = None
+
+        # Metriken
+        self.notifications = 0
+        self.published = 0
+        self.frames_sent = 0
+        self.frames_dropped = 0
+        self.slow_disconnects = 0
+
+        self.use_backend(backend or InProcessBackend())
+
+    def use_backend(self, backend: BroadcastBackend) -> None:
+        self.backend = backend
+        backend.bind(self.deliver)
+
+    def configure(self, interval: float | None = None, queue_size: int | None = None,
+                  max_overflows: int | None = None, backend: BroadcastBackend | None = None) -> None:
+        if interval is not None:
+            self.interval = interval
+        if queue_size is not None:
+            self.queue_size = queue_size
+        if max_overflows is not None:
+            self.max_overflows = max_overflows
+        if backend is not None:
+            self.use_backend(backend)
+
+    # -------------------------------------------------------------------------
+    # 1️⃣ Zuschauer an-/abmelden
+    # -------------------------------------------------------------------------
+    def subscribe(self, game_id: int, snapshot: dict) -> Subscription:
+        """
+        Meldet einen Zuschauer an. `snapshot` (z. B. von GET /scoreboard) ist nur die Basis,
+        falls für das Spiel noch kein Frame verteilt wurde – sonst bekommt der Zuschauer den
+        letzten verteilten Stand, damit die folgenden Deltas genau darauf passen.
+        """
+        sub = Subscription(game_id, self.queue_size, self.max_overflows)
+        base = self._last.setdefault(game_id, snapshot)
+        self._subscribers.setdefault(game_id, set()).add(sub)
+        sub.queue.put_nowait(self._snapshot_frame(game_id, base))
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        subs = self._subscribers.get(sub.game_id)
+        if subs is None:
+            return
+        subs.discard(sub)
+        if not subs:
+            # Letzter Zuschauer weg → kein Zustand mehr für dieses Spiel halten
+            del self._subscribers[sub.game_id]
+            self._last.pop(sub.game_id, None)
+            self._seq.pop(sub.game_id, None)
+
+    def subscriber_count(self, game_id: int) -> int:
+        return len(self._subscribers.get(game_id, ()))
+
+    # -------------------------------------------------------------------------
+    # 2️⃣ Wurf-Pfad: Änderung melden (O(1), blockiert nie)
+    # -------------------------------------------------------------------------
+    def notify(self, state: LiveGameState) -> None:
+        if self.backend.local_only and state.game_id not in self._subscribers:
+            return
+        self.notifications += 1
+        self._pending[state.game_id] = state
+        if self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.interval, self.flush)
+
+    def flush(self) -> None:
+        """Ein Snapshot pro geändertem Spiel seit dem letzten Flush → Backend."""
+        self._timer = None
+        pending, self._pending = self._pending, {}
+        for game_id, state in pending.items():
+            self.published += 1
+            self.backend.publish(game_id, self.snapshot(state))
+
+    # -------------------------------------------------------------------------
+    # 3️⃣ Empfang (lokal oder vom Backend): Delta bilden und verteilen
+    # -------------------------------------------------------------------------
+    def deliver(self, game_id: int, snapshot: dict) -> None:
+        subs = self._subscribers.get(game_id)
+        if not subs:
+            return
+
+        changes = scoreboard_delta(self._last.get(game_id, {}), snapshot)
+        self._last[game_id] = snapshot
+        if not changes:
+            return
+
+        seq = self._seq[game_id] = self._seq.get(game_id, 0) + 1
+        frame = {"type": "delta", "game_id": game_id, "seq": seq, "changes": changes}
+        for sub in list(subs):
+            if sub.closed:  # Client bereits weg, Abmeldung steht noch aus
+                self.unsubscribe(sub)
+                continue
+            dropped_before = sub.dropped
+            if sub.offer(frame, lambda: self._snapshot_frame(game_id, snapshot)):
+                self.frames_sent += 1
+            else:
+                self.slow_disconnects += 1
+                self.unsubscribe(sub)
+            self.frames_dropped += sub.dropped - dropped_before
+
+    def _snapshot_frame(self, game_id: int, snapshot: dict) -> dict:
+        return {"type": "snapshot", "game_id": game_id, "seq": self._seq.get(game_id, 0), "scoreboard": snapshot}
+
+    async def start(self) -> None:
+        await self.backend.start()
+
+    async def close(self) -> None:
+        """Alle Zuschauer trennen (Shutdown)."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._pending.clear()
+        for subs in list(self._subscribers.values()):
+            for sub in list(subs):
+                sub.close()
+                self.unsubscribe(sub)
+        await self.backend.stop()
+
+    # -------------------------------------------------------------------------
+    # Metriken
+    # -------------------------------------------------------------------------
+    def stats(self) -> dict:
+        return {
+            "backend": type(self.backend).__name__,
+            "interval_ms": self.interval * 1000,
+            "queue_size": self.queue_size,
+            "games": len(self._subscribers),
+            "subscribers": sum(len(s) for s in self._subscribers.values()),
+            "pending": len(self._pending),
+            "notifications": self.notifications,
+            "published": self.published,
+            "frames_sent": self.frames_sent,
+            "frames_dropped": self.frames_dropped,
+            "slow_disconnects": self.slow_disconnects,
+        }
+
+
+scoreboard_broadcaster = ScoreboardBroadcaster(
+    interval=float(os.getenv("BROADCAST_INTERVAL_MS", 250)) / 1000,
+    queue_size=int(os.getenv("BROADCAST_QUEUE_SIZE", 16)),
+    max_overflows=int(os.getenv("BROADCAST_MAX_OVERFLOWS", 3)),
+)
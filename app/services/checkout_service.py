@@ -1,172 +1,156 @@
+"""
+Checkout-Solver: berechnet beim Import (= Serverstart) per dynamischer Programmierung
+für jede Kombination aus (Rest-Score, verbleibende Darts, checkout_rule) das beste Finish
+und legt es in einer flachen Lookup-Tabelle ab. Abfragen sind danach O(1).
+"""
+from app.services import aim_service
 
-CHECKOUTS = {
-    170: "T20, T20, Bull",
-    167: "T20, T19, Bull",
-    164: "T20, T18, Bull",
-    161: "T20, T17, Bull",
-    160: "T20, T20, D20",
-    158: "T20, T20, D19",
-    157: "T20, T19, D20",
-    156: "T20, T20, D18",
-    155: "T20, T19, D19",
-    154: "T20, T18, D20",
-    153: "T20, T19, D18",
-    152: "T20, T20, D16",
-    151: "T20, T17, D20",
-    150: "T20, T18, D18",
-    149: "T20, T19, D16",
-    148: "T20, T16, D20",
-    147: "T20, T17, D18",
-    146: "T20, T18, D16",
-    145: "T20, T15, D20",
-    144: "T20, T20, D12",
-    143: "T20, T17, D16",
-    142: "T20, T14, D20",
-    141: "T20, T19, D12",
-    140: "T20, T20, D10",
-    139: "T20, T13, D20",
-    138: "T20, T18, D12",
-    137: "T20, T15, D16",
-    136: "T20, T20, D8",
-    135: "T20, T13, D18",
-    134: "T20, T14, D16",
-    133: "T20, T19, D8",
-    132: "Bull, Bull, D16",
-    131: "T20, T13, D16",
-    130: "T20, T18, D8",
-    129: "T19, T16, D12",
-    128: "T18, T14, D16",
-    127: "T20, T17, D8",
-    126: "T19, T19, D6",
-    125: "T20, T13, D18",
-    124: "T20, T16, D8",
-    123: "T19, T16, D9",
-    122: "T18, T18, D7",
-    121: "T20, T11, D14",
-    120: "T20, 20, D20",
-    119: "T20, 19, D20",
-    118: "T20, 18, D20",
-    117: "T20, 17, D20",
-    116: "T20, 16, D20",
-    115: "T20, 15, D20",
-    114: "T20, 14, D20",
-    113: "T20, 13, D20",
-    112: "T20, 12, D20",
-    111: "T20, 11, D20",
-    110: "T20, 10, D20",
-    109: "T20, 9, D20",
-    108: "T20, 8, D20",
-    107: "T20, 7, D20",
-    106: "T20, 6, D20",
-    105: "T20, 5, D20",
-    104: "T18, 18, D16",
-    103: "T20, 3, D20",
-    102: "T20, 10, D16",
-    101: "T17, 10, D20",
-    100: "T20, D20",
-    99: "T19, 10, D16",
-    98: "T20, D19",
-    97: "T19, D20",
-    96: "T20, D18",
-    95: "T19, D19",
-    94: "T18, D20",
-    93: "T19, D18",
-    92: "T20, D16",
-    91: "T17, D20",
-    90: "T20, D15",
-    89: "T19, D16",
-    88: "T16, D20",
-    87: "T17, D18",
-    86: "T18, D16",
-    85: "T15, D20",
-    84: "T20, D12",
-    83: "T17, D16",
-    82: "Bull, D16",
-    81: "T15, D18",
-    80: "T20, D10",
-    79: "T19, D11",
-    78: "T18, D12",
-    77: "T15, D16",
-    76: "T20, D8",
-    75: "T17, D12",
-    74: "T14, D16",
-    73: "T19, D8",
-    72: "T16, D12",
-    71: "T13, D16",
-    70: "T18, D8",
-    69: "T19, D6",
-    68: "T20, D4",
-    67: "T17, D8",
-    66: "T10, D18",
-    65: "T11, D16",
-    64: "T16, D8",
-    63: "T13, D12",
-    62: "T10, D16",
-    61: "T15, D8",
-    60: "20, D20",
-    59: "19, D20",
-    58: "18, D20",
-    57: "17, D20",
-    56: "16, D20",
-    55: "15, D20",
-    54: "14, D20",
-    53: "13, D20",
-    52: "12, D20",
-    51: "11, D20",
-    50: "Bull",
-    49: "9, D20",
-    48: "16, D16",
-    47: "15, D16",
-    46: "14, D16",
-    45: "13, D16",
-    44: "12, D16",
-    43: "11, D16",
-    42: "10, D16",
-    41: "9, D16",
-    40: "D20",
-    39: "7, D16",
-    38: "D19",
-    37: "5, D16",
-    36: "D18",
-    35: "3, D16",
-    34: "D17",
-    33: "1, D16",
-    32: "D16",
-    31: "15, D8",
-    30: "D15",
-    29: "13, D8",
-    28: "D14",
-    27: "11, D8",
-    26: "D13",
-    25: "9, D8",
-    24: "D12",
-    23: "7, D8",
-    22: "D11",
-    21: "5, D8",
-    20: "D10",
-    19: "3, D8",
-    18: "D9",
-    17: "1, D8",
-    16: "D8",
-    15: "7, D4",
-    14: "D7",
-    13: "5, D4",
-    12: "D6",
-    11: "3, D4",
-    10: "D5",
-    9: "1, D4",
-    8: "D4",
-    7: "3, D2",
-    6: "D3",
-    5: "1, D2",
-    4: "D2",
-    3: "1, D1",
-    2: "D1",
-}
-
-def get_checkout_suggestion(score: int) -> str | None:
+CHECKOUT_RULES = ("double", "straight", "master")
+MAX_DARTS = 3
+MAX_SCORE = 180
+
+# Alle Felder als (value, multiplier) – ohne Miss
+SEGMENTS = [(v, m) for v in range(20, 0, -1) for m in (3, 2, 1)] + [(25, 2), (25, 1)]
+
+# Bevorzugte Finish-Doubles (klassische Reihenfolge: D20, D16, D8 ...), Bull zuletzt
+PREFERRED_DOUBLES = [20, 16, 8, 18, 12, 10, 4, 2, 14, 6, 19, 17, 15, 13, 11, 9, 7, 5, 3, 1, 25]
+_DOUBLE_RANK = {v: i for i, v in enumerate(PREFERRED_DOUBLES)}
+
+
+def format_dart(value: int, multiplier: int) -> str:
+    """(20, 3) → "T20", (16, 2) → "D16", (25, 2) → "Bull", (7, 1) → "7"."""
+    if value == 25:
+        return "Bull" if multiplier == 2 else "25"
+    if multiplier == 3:
+        return f"T{value}"
+    if multiplier == 2:
+        return f"D{value}"
+    return str(value)
+
+
+def _is_valid_finish(value: int, multiplier: int, rule: str) -> bool:
+    if rule == "double":
+        return multiplier == 2
+    if rule == "master":
+        return multiplier in (2, 3)
+    return True
+
+
+def _finish_rank(value: int, multiplier: int, rule: str) -> int:
+    """Je kleiner, desto angenehmer der letzte Dart."""
+    if multiplier == 2:
+        return _DOUBLE_RANK[value]
+    if multiplier == 3:
+        return len(PREFERRED_DOUBLES) + (20 - value)
+    # Straight-Out: große Single-Felder sind am leichtesten zu treffen
+    return -1 if value != 25 else len(PREFERRED_DOUBLES)
+
+
+def _setup_penalty(value: int, multiplier: int) -> int:
+    """Setup-Darts: Singles sind sicher, Triples schwerer, Doubles/Bull als Setup unüblich."""
+    if value == 25:
+        return 7 if multiplier == 2 else 4
+    return {1: 0, 2: 7, 3: 3}[multiplier]
+
+
+def _index(rule_idx: int, darts: int, score: int) -> int:
+    return (rule_idx * (MAX_DARTS + 1) + darts) * (MAX_SCORE + 1) + score
+
+
+def _build_tables() -> tuple[list, list]:
+    """
+    DP über die Anzahl Darts:
+      best[1][s] = bester einzelner Finish-Dart
+      best[d][s] = min(best[d-1][s], Setup-Dart + best[d-1][s - Setup-Punkte])
+    Ranking-Key: (Anzahl Darts, Setup-Strafen + Finish-Rang, Punkte der Darts absteigend)
+    """
+    size = len(CHECKOUT_RULES) * (MAX_DARTS + 1) * (MAX_SCORE + 1)
+    paths: list = [None] * size
+
+    for rule_idx, rule in enumerate(CHECKOUT_RULES):
+        keys: dict[int, tuple] = {}
+
+        for value, multiplier in SEGMENTS:
+            points = value * multiplier
+            if not _is_valid_finish(value, multiplier, rule):
+                continue
+            key = (1, _finish_rank(value, multiplier, rule), (-points,))
+            if points not in keys or key < keys[points]:
+                keys[points] = key
+                paths[_index(rule_idx, 1, points)] = ((value, multiplier),)
+
+        for darts in range(2, MAX_DARTS + 1):
+            previous = keys
+            keys = dict(previous)
+            for score in range(1, MAX_SCORE + 1):
+                for value, multiplier in SEGMENTS:
+                    points = value * multiplier
+                    rest = score - points
+                    if rest <= 0 or rest not in previous:
+                        continue
+                    rest_len, rest_cost, rest_points = previous[rest]
+                    key = (
+                        rest_len + 1,
+                        rest_cost + _setup_penalty(value, multiplier),
+                        (-points,) + rest_points,
+                    )
+                    if score not in keys or key < keys[score]:
+                        keys[score] = key
+                        paths[_index(rule_idx, darts, score)] = (
+                            ((value, multiplier),) + paths[_index(rule_idx, darts - 1, rest)]
+                        )
+            # Kürzere Finishes bleiben gültig, wenn kein besserer Weg gefunden wurde
+            for score in range(1, MAX_SCORE + 1):
+                if paths[_index(rule_idx, darts, score)] is None:
+                    paths[_index(rule_idx, darts, score)] = paths[_index(rule_idx, darts - 1, score)]
+
+    labels = [", ".join(format_dart(v, m) for v, m in p) if p else None for p in paths]
+    return paths, labels
+
+
+_PATHS, _LABELS = _build_tables()
+_RULE_INDEX = {rule: i for i, rule in enumerate(CHECKOUT_RULES)}
+
+
+def _lookup_index(score: int, darts_left: int, checkout_rule: str | None) -> int | None:
+    if not (0 < score <= MAX_SCORE) or not (0 < darts_left <= MAX_DARTS):
+        return None
+    # Keine/unbekannte Regel → jedes Finish zählt (wie GameEngine._is_valid_checkout)
+    rule_idx = _RULE_INDEX.get(checkout_rule, _RULE_INDEX["straight"])
+    return _index(rule_idx, darts_left, score)
+
+
+def get_checkout_path(
+    score: int,
+    darts_left: int = 3,
+    checkout_rule: str | None = "double",
+) -> tuple[tuple[int, int], ...] | None:
+    """
+    Liefert das beste Finish als Tupel von (value, multiplier) oder None.
+    """
+    idx = _lookup_index(score, darts_left, checkout_rule)
+    return _PATHS[idx] if idx is not None else None
+
+
+def get_checkout_suggestion(
+    score: int,
+    darts_left: int = 3,
+    checkout_rule: str | None = "double",
+    user_id: int | None = None,
+) -> str | None:
     """
     Gibt eine Checkout-Empfehlung für den übergebenen Score zurück.
-    Falls kein offizielles Check-out existiert, None.
+    Berücksichtigt die im Turn noch verbleibenden Darts und die Checkout-Regel.
+    Ist für user_id ein Skill-Profil bekannt, wird der Weg mit der höchsten
+    Finish-Wahrscheinlichkeit für diesen Spieler empfohlen (siehe aim_service) –
+    sobald dessen Tabelle berechnet ist, bis dahin die statische Tabelle.
+    Falls kein Check-out existiert, None.
     """
-    return CHECKOUTS.get(score)
\ No newline at end of file
+    if user_id is not None:
+        sigma = aim_service.get_player_sigma(user_id)
+        if sigma is not None and aim_service.table_ready(sigma, checkout_rule):
+            recommendation = aim_service.recommend_checkout(score, darts_left, checkout_rule, sigma)
+            return recommendation["path"] if recommendation else None
+
+    idx = _lookup_index(score, darts_left, checkout_rule)
+    return _LABELS[idx] if idx is not None else None
@@ -0,0 +1,126 @@
+"""
+Cricket-Logik auf Bit-Ebene.
+
+Zustand pro Spieler = ein einziger Integer (GameParticipant.cricket_marks):
+  Bits 0–13:  7 × 2-Bit-Zähler für die Marks auf 15, 16, 17, 18, 19, 20, Bull (0–3)
+  Bits 14–20: Closed-Maske (Bit i gesetzt = Ziel i geschlossen)
+Punkte stehen wie bisher in participant.current_score.
+Schließen, Punkten und Siegprüfung sind reine Bit-Operationen – pro Dart wird nichts alloziert.
+"""
+import numpy as np
+
+TARGETS = (15, 16, 17, 18, 19, 20, 25)
+NUM_TARGETS = len(TARGETS)
+CLOSED_SHIFT = 2 * NUM_TARGETS
+ALL_CLOSED = (1 << NUM_TARGETS) - 1
+
+# value → Ziel-Index (-1 = kein Cricket-Feld)
+TARGET_INDEX = tuple(TARGETS.index(v) if v in TARGETS else -1 for v in range(26))
+
+
+def marks_on(state: int, target: int) -> int:
+    """Anzahl Marks (0–3) auf Ziel-Index `target`."""
+    return (state >> (2 * target)) & 3
+
+
+def closed_mask(state: int) -> int:
+    return state >> CLOSED_SHIFT
+
+
+class CricketEngine:
+    """
+    Pure Cricket-Spiellogik — führt KEINE DB-Aktionen aus.
+    """
+
+    @staticmethod
+    def apply_dart(state: int, value: int, multiplier: int, opponents_closed: int) -> tuple[int, int]:
+        """
+        Wendet einen Dart auf einen Spielerzustand an.
+        opponents_closed = UND-Verknüpfung der Closed-Masken aller Gegner
+        (Bit gesetzt = alle Gegner haben das Ziel geschlossen → keine Punkte mehr).
+        Gibt (neuer Zustand, erzielte Punkte) zurück.
+        """
+        target = TARGET_INDEX[value] if 0 <= value < 26 else -1
+        if target < 0:
+            return state, 0
+
+        shift = 2 * target
+        bit = 1 << target
+        current = (state >> shift) & 3
+        total = current + multiplier
+
+        if total >= 3:
+            # Ziel (jetzt) geschlossen: Zähler auf 3, Closed-Bit setzen
+            state = (state & ~(3 << shift)) | (3 << shift) | (bit << CLOSED_SHIFT)
+            extra = total - 3
+            points = 0 if opponents_closed & bit else extra * value
+            return state, points
+
+        state = (state & ~(3 << shift)) | (total << shift)
+        return state, 0
+
+    @staticmethod
+    def is_winner(state: int, score: int, opponent_scores) -> bool:
+        """Sieg: alle Ziele geschlossen und mindestens so viele Punkte wie jeder Gegner."""
+        return closed_mask(state) == ALL_CLOSED and all(score >= s for s in opponent_scores)
+
+    # -------------------------------------------------------------------------
+    # GameEngine-Handler für scoring_type "add"
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def play(game, participant, throw, rules) -> dict:
+        participants = getattr(game, "participants", None) or ()
+
+        # Ziele, die ALLE Gegner geschlossen haben (ohne Gegner: keins)
+        opponents_closed = ALL_CLOSED
+        has_opponents = False
+        for p in participants:
+            if p is not participant:
+                opponents_closed &= closed_mask(getattr(p, "cricket_marks", None) or 0)
+                has_opponents = True
+        if not has_opponents:
+            opponents_closed = 0
+
+        state, points = CricketEngine.apply_dart(
+            getattr(participant, "cricket_marks", None) or 0,
+            throw.value,
+            throw.multiplier,
+            opponents_closed,
+        )
+        participant.cricket_marks = state
+        participant.current_score += points
+
+        opponent_scores = (p.current_score for p in participants if p is not participant)
+        if CricketEngine.is_winner(state, participant.current_score, opponent_scores):
+            return {"status": "WIN", "remaining": participant.current_score}
+
+        return {"status": "OK", "remaining": participant.current_score}
+
+    # -------------------------------------------------------------------------
+    # Batch-Auswertung (Simulation): gleiche Logik auf NumPy-Arrays
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def apply_darts(states: np.ndarray, values: np.ndarray, multipliers: np.ndarray, opponents_closed: np.ndarray):
+        """
+        Vektorisierte Version von apply_dart für viele Spieler/Legs gleichzeitig.
+        Gibt (neue Zustände, erzielte Punkte) zurück.
+        """
+        lookup = np.asarray(TARGET_INDEX)
+        target = np.where((values >= 0) & (values < 26), lookup[np.clip(values, 0, 25)], -1)
+        valid = target >= 0
+        target = np.where(valid, target, 0)
+
+        shift = 2 * target
+        bit = np.left_shift(1, target)
+        current = np.right_shift(states, shift) & 3
+        total = current + multipliers
+        closes = valid & (total >= 3)
+        adds = valid & (total < 3)
+
+        cleared = states & ~np.left_shift(3, shift)
+        new_states = np.where(closes, cleared | np.left_shift(3, shift) | np.left_shift(bit, CLOSED_SHIFT), states)
+        new_states = np.where(adds, cleared | np.left_shift(total, shift), new_states)
+
+        scoring = closes & ((opponents_closed & bit) == 0)
+        points = np.where(scoring, (total - 3) * values, 0)
+        return new_states, points
@@ -0,0 +1,129 @@
+"""
+Kompakte Dart-Kodierung: ein Dart = ein Byte.
+
+Feld-Codes (gleiches Layout wie aim_service):
+    0 = Miss, 1–20 Single, 21–40 Double, 41–60 Triple, 61 = 25, 62 = Bull (D25)
+
+Die Darts eines Teilnehmers liegen als `bytearray` im Live-Cache (ParticipantState.darts)
+und als Blob in game_participants.darts (geschrieben, sobald eine Aufnahme abgeschlossen
+ist) – ein paar hundert Bytes pro Spiel statt eines ORM-Objekts (mehrere hundert Bytes)
+pro Dart.
+
+Aufnahmen: nach 3 Darts ist eine Aufnahme vorbei. Auf einen Bust-Dart folgt BUST (255) –
+die Aufnahme endet dort, der Bust-Dart selbst zählt nicht (wie in GameEngine). So lassen
+sich Aufnahmen (X01) ohne weitere Spalten aus dem Puffer lesen; nur ob die letzte,
+angefangene Aufnahme das Checkout war, weiß der Aufrufer (Spiel-/Teilnehmerstatus).
+
+Auswertungen laufen direkt auf dem Puffer: `bytes.translate(POINTS_TABLE)` übersetzt alle
+Codes in C in ihre Punkte (jeweils ≤ 60 → passt in ein Byte), `sum()` darüber ist die Summe.
+"""
+from typing import Iterator, NamedTuple
+
+MISS = 0
+BULL_OUTER = 61
+BULL = 62
+BUST = 255
+NUM_CODES = 63
+
+VALUES = (0,) + tuple(range(1, 21)) * 3 + (25, 25)
+MULTIPLIERS = (1,) + (1,) * 20 + (2,) * 20 + (3,) * 20 + (1, 2)
+POINTS = tuple(v * m for v, m in zip(VALUES, MULTIPLIERS))
+
+# 256-Byte-Übersetzungstabelle: Code → Punkte (BUST und ungültige Codes → 0)
+POINTS_TABLE = bytes(POINTS) + bytes(256 - NUM_CODES)
+
+
+class Dart(NamedTuple):
+    """Leichter Ersatz für ein Throw-Objekt – reicht der GameEngine (value, multiplier)."""
+    value: int
+    multiplier: int
+
+    @property
+    def score(self) -> int:
+        return self.value * self.multiplier
+
+
+DARTS = tuple(Dart(v, m) for v, m in zip(VALUES, MULTIPLIERS))
+
+
+def encode(value: int, multiplier: int) -> int:
+    """(value, multiplier) → Code. Jeder Dart mit value 0 ist ein Miss."""
+    if value == 0:
+        return MISS
+    if multiplier not in (1, 2, 3):
+        raise ValueError(f"Invalid multiplier: {multiplier}")
+    if 1 <= value <= 20:
+        return value + (multiplier - 1) * 20
+    if value == 25 and multiplier in (1, 2):
+        return BULL_OUTER if multiplier == 1 else BULL
+    raise ValueError(f"Invalid dart: {value}x{multiplier}")
+
+
+def decode(code: int) -> Dart:
+    if not 0 <= code < NUM_CODES:
+        raise ValueError(f"Invalid dart code: {code}")
+    return DARTS[code]
+
+
+def label(code: int) -> str:
+    """Lesbare Form: "T20", "D16", "S5", "25", "BULL", "MISS"."""
+    if code == MISS:
+        return "MISS"
+    if code == BULL_OUTER:
+        return "25"
+    if code == BULL:
+        return "BULL"
+    dart = decode(code)
+    return f"{'SDT'[dart.multiplier - 1]}{dart.value}"
+
+
+# ============================================================
+# Puffer (bytearray / bytes) eines Teilnehmers
+# ============================================================
+
+def append_dart(darts: bytearray, value: int, multiplier: int, bust: bool = False) -> None:
+    darts.append(encode(value, multiplier))
+    if bust:
+        darts.append(BUST)
+
+
+def codes(darts: bytes) -> bytes:
+    """Nur die Dart-Codes (ohne Bust-Marker)."""
+    return bytes(darts).replace(bytes((BUST,)), b"")
+
+
+def dart_count(darts: bytes) -> int:
+    return len(darts) - darts.count(BUST)
+
+
+def total_points(darts: bytes) -> int:
+    """Punkte aller geworfenen Darts (auch in Bust-Aufnahmen)."""
+    return sum(bytes(darts).translate(POINTS_TABLE))
+
+
+def iter_turns(darts: bytes) -> Iterator[tuple[bytes, bool, bool]]:
+    """
+    (Codes, bust, abgeschlossen) pro Aufnahme. Abgeschlossen = 3 Darts oder Bust;
+    nur die letzte Aufnahme kann offen sein (läuft noch oder war das Checkout).
+    """
+    start, n = 0, len(darts)
+    while start < n:
+        end = start
+        while end < n and end - start < 3 and darts[end] != BUST:
+            end += 1
+        bust = end < n and darts[end] == BUST
+        yield bytes(darts[start:end]), bust, bust or end - start == 3
+        start = end + 1 if bust else end
+
+
+def turn_points(darts: bytes, finished: bool = False) -> list[int]:
+    """
+    X01-Punkte pro abgeschlossener Aufnahme (ohne Bust-Dart) –
+    wie ScoreboardState.score_last_turn.
+    finished=True: die letzte Aufnahme war das Checkout und zählt mit.
+    """
+    points = []
+    for turn, bust, closed in iter_turns(darts):
+        if closed or finished:
+            points.append(sum((turn[:-1] if bust else turn).translate(POINTS_TABLE)))
+    return points
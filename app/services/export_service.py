@@ -0,0 +1,195 @@
+"""
+Streaming-Export der Wurf-Historie (NDJSON oder CSV) für das Data Warehouse.
+
+- Liest über einen serverseitigen Cursor (`db.stream` + yield_per) in Blöcken von
+  `chunk_size` Zeilen – es liegen nie mehr als ein Block Zeilen im Speicher.
+- Reine Spalten-Query (Core-Rows statt ORM-Objekte), sortiert nach throws.id.
+- Pro Block wird EIN Text-Chunk erzeugt und an die StreamingResponse / Datei gegeben.
+
+Genutzt von GET /throws/export und `python -m app.scripts.export_throws`.
+"""
+import csv
+import io
+import json
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.models.game import Game
+from app.models.game_participant import GameParticipant
+from app.models.throw import Throw
+
+
+FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+COLUMNS = (
+    Throw.id.label("throw_id"),
+    Throw.game_id,
+    Game.game_mode_id,
+    Throw.participant_id,
+    GameParticipant.user_id,
+    Throw.turn_number,
+    Throw.throw_number_in_turn,
+    Throw.darts_thrown,
+    Throw.value,
+    Throw.multiplier,
+    (Throw.value * Throw.multiplier).label("score"),
+    Throw.timestamp,
+)
+FIELDS = [column.key for column in COLUMNS]
+
+
+@dataclass(slots=True)
+class ExportFilter:
+    game_id: int | None = None
+    user_id: int | None = None
+    game_mode_id: int | None = None
+    since: datetime | None = None     # inklusive
+    until: datetime | None = None     # exklusive
+    member_id: int | None = None      # nur Spiele, an denen dieser User teilnimmt (HTTP-Export)
+
+
+def export_query(filters: ExportFilter):
+    query = (
+        select(*COLUMNS)
+        .join(GameParticipant, GameParticipant.id == Throw.participant_id)
+        .join(Game, Game.id == Throw.game_id)
+    )
+    if filters.member_id is not None:
+        own_games = select(GameParticipant.game_id).where(GameParticipant.user_id == filters.member_id)
+        query = query.where(Throw.game_id.in_(own_games))
+    if filters.game_id is not None:
+        query = query.where(Throw.game_id == filters.game_id)
+    if filters.user_id is not None:
+        query = query.where(GameParticipant.user_id == filters.user_id)
+    if filters.game_mode_id is not None:
+        query = query.where(Game.game_mode_id == filters.game_mode_id)
+    if filters.since is not None:
+        query = query.where(Throw.timestamp >= filters.since)
+    if filters.until is not None:
+        query = query.where(Throw.timestamp < filters.until)
+    return query.order_by(Throw.id)
+
+
+# ============================================================
+# Kodierung (ein Chunk pro Block)
+# ============================================================
+
+def _plain(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def encode_ndjson(rows, header: bool = False) -> str:
+    return "".join(
+        json.dumps(dict(zip(FIELDS, map(_plain, row))), separators=(",", ":")) + "\n" for row in rows
+    )
+
+
+def encode_csv(rows, header: bool = False) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if header:
+        writer.writerow(FIELDS)
+    writer.writerows(tuple(map(_plain, row)) for row in rows)
+    return buffer.getvalue()
+
+
+ENCODERS = {"ndjson": encode_ndjson, "csv": encode_csv}
+
+
+# ============================================================
+# Metriken
+# ============================================================
+
+@dataclass(slots=True)
+class ExportRun:
+    format: str
+    rows: int = 0
+    chunks: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "format": self.format,
+            "rows": self.rows,
+            "chunks": self.chunks,
+            "seconds": round(self.seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+
+class ExportMetrics:
+
+    def __init__(self):
+        self.exports = 0
+        self.failed_exports = 0
+        self.rows = 0
+        self.last: ExportRun | None = None
+
+    def record(self, run: ExportRun, failed: bool = False) -> None:
+        self.exports += 1
+        self.failed_exports += failed
+        self.rows += run.rows
+        self.last = run
+
+    def stats(self) -> dict:
+        return {
+            "exports": self.exports,
+            "failed_exports": self.failed_exports,
+            "rows": self.rows,
+            "last": self.last.as_dict() if self.last else None,
+        }
+
+
+export_metrics = ExportMetrics()
+
+
+# ============================================================
+# Export
+# ============================================================
+
+class ExportService:
+
+    @staticmethod
+    async def stream(
+        db: AsyncSession,
+        filters: ExportFilter,
+        fmt: str = "ndjson",
+        chunk_size: int = 5000,
+        run: ExportRun | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Text-Chunks des Exports. `run` (optional) wird laufend fortgeschrieben –
+        so sieht der Aufrufer Zeilen und Zeilen/s auch bei Abbruch.
+        """
+        encode = ENCODERS[fmt]
+        run = run or ExportRun(fmt)
+        started = time.perf_counter()
+        failed = True
+        try:
+            result = await db.stream(export_query(filters).execution_options(yield_per=chunk_size))
+            header = True
+            async for rows in result.partitions(chunk_size):
+                yield encode(rows, header=header)
+                header = False
+                run.rows += len(rows)
+                run.chunks += 1
+                run.seconds = time.perf_counter() - started
+            # Leerer Export: CSV trotzdem mit Kopfzeile
+            if header and fmt == "csv":
+                yield encode([], header=True)
+            failed = False
+        finally:
+            run.seconds = time.perf_counter() - started
+            export_metrics.record(run, failed=failed)
@@ -1,6 +1,8 @@
 from app.models.game_participant import GameParticipant
 from app.models.throw import Throw
 from app.models.game import Game
+from app.services.game_rules import GameRules, get_rules
+from app.services.cricket_engine import CricketEngine
 
 
 class GameEngine:
@@ -10,7 +12,7 @@ class GameEngine:
     """
 
     @staticmethod
-    def apply_throw(game: Game, participant: GameParticipant, throw: Throw) -> dict:
+    def apply_throw(game: Game, participant: GameParticipant, throw: Throw, rules: GameRules | None = None) -> dict:
         """
         Entscheidet, welche Spiellogik angewendet wird.
         Gibt zurück:
@@ -20,81 +22,79 @@ class GameEngine:
         }
         """
 
-        mode = game.game_mode  # enthält: starting_score, scoring_type, checkout_rule, name
+        # Kompiliertes Regelwerk (einmal pro game_mode_id gecacht)
+        rules = rules or get_rules(game)
 
-        # Dynamisch entscheiden
-        if mode.scoring_type == "subtract":
-            return GameEngine._play_subtract_mode(participant, throw, mode)
+        handler = SCORING_HANDLERS.get(rules.scoring_type)
+        if handler is None:
+            raise ValueError(f"Unsupported scoring_type: {rules.scoring_type}")
 
-        elif mode.scoring_type == "add":
-            return GameEngine._play_add_mode(participant, throw, mode)
-
-        else:
-            raise ValueError(f"Unsupported scoring_type: {mode.scoring_type}")
+        return handler(game, participant, throw, rules)
 
     # -------------------------------------------------------------------------
     # 1️⃣ Klassische X01-Modi (subtract)
     # -------------------------------------------------------------------------
     @staticmethod
-    def _play_subtract_mode(participant: GameParticipant, throw: Throw, mode) -> dict:
+    def _play_subtract_mode(game: Game, participant: GameParticipant, throw: Throw, rules: GameRules) -> dict:
         """
-        Standard X01 Regelwerk: subtract scoring + optional checkout rules.
+        Standard X01 Regelwerk: subtract scoring + optional check-in / checkout rules.
         """
+        current_score = participant.current_score
+
+        # 🚪 Double-In: Darts zählen erst ab dem ersten gültigen Check-in
+        if rules.checkin_multipliers is not None and throw.multiplier not in rules.checkin_multipliers:
+            starting_score = getattr(participant, "starting_score", None) or rules.starting_score
+            if current_score == starting_score:
+                return {"status": "OK", "remaining": current_score}
+
         points = throw.value * throw.multiplier
-        new_score = participant.current_score - points
+        new_score = current_score - points
 
         # ❌ Überworfen
         if new_score < 0:
-            return {"status": "BUST", "remaining": participant.current_score}
+            return {"status": "BUST", "remaining": current_score}
 
-        # ❌ 1 Punkt = nicht auscheckbar → Bust (nur bei Double-Out)
-        if new_score == 1 and mode.checkout_rule == "double":
-            return {"status": "BUST", "remaining": participant.current_score}
+        # ❌ 1 Punkt = nicht auscheckbar → Bust (Double-/Master-Out)
+        if new_score == 1 and rules.bust_on_one:
+            return {"status": "BUST", "remaining": current_score}
 
         # 🎯 Sieg?
         if new_score == 0:
-            if GameEngine._is_valid_checkout(throw, mode):
+            if GameEngine._is_valid_checkout(throw, rules):
                 participant.current_score = 0
                 return {"status": "WIN", "remaining": 0}
             else:
-                return {"status": "BUST", "remaining": participant.current_score}
+                return {"status": "BUST", "remaining": current_score}
 
         # ✔ Normaler Treffer
         participant.current_score = new_score
         return {"status": "OK", "remaining": new_score}
 
     # -------------------------------------------------------------------------
-    # 2️⃣ Add-Modi (Cricket, Shanghai etc.)
+    # 2️⃣ Add-Modi (Cricket) → siehe CricketEngine
     # -------------------------------------------------------------------------
     @staticmethod
-    def _play_add_mode(participant: GameParticipant, throw: Throw, mode) -> dict:
+    def _play_add_mode(game: Game, participant: GameParticipant, throw: Throw, rules: GameRules) -> dict:
         """
-        Beispielhafte add-Logic (kann später erweitert werden).
+        Cricket: Marks sammeln, Zahlen schließen, auf offenen Zahlen punkten.
         """
-        points = throw.value * throw.multiplier
-        participant.current_score += points
-
-        # Keine Busts, keine Checkout-Regeln
-        return {
-            "status": "OK",
-            "remaining": participant.current_score
-        }
+        return CricketEngine.play(game, participant, throw, rules)
 
     # -------------------------------------------------------------------------
     # 3️⃣ Checkout-Regel prüfen
     # -------------------------------------------------------------------------
     @staticmethod
-    def _is_valid_checkout(throw: Throw, mode) -> bool:
+    def _is_valid_checkout(throw: Throw, rules: GameRules) -> bool:
         """
         Prüft, ob der Wurf ein gültiges Checkout ist.
-        mode.checkout_rule: "double", "straight", None
+        rules.finish_multipliers: None → jedes Finish erlaubt (straight / keine Regel)
         """
+        return rules.finish_multipliers is None or throw.multiplier in rules.finish_multipliers
 
-        if mode.checkout_rule == "double":
-            return throw.multiplier == 2 or (throw.value == 25 and throw.multiplier == 2)
-
-        if mode.checkout_rule == "straight":
-            return True
 
-        # Keine Checkout-Regel → alles erlaubt
-        return True
\ No newline at end of file
+# scoring_type → Handler(game, participant, throw, rules). Neue Spielvarianten registrieren sich hier,
+# apply_throw selbst muss dafür nicht angepasst werden.
+SCORING_HANDLERS = {
+    "subtract": GameEngine._play_subtract_mode,
+    "add": GameEngine._play_add_mode,
+}
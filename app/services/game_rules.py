@@ -0,0 +1,101 @@
+from dataclasses import dataclass
+
+# ---------------------------------------------------------
+# Regeltabellen: Regel-String → erlaubte Multiplikatoren
+# (None = jeder Dart zählt). Neue Varianten nur hier eintragen.
+# ---------------------------------------------------------
+CHECKOUT_MULTIPLIERS: dict[str, frozenset[int]] = {
+    "double": frozenset({2}),
+    "master": frozenset({2, 3}),
+}
+CHECKIN_MULTIPLIERS: dict[str, frozenset[int]] = {
+    "double": frozenset({2}),
+    "master": frozenset({2, 3}),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class GameRules:
+    """
+    Einmal pro GameMode kompiliertes, unveränderliches Regelwerk.
+    Die GameEngine liest nur noch diese Felder statt Strings zu vergleichen.
+    """
+    game_mode_id: int | None
+    scoring_type: str
+    starting_score: int | None
+    checkout_rule: str | None
+    checkin_rule: str | None
+    finish_multipliers: frozenset[int] | None  # erlaubte Multiplikatoren für den letzten Dart
+    checkin_multipliers: frozenset[int] | None  # erlaubte Multiplikatoren für den ersten Treffer
+    bust_on_one: bool  # Rest 1 ist nicht auscheckbar → BUST
+
+
+def build_rules(
+    scoring_type: str = "subtract",
+    starting_score: int | None = None,
+    checkout_rule: str | None = None,
+    checkin_rule: str | None = None,
+    game_mode_id: int | None = None,
+) -> GameRules:
+    finish = CHECKOUT_MULTIPLIERS.get(checkout_rule)
+    return GameRules(
+        game_mode_id=game_mode_id,
+        scoring_type=scoring_type,
+        starting_score=starting_score,
+        checkout_rule=checkout_rule,
+        checkin_rule=checkin_rule,
+        finish_multipliers=finish,
+        checkin_multipliers=CHECKIN_MULTIPLIERS.get(checkin_rule),
+        # Ohne Single-Finish gibt es keinen Dart, der genau 1 Punkt auscheckt
+        bust_on_one=finish is not None and 1 not in finish,
+    )
+
+
+def compile_rules(mode) -> GameRules:
+    """Übersetzt ein GameMode-Objekt (ORM oder Mock) in ein GameRules-Objekt."""
+    return build_rules(
+        scoring_type=mode.scoring_type,
+        starting_score=getattr(mode, "starting_score", None),
+        checkout_rule=getattr(mode, "checkout_rule", None),
+        checkin_rule=getattr(mode, "checkin_rule", None),
+        game_mode_id=getattr(mode, "id", None),
+    )
+
+
+# ---------------------------------------------------------
+# Cache: game_mode_id → GameRules
+# ---------------------------------------------------------
+_RULES_CACHE: dict[int, GameRules] = {}
+
+
+def get_rules(game) -> GameRules:
+    """
+    Liefert die Regeln eines Spiels. Nach dem ersten Zugriff pro game_mode_id
+    ist das ein reiner Dict-Lookup (kein Zugriff auf game.game_mode mehr).
+    """
+    mode_id = getattr(game, "game_mode_id", None)
+    rules = _RULES_CACHE.get(mode_id) if mode_id is not None else None
+    if rules is None:
+        rules = compile_rules(game.game_mode)
+        if mode_id is not None and rules.game_mode_id == mode_id:
+            _RULES_CACHE[mode_id] = rules
+    return rules
+
+
+def invalidate_rules(game_mode_id: int | None = None) -> None:
+    """Verwirft kompilierte Regeln (z. B. nach Änderung eines GameModes)."""
+    if game_mode_id is None:
+        _RULES_CACHE.clear()
+    else:
+        _RULES_CACHE.pop(game_mode_id, None)
+
+
+def get_rules_for_mode_id(game_mode_id: int, factory) -> GameRules:
+    """
+    Wie get_rules, aber ohne Game-Objekt (z. B. beim Laden des Live-Caches aus Spalten).
+    `factory` baut die Regeln nur beim ersten Zugriff pro game_mode_id.
+    """
+    rules = _RULES_CACHE.get(game_mode_id)
+    if rules is None:
+        rules = _RULES_CACHE[game_mode_id] = factory()
+    return rules
@@ -4,6 +4,7 @@ from fastapi import HTTPException, status
 from app.crud.game_crud import (
     create_game,
     get_game_raw,
+    get_game_entity as get_game_full,
     finish_game as finish_game_crud,
 )
 from app.crud.game_participant_crud import (
@@ -11,6 +12,7 @@ from app.crud.game_participant_crud import (
 )
 from app.models.user import User
 from app.models.game_mode import GameMode
+from app.services.game_state_cache import live_games
 
 
 class GameService:
@@ -36,7 +38,8 @@ class GameService:
 
     @staticmethod
     async def load_game(db: AsyncSession, game_id: int, user_id: int):
-        game = await get_game_raw(db, game_id)
+        # Profil "game_list": Teilnehmer + Usernamen + Modus für GameOut
+        game = await get_game_full(db, game_id)
         if not game:
             raise HTTPException(status_code=404, detail="Game not found")
 
@@ -49,10 +52,12 @@ class GameService:
     @staticmethod
     async def finish_game(db: AsyncSession, game_id: int):
         game = await finish_game_crud(db, game_id)
+        # Beendete Spiele brauchen keinen Live-Zustand mehr
+        live_games.invalidate(game_id)
         if not game:
             raise HTTPException(status_code=404, detail="Game not found")
         return game
 
     @staticmethod
     async def get_game_full(db: AsyncSession, game_id: int):
-        return await get_game_raw(db, game_id)
\ No newline at end of file
+        return await get_game_full(db, game_id)
\ No newline at end of file
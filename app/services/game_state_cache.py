@@ -0,0 +1,317 @@
+"""
+Prozess-lokaler Cache für laufende Spiele.
+
+Pro Spiel wird nur ein kompakter Zustand gehalten (Scores, Wurfposition, Turn-Zeiger,
+kompilierte Regeln) – keine ORM-Objekte. ThrowService & Co. arbeiten auf diesem Zustand
+und schreiben nur noch durch (write-through) in die Datenbank.
+
+Verdrängung:
+- LRU: mehr als `max_games` Spiele → das am längsten nicht benutzte fliegt raus
+- Idle-TTL: Spiele ohne Zugriff seit `idle_ttl` Sekunden gelten als abgelaufen
+
+Konfiguration über LIVE_GAME_CACHE_SIZE / LIVE_GAME_CACHE_TTL.
+"""
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import game_crud, throw_crud
+from app.services.dart_codec import append_dart, dart_count
+from app.services.game_rules import GameRules, build_rules, get_rules_for_mode_id
+
+
+@dataclass(slots=True)
+class ParticipantState:
+    """Kompakter Teilnehmer-Zustand (gleiche Attributnamen wie GameParticipant → GameEngine/TurnService-kompatibel)."""
+    id: int
+    user_id: int
+    username: str
+    starting_score: int
+    current_score: int
+    cricket_marks: int
+    turn_number: int
+    throw_in_turn: int
+    darts_thrown: int
+    darts: bytearray = field(default_factory=bytearray, repr=False)   # Feld-Codes, siehe dart_codec
+    turn_closed: bool = False   # seit dem letzten Schreiben eine Aufnahme beendet → Puffer mitschreiben
+
+
+@dataclass(slots=True)
+class ScoreboardState:
+    """Spiegel der Scoreboard-Spalten einer game_participants-Zeile."""
+    participant_id: int
+    game_id: int
+    turn_start_score: int
+    score_last_turn: int | None = None
+    dart1_score: int | None = None
+    dart2_score: int | None = None
+    dart3_score: int | None = None
+    turns_completed: int = 0
+    first9_points: int = 0
+    highest_score: int = 0
+    checkout_attempts: int = 0
+    checkouts: int = 0
+    best_leg: int | None = None
+
+
+@dataclass(slots=True)
+class LiveGameState:
+    """Kompakter Spielzustand. `participants` in Spielreihenfolge (wie Game.participants)."""
+    game_id: int
+    game_mode_id: int
+    status: str | None
+    current_turn_user_id: int | None
+    rules: GameRules
+    participants: list[ParticipantState]
+    start_time: datetime | None = None
+    end_time: datetime | None = None
+    # Scoreboard-Read-Model pro participant_id (Spiegel der Scoreboard-Spalten von game_participants)
+    scoreboard: dict[int, ScoreboardState] = field(default_factory=dict, repr=False)
+    last_access: float = 0.0
+    # Turn-Zeiger/Status seit dem letzten Write-through geändert → games-Zeile muss mitgeschrieben werden
+    dirty: bool = False
+    # serialisiert Würfe auf dasselbe Spiel (Zustand + Write-through bleiben konsistent)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False, compare=False)
+
+    def participant(self, participant_id: int) -> ParticipantState | None:
+        return next((p for p in self.participants if p.id == participant_id), None)
+
+    def participant_by_user(self, user_id: int | None) -> ParticipantState | None:
+        return next((p for p in self.participants if p.user_id == user_id), None)
+
+
+def build_state(rows) -> LiveGameState:
+    """Baut den Zustand aus den Zeilen von game_crud.get_live_game_rows."""
+    first = rows[0]
+    rules = get_rules_for_mode_id(
+        first.game_mode_id,
+        lambda: build_rules(
+            scoring_type=first.scoring_type,
+            starting_score=first.mode_starting_score,
+            checkout_rule=first.checkout_rule,
+            checkin_rule=first.checkin_rule,
+            game_mode_id=first.game_mode_id,
+        ),
+    )
+    participants = [
+        ParticipantState(
+            id=r.participant_id,
+            user_id=r.user_id,
+            username=r.username,
+            starting_score=r.starting_score,
+            current_score=r.current_score,
+            cricket_marks=r.cricket_marks or 0,
+            turn_number=r.turn_number or 0,
+            throw_in_turn=r.throw_in_turn or 0,
+            darts_thrown=r.darts_thrown or 0,
+            darts=bytearray(r.darts or b""),
+        )
+        for r in rows
+        if r.participant_id is not None
+    ]
+    scoreboard = {
+        r.participant_id: ScoreboardState(
+            participant_id=r.participant_id,
+            game_id=r.game_id,
+            turn_start_score=r.sb_turn_start_score,
+            score_last_turn=r.sb_score_last_turn,
+            dart1_score=r.sb_dart1_score,
+            dart2_score=r.sb_dart2_score,
+            dart3_score=r.sb_dart3_score,
+            turns_completed=r.sb_turns_completed,
+            first9_points=r.sb_first9_points,
+            highest_score=r.sb_highest_score,
+            checkout_attempts=r.sb_checkout_attempts,
+            checkouts=r.sb_checkouts,
+            best_leg=r.sb_best_leg,
+        )
+        if r.sb_turn_start_score is not None
+        # Noch kein Dart geworfen → leerer Eintrag ab dem aktuellen Score
+        else ScoreboardState(participant_id=r.participant_id, game_id=r.game_id, turn_start_score=r.current_score)
+        for r in rows
+        if r.participant_id is not None
+    }
+    return LiveGameState(
+        game_id=first.game_id,
+        game_mode_id=first.game_mode_id,
+        status=first.status,
+        current_turn_user_id=first.current_turn_user_id,
+        rules=rules,
+        participants=participants,
+        start_time=first.start_time,
+        end_time=first.end_time,
+        scoreboard=scoreboard,
+    )
+
+
+async def restore_open_turns(db: AsyncSession, state: LiveGameState) -> LiveGameState:
+    """
+    game_participants.darts wird nur mit abgeschlossener Aufnahme geschrieben – die Darts einer
+    offenen Aufnahme (1–2, nie ein Bust) aus throws nachladen. Eine Query, nur wenn nötig.
+    """
+    missing = {
+        p.id: p for p in state.participants
+        if p.throw_in_turn in (1, 2) and dart_count(p.darts) < p.darts_thrown
+    }
+    if missing:
+        rows = await throw_crud.get_open_turn_darts(db, [(p.id, p.turn_number) for p in missing.values()])
+        for participant_id, value, multiplier in rows:
+            append_dart(missing[participant_id].darts, value, multiplier)
+    return state
+
+
+class LiveGameCache:
+    """
+    LRU + Idle-TTL über einem OrderedDict (älteste Einträge vorne).
+    Zähler für Hits / Misses / Evictions / Expirations zum Dimensionieren.
+    """
+
+    def __init__(self, max_games: int = 512, idle_ttl: float = 1800.0, clock=time.monotonic):
+        self.max_games = max_games
+        self.idle_ttl = idle_ttl
+        self._clock = clock
+        self._entries: OrderedDict[int, LiveGameState] = OrderedDict()
+        # Laufende Cache-Miss-Ladevorgänge: game_id → Future des Zustands (Singleflight)
+        self._loading: dict[int, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.coalesced_loads = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, game_id: int) -> bool:
+        return game_id in self._entries
+
+    # -------------------------------------------------------------------------
+    # Lesen / Schreiben
+    # -------------------------------------------------------------------------
+    def get(self, game_id: int) -> LiveGameState | None:
+        state = self._entries.get(game_id)
+        if state is None:
+            self.misses += 1
+            return None
+
+        now = self._clock()
+        if now - state.last_access > self.idle_ttl:
+            del self._entries[game_id]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        state.last_access = now
+        self._entries.move_to_end(game_id)
+        self.hits += 1
+        return state
+
+    def put(self, state: LiveGameState) -> None:
+        now = self._clock()
+        state.last_access = now
+        self._entries[state.game_id] = state
+        self._entries.move_to_end(state.game_id)
+        self._evict(now)
+
+    def invalidate(self, game_id: int) -> None:
+        """Verwirft ein Spiel (z. B. nach Änderungen außerhalb des Wurf-Pfads)."""
+        self._entries.pop(game_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._loading.clear()
+        self.hits = self.misses = self.evictions = self.expirations = self.coalesced_loads = 0
+
+    def _evict(self, now: float) -> None:
+        # Vorne liegen die am längsten unbenutzten Spiele → abgelaufene zuerst, dann LRU
+        while self._entries:
+            oldest = next(iter(self._entries.values()))
+            expired = now - oldest.last_access > self.idle_ttl
+            if not expired and len(self._entries) <= self.max_games:
+                break
+            self._entries.popitem(last=False)
+            if expired:
+                self.expirations += 1
+            else:
+                self.evictions += 1
+
+    # -------------------------------------------------------------------------
+    # Laden (Cache-Miss → eine Query)
+    # -------------------------------------------------------------------------
+    async def load(self, db: AsyncSession, game_id: int, populate: bool = True) -> LiveGameState | None:
+        """
+        Zustand aus dem Cache oder (Miss) aus der DB.
+        populate=False: nicht cachen – für Lesezugriffe über eine Replica, deren Stand
+        hinter dem Primary liegen kann (der Wurf-Pfad darf darauf nicht aufsetzen).
+        """
+        state = self.get(game_id)
+        if state is not None:
+            return state
+
+        if not populate:
+            rows = await game_crud.get_live_game_rows(db, game_id)
+            return await restore_open_turns(db, build_state(rows)) if rows else None
+
+        # Singleflight: gleichzeitige Misses für dasselbe Spiel teilen sich EINEN Zustand
+        # (und damit EIN Lock) – sonst würfen Requests auf verwaiste Kopien.
+        pending = self._loading.get(game_id)
+        if pending is not None:
+            self.coalesced_loads += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if asyncio.current_task().cancelling() or not pending.cancelled():
+                    raise
+                # Der ladende Request wurde abgebrochen, nicht wir → selbst laden
+                return await self.load(db, game_id)
+
+        future = asyncio.get_running_loop().create_future()
+        self._loading[game_id] = future
+        try:
+            rows = await game_crud.get_live_game_rows(db, game_id)
+            state = await restore_open_turns(db, build_state(rows)) if rows else None
+            # Während der Awaits per put() eingetragen? Dann diesen Zustand verwenden
+            if game_id in self._entries:
+                state = self._entries[game_id]
+            elif state is not None:
+                self.put(state)
+            future.set_result(state)
+            return state
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # als abgerufen markieren, falls niemand wartet
+            raise
+        finally:
+            if self._loading.get(game_id) is future:
+                del self._loading[game_id]
+
+    # -------------------------------------------------------------------------
+    # Metriken
+    # -------------------------------------------------------------------------
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_games": self.max_games,
+            "idle_ttl": self.idle_ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "coalesced_loads": self.coalesced_loads,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+live_games = LiveGameCache(
+    max_games=int(os.getenv("LIVE_GAME_CACHE_SIZE", 512)),
+    idle_ttl=float(os.getenv("LIVE_GAME_CACHE_TTL", 1800)),
+)
@@ -0,0 +1,477 @@
+"""
+Bulk-Import historischer Matches (NDJSON oder CSV), z. B. aus einer alten Liga-Datenbank.
+
+Ablauf pro Block von `chunk_size` Matches:
+1.	Jedes Match wird komplett im Speicher nachgespielt – gleicher Pfad wie live
+	(ValidationService für Werte und Reihenfolge, GameEngine/TurnService/Scoreboard über
+	ThrowService.apply_to_state). Ungültige Matches werden abgelehnt, nicht abgebrochen.
+2.	Fehlende User, Spiele und Teilnehmer per Bulk-INSERT … RETURNING (IDs werden gebraucht),
+	alle Throws per COPY (Postgres/asyncpg) bzw. executemany (SQLite).
+3.	Sieg/Niederlage-Zähler, Dart-Statistiken (StatsBatch aus dem Nachspielen →
+	stat_accumulators.write) + Fortschritt (import_jobs.records_done) → EIN Commit pro Block.
+	Die Bestenlisten bekommen die neuen Werte nach dem Commit (leaderboards.update).
+
+Bricht ein Lauf ab, setzt ein neuer Lauf mit gleichem Namen nach dem letzten committeten
+Block wieder auf – Statistiken und Würfe sind immer auf demselben Stand.
+
+Matches ohne Checkout werden als "aborted" gespeichert (wie abgebrochene Simulationen). Wie live
+zählen ihre Darts zur Dart-Statistik, das Match aber nicht zu games_played/wins/losses –
+die werden live erst bei Spielende fortgeschrieben.
+
+NDJSON – ein Match pro Zeile:
+    {"external_id": "m1", "game_mode": "501", "started_at": "2024-03-01T19:00:00+00:00",
+     "players": ["anna", "ben"],
+     "throws": [{"player": "anna", "value": 20, "multiplier": 3, "timestamp": "..."}, ...]}
+
+CSV – ein Dart pro Zeile, Matches = aufeinanderfolgende Zeilen mit gleicher match_id,
+Spielerreihenfolge = Reihenfolge des ersten Auftretens:
+    match_id,game_mode,started_at,player,value,multiplier,timestamp
+
+`game_mode` ist der Name oder die ID eines Spielmodus; `timestamp` ist optional (sonst started_at).
+"""
+import csv
+import json
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, UTC
+from typing import Iterable, Iterator
+
+from fastapi import HTTPException
+from sqlalchemy import insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.crud import scoreboard_crud
+from app.models.game import Game
+from app.models.game_mode import GameMode
+from app.models.game_participant import GameParticipant
+from app.models.import_job import ImportJob
+from app.models.throw import Throw
+from app.models.user import User
+from app.services.game_rules import compile_rules, get_rules_for_mode_id
+from app.services.game_state_cache import LiveGameState, ParticipantState, ScoreboardState
+from app.services.leaderboard_service import leaderboards
+from app.services.statistics_service import StatsBatch, lock_statistics, stat_accumulators
+from app.services.throw_service import ThrowService
+from app.services.throw_validation_service import ValidationService
+
+
+FORMATS = ("ndjson", "csv")
+CSV_FIELDS = ("match_id", "game_mode", "started_at", "player", "value", "multiplier", "timestamp")
+
+# Importierte User haben kein Passwort: kein gültiger Hash → Login unmöglich (verify_password → False)
+UNUSABLE_PASSWORD = "!"
+IMPORTED_EMAIL_DOMAIN = "imported.invalid"
+
+# Abgelehnte Matches: so viele Gründe landen in der Zusammenfassung
+MAX_REPORTED_REJECTIONS = 100
+
+
+# ============================================================
+# Einlesen
+# ============================================================
+
+@dataclass(slots=True)
+class MatchRecord:
+    """Ein Match aus der Importdatei. `error` = Datensatz nicht lesbar (wird abgelehnt)."""
+    external_id: str | None
+    game_mode: str | None = None
+    started_at: datetime | None = None
+    players: list[str] = field(default_factory=list)
+    throws: list[tuple] = field(default_factory=list)   # (player, value, multiplier, timestamp | None)
+    error: str | None = None
+
+
+def parse_timestamp(value) -> datetime | None:
+    """ISO-8601 → datetime (ohne Zeitzone = UTC)."""
+    if value in (None, ""):
+        return None
+    timestamp = datetime.fromisoformat(value)
+    return timestamp if timestamp.tzinfo else timestamp.replace(tzinfo=UTC)
+
+
+def parse_ndjson(lines: Iterable[str]) -> Iterator[MatchRecord]:
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+            players = data.get("players") or list(dict.fromkeys(t["player"] for t in data["throws"]))
+            yield MatchRecord(
+                external_id=data.get("external_id"),
+                game_mode=str(data["game_mode"]),
+                started_at=parse_timestamp(data.get("started_at")),
+                players=[str(p) for p in players],
+                throws=[
+                    (str(t["player"]), int(t["value"]), int(t.get("multiplier", 1)), parse_timestamp(t.get("timestamp")))
+                    for t in data["throws"]
+                ],
+            )
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            yield MatchRecord(external_id=f"line {number}", error=f"Unreadable record: {e!r}")
+
+
+def parse_csv(lines: Iterable[str]) -> Iterator[MatchRecord]:
+    record: MatchRecord | None = None
+    for row in csv.DictReader(lines):
+        match_id = row.get("match_id")
+        if record is None or match_id != record.external_id:
+            if record is not None:
+                yield record
+            record = MatchRecord(external_id=match_id)
+            try:
+                record.game_mode = row["game_mode"]
+                record.started_at = parse_timestamp(row.get("started_at"))
+            except (ValueError, KeyError) as e:
+                record.error = f"Unreadable record: {e!r}"
+        if record.error:
+            continue
+        try:
+            player = row["player"]
+            record.throws.append(
+                (player, int(row["value"]), int(row.get("multiplier") or 1), parse_timestamp(row.get("timestamp")))
+            )
+            if player not in record.players:
+                record.players.append(player)
+        except (ValueError, KeyError, TypeError) as e:
+            record.error = f"Unreadable record: {e!r}"
+    if record is not None:
+        yield record
+
+
+PARSERS = {"ndjson": parse_ndjson, "csv": parse_csv}
+
+
+# ============================================================
+# Nachspielen im Speicher
+# ============================================================
+
+@dataclass(slots=True)
+class PreparedMatch:
+    """Ein gültiges, fertig nachgespieltes Match (IDs noch vorläufig: negativ bzw. 0)."""
+    record: MatchRecord
+    state: LiveGameState
+    rows: list[dict]
+    stats: StatsBatch
+    winner: ParticipantState | None
+    started_at: datetime
+    ended_at: datetime
+
+
+def prepare_match(record: MatchRecord, modes: dict[str, GameMode]) -> PreparedMatch:
+    """Spielt ein Match Dart für Dart nach. ValueError = Match wird abgelehnt (mit Grund)."""
+    if record.error:
+        raise ValueError(record.error)
+    mode = modes.get(record.game_mode)
+    if mode is None:
+        raise ValueError(f"Unknown game mode: {record.game_mode}")
+    if not record.players or len(set(record.players)) != len(record.players):
+        raise ValueError("Players must be non-empty and unique")
+    if not record.throws:
+        raise ValueError("Match has no throws")
+
+    rules = get_rules_for_mode_id(mode.id, lambda: compile_rules(mode))
+    start = mode.starting_score or 0
+    participants = [
+        ParticipantState(
+            id=-index, user_id=-index, username=name,
+            starting_score=start, current_score=start,
+            cricket_marks=0, turn_number=0, throw_in_turn=0, darts_thrown=0,
+        )
+        for index, name in enumerate(record.players, start=1)
+    ]
+    state = LiveGameState(
+        game_id=0,
+        game_mode_id=mode.id,
+        status="ongoing",
+        current_turn_user_id=participants[0].user_id,
+        rules=rules,
+        participants=participants,
+        start_time=record.started_at,
+    )
+    by_name = {p.username: p for p in participants}
+
+    rows, winner, stats = [], None, StatsBatch()
+    for number, (player, value, multiplier, timestamp) in enumerate(record.throws, start=1):
+        if winner is not None:
+            raise ValueError(f"Dart {number}: match was already won by {winner.username}")
+        participant = by_name.get(player)
+        if participant is None:
+            raise ValueError(f"Dart {number}: unknown player {player!r}")
+        timestamp = timestamp or record.started_at
+        if timestamp is None:
+            raise ValueError(f"Dart {number}: no timestamp and no started_at")
+        try:
+            ValidationService.validate_throw_values(value, multiplier)
+            ValidationService.ensure_player_turn(state, participant)
+        except HTTPException as e:
+            raise ValueError(f"Dart {number}: {e.detail}") from None
+
+        row, result = ThrowService.apply_to_state(state, participant, value, multiplier, timestamp, stats)
+        rows.append(row)
+        if result["status"] == "WIN":
+            winner = participant
+
+    state.status = "finished" if winner else "aborted"
+    return PreparedMatch(
+        record=record,
+        state=state,
+        rows=rows,
+        stats=stats,
+        winner=winner,
+        started_at=record.started_at or rows[0]["timestamp"],
+        ended_at=rows[-1]["timestamp"],
+    )
+
+
+# ============================================================
+# Bulk-Load
+# ============================================================
+
+async def copy_rows(db: AsyncSession, model, rows: list[dict]) -> None:
+    """
+    Lädt Zeilen in der Transaktion der Session: COPY auf Postgres (asyncpg),
+    sonst ein executemany-INSERT. Reihenfolge bleibt erhalten (wichtig für throws.id).
+    """
+    if not rows:
+        return
+    connection = await db.connection()
+    if connection.dialect.driver == "asyncpg":
+        raw = await connection.get_raw_connection()
+        columns = list(rows[0])
+        await raw.driver_connection.copy_records_to_table(
+            model.__tablename__,
+            records=[tuple(row[c] for c in columns) for row in rows],
+            columns=columns,
+        )
+    else:
+        await db.execute(insert(model), rows)
+
+
+async def ensure_users(db: AsyncSession, usernames: set[str]) -> tuple[dict[str, int], int]:
+    """username → user_id; fehlende User werden ohne Passwort angelegt. Gibt (Mapping, neu angelegt) zurück."""
+    result = await db.execute(select(User.username, User.id).where(User.username.in_(usernames)))
+    ids = dict(result.all())
+    missing = sorted(usernames - ids.keys())
+    if missing:
+        result = await db.execute(
+            insert(User).returning(User.username, User.id, sort_by_parameter_order=True),
+            [
+                {"username": name, "email": f"{name}@{IMPORTED_EMAIL_DOMAIN}", "password_hash": UNUSABLE_PASSWORD}
+                for name in missing
+            ],
+        )
+        ids.update(result.all())
+    return ids, len(missing)
+
+
+async def count_results(db: AsyncSession, matches: list[PreparedMatch]) -> None:
+    """Spiele/Siege/Niederlagen pro (User, Modus) – ein Zähler pro Match, nicht pro Dart. Nur beendete Matches."""
+    deltas: dict[tuple[int, int], list[int]] = {}
+    for match in matches:
+        if match.winner is None:
+            continue
+        for p in match.state.participants:
+            delta = deltas.setdefault((p.user_id, match.state.game_mode_id), [0, 0, 0])
+            delta[0] += 1
+            delta[1 if p is match.winner else 2] += 1
+    if not deltas:
+        return
+
+    rows = await lock_statistics(db, deltas)
+    for key, (played, wins, losses) in deltas.items():
+        row = rows[key]
+        row.games_played += played
+        row.wins += wins
+        row.losses += losses
+
+
+async def load_matches(db: AsyncSession, matches: list[PreparedMatch]) -> tuple[int, int, list]:
+    """
+    Schreibt einen Block nachgespielter Matches (ohne Commit).
+    Gibt (Throws, neue User, Bestenlisten-Werte für nach dem Commit) zurück.
+    """
+    if not matches:
+        return 0, 0, []
+    user_ids, users_created = await ensure_users(
+        db, {p.username for m in matches for p in m.state.participants}
+    )
+    batch = StatsBatch()
+    for match in matches:
+        real_ids = {}
+        for p in match.state.participants:
+            real_ids[p.user_id] = p.user_id = user_ids[p.username]
+        # Statistik des Nachspielens: vorläufige → echte User-IDs
+        for (user_id, mode_id, day), acc in match.stats.items():
+            batch.accumulator(real_ids[user_id], mode_id, day).merge(acc)
+
+    # 🎮 Spiele
+    game_ids = (await db.execute(
+        insert(Game).returning(Game.id, sort_by_parameter_order=True),
+        [
+            {
+                "game_mode_id": m.state.game_mode_id,
+                "user_id": m.state.participants[0].user_id,
+                "status": m.state.status,
+                "start_time": m.started_at,
+                "end_time": m.ended_at,
+                "first_shot": "host",
+                "first_to": 1,
+                "current_turn_user_id": None,
+            }
+            for m in matches
+        ],
+    )).scalars().all()
+    for match, game_id in zip(matches, game_ids):
+        match.state.game_id = game_id
+
+    # 👥 Teilnehmer (Endstand inkl. gepackter Darts und Scoreboard-Projektion)
+    participants = [(m, p) for m in matches for p in m.state.participants]
+    participant_ids = (await db.execute(
+        insert(GameParticipant).returning(GameParticipant.id, sort_by_parameter_order=True),
+        [
+            {
+                "game_id": m.state.game_id,
+                "user_id": p.user_id,
+                "starting_score": p.starting_score,
+                "current_score": p.current_score,
+                "finish_order": 1 if p is m.winner else None,
+                "cricket_marks": p.cricket_marks,
+                "turn_number": p.turn_number,
+                "throw_in_turn": p.throw_in_turn,
+                "darts_thrown": p.darts_thrown,
+                "darts": bytes(p.darts),
+                "joined_at": m.started_at,
+                "finished_at": m.ended_at if p is m.winner else None,
+                **scoreboard_crud.entry_values(
+                    m.state.scoreboard.get(p.id)
+                    or ScoreboardState(participant_id=p.id, game_id=m.state.game_id, turn_start_score=p.current_score)
+                ),
+            }
+            for m, p in participants
+        ],
+    )).scalars().all()
+    new_ids = {(id(m), p.id): new_id for (m, p), new_id in zip(participants, participant_ids)}
+
+    # 🎯 Throws mit den echten IDs
+    throws = []
+    for match in matches:
+        game_id = match.state.game_id
+        for row in match.rows:
+            throws.append({**row, "game_id": game_id, "participant_id": new_ids[(id(match), row["participant_id"])]})
+
+    await copy_rows(db, Throw, throws)
+    # 📈 Zuerst die Zähler, dann die Dart-Statistik: write() findet die neuen Zeilen und liefert vollständige Werte
+    await count_results(db, matches)
+    standings = await stat_accumulators.write(db, batch)
+    return len(throws), users_created, standings
+
+
+# ============================================================
+# Import-Lauf
+# ============================================================
+
+def summary(job: ImportJob, rejected: list[dict] | None = None, seconds: float = 0.0) -> dict:
+    return {
+        "name": job.name,
+        "format": job.format,
+        "status": job.status,
+        "records_done": job.records_done,
+        "matches_imported": job.matches_imported,
+        "matches_rejected": job.matches_rejected,
+        "throws_imported": job.throws_imported,
+        "users_created": job.users_created,
+        "error": job.error,
+        "rejected": rejected or [],
+        "seconds": round(seconds, 3),
+    }
+
+
+class ImportService:
+
+    @staticmethod
+    async def get_job(db: AsyncSession, name: str) -> ImportJob | None:
+        result = await db.execute(select(ImportJob).where(ImportJob.name == name))
+        return result.scalars().first()
+
+    @staticmethod
+    async def run(
+        db: AsyncSession,
+        lines: Iterable[str],
+        fmt: str,
+        name: str,
+        chunk_size: int = 200,
+    ) -> dict:
+        """
+        Importiert alle Matches aus `lines` (Zeilen der Datei) unter dem Job-Namen `name`.
+        Existiert der Job bereits (failed/running), werden die schon committeten Datensätze
+        übersprungen; ein abgeschlossener Job wird nicht erneut importiert.
+        """
+        if fmt not in PARSERS:
+            raise ValueError(f"Unsupported format: {fmt}")
+        started = time.perf_counter()
+
+        job = await ImportService.get_job(db, name)
+        if job is None:
+            job = ImportJob(
+                name=name, format=fmt, status="running", records_done=0, matches_imported=0,
+                matches_rejected=0, throws_imported=0, users_created=0,
+            )
+            db.add(job)
+            await db.commit()
+        elif job.format != fmt:
+            raise ValueError(f"Import {name!r} was started as {job.format}, not {fmt}")
+        elif job.status == "completed":
+            return summary(job, seconds=time.perf_counter() - started)
+        job_id, skip = job.id, job.records_done
+
+        modes = {}
+        for mode in (await db.scalars(select(GameMode))).all():
+            modes[mode.name] = modes[str(mode.id)] = mode
+
+        rejected: list[dict] = []
+        chunk: list[MatchRecord] = []
+        position = skip
+
+        async def flush() -> None:
+            nonlocal chunk
+            prepared = []
+            for offset, record in enumerate(chunk, start=position - len(chunk) + 1):
+                try:
+                    prepared.append(prepare_match(record, modes))
+                except ValueError as e:
+                    job.matches_rejected += 1
+                    if len(rejected) < MAX_REPORTED_REJECTIONS:
+                        rejected.append({"record": offset, "external_id": record.external_id, "reason": str(e)})
+            throws, users, standings = await load_matches(db, prepared)
+            job.records_done = position
+            job.matches_imported += len(prepared)
+            job.throws_imported += throws
+            job.users_created += users
+            job.status, job.error = "running", None
+            await db.commit()
+            leaderboards.update(standings)
+            chunk = []
+
+        try:
+            for number, record in enumerate(PARSERS[fmt](lines), start=1):
+                if number <= skip:
+                    continue
+                chunk.append(record)
+                position = number
+                if len(chunk) >= chunk_size:
+                    await flush()
+            if chunk:
+                await flush()
+        except Exception as e:
+            # Block verwerfen, Fortschritt der committeten Blöcke bleibt → Wiederaufnahme möglich
+            await db.rollback()
+            await db.execute(
+                update(ImportJob).where(ImportJob.id == job_id).values(status="failed", error=repr(e))
+            )
+            await db.commit()
+            raise
+
+        job.status = "completed"
+        await db.commit()
+        return summary(job, rejected, time.perf_counter() - started)
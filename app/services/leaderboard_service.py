@@ -0,0 +1,218 @@
+"""
+Bestenlisten (Siege, 3-Dart-Average, höchstes Checkout) – pro Spielmodus und gesamt.
+
+Jede Liste ist ein sortiertes Array aus (-Wert, user_id) plus user_id → Wert:
+- Rang eines Users: bisect → O(log n) (gleiche Werte = gleicher Rang: 1, 1, 3)
+- Seite (offset, limit): Slice → O(k)
+- Update: alten Schlüssel per bisect finden, entfernen, neuen per insort einfügen
+
+Quelle ist die statistics-Tabelle (persistent): alle Werte sind dort Spalten.
+Beim Start (und alle LEADERBOARD_REFRESH_INTERVAL Sekunden, für andere Worker) wird
+daraus neu aufgebaut; dazwischen schreibt jeder Statistik-Flush die geänderten Zeilen fort.
+"""
+import asyncio
+import logging
+import os
+from bisect import bisect_left, insort
+from typing import NamedTuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.models.statistic import Statistic
+
+
+logger = logging.getLogger(__name__)
+
+METRICS = ("wins", "average", "highest_checkout")
+
+
+class Standing(NamedTuple):
+    """Die für Bestenlisten relevanten Werte einer statistics-Zeile (vor dem Commit kopiert)."""
+    user_id: int
+    game_mode_id: int | None
+    wins: int
+    total_throws: int
+    average_score_per_throw: float
+    highest_checkout: int
+
+
+def standing(row: Statistic) -> Standing:
+    return Standing(
+        row.user_id, row.game_mode_id, row.wins,
+        row.total_throws, row.average_score_per_throw, row.highest_checkout,
+    )
+
+
+def combine(user_id: int, standings) -> Standing:
+    """Gesamtwerte eines Users über alle Modi (Average nach Darts gewichtet)."""
+    wins = throws = checkout = 0
+    points = 0.0
+    for s in standings:
+        wins += s.wins
+        throws += s.total_throws
+        points += s.average_score_per_throw * s.total_throws
+        checkout = max(checkout, s.highest_checkout)
+    return Standing(user_id, None, wins, throws, points / throws if throws else 0.0, checkout)
+
+
+# ============================================================
+# Eine Bestenliste
+# ============================================================
+
+class Leaderboard:
+
+    def __init__(self):
+        self.keys: list[tuple] = []          # aufsteigend sortiert: (-Wert, user_id)
+        self.values: dict[int, float] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def set(self, user_id: int, value: float) -> None:
+        old = self.values.get(user_id)
+        if old == value:
+            return
+        if old is not None:
+            del self.keys[bisect_left(self.keys, (-old, user_id))]
+        self.values[user_id] = value
+        insort(self.keys, (-value, user_id))
+
+    def remove(self, user_id: int) -> None:
+        old = self.values.pop(user_id, None)
+        if old is not None:
+            del self.keys[bisect_left(self.keys, (-old, user_id))]
+
+    def rank(self, user_id: int) -> int | None:
+        value = self.values.get(user_id)
+        if value is None:
+            return None
+        # (-Wert,) sortiert vor jedem (-Wert, user_id) → Anzahl echt besserer Einträge
+        return bisect_left(self.keys, (-value,)) + 1
+
+    def page(self, offset: int = 0, limit: int = 50) -> list[tuple[int, int, float]]:
+        """[(Rang, user_id, Wert)] – ein bisect für den ersten Rang, danach linear."""
+        entries = []
+        rank = None
+        previous = None
+        for position, (neg_value, user_id) in enumerate(self.keys[offset:offset + limit], start=offset):
+            if neg_value != previous:
+                rank = position + 1 if previous is not None else bisect_left(self.keys, (neg_value,)) + 1
+                previous = neg_value
+            entries.append((rank, user_id, -neg_value))
+        return entries
+
+
+# ============================================================
+# Alle Bestenlisten (Metrik × Modus, None = gesamt)
+# ============================================================
+
+class Leaderboards:
+
+    def __init__(self, min_throws: int = 30, refresh_interval: float = 60.0):
+        self.min_throws = min_throws
+        self.refresh_interval = refresh_interval
+        self.boards: dict[tuple[str, int | None], Leaderboard] = {}
+        self.standings: dict[int, dict[int | None, Standing]] = {}   # user_id → Modus → Werte
+        self._task: asyncio.Task | None = None
+        self._session_factory = None
+
+        # Metriken
+        self.updates = 0
+        self.rebuilds = 0
+        self.failed_rebuilds = 0
+
+    def clear(self) -> None:
+        self.boards.clear()
+        self.standings.clear()
+
+    def board(self, metric: str, game_mode_id: int | None = None) -> Leaderboard:
+        board = self.boards.get((metric, game_mode_id))
+        if board is None:
+            board = self.boards[(metric, game_mode_id)] = Leaderboard()
+        return board
+
+    def _place(self, s: Standing, game_mode_id: int | None) -> None:
+        self.board("wins", game_mode_id).set(s.user_id, s.wins)
+        self.board("highest_checkout", game_mode_id).set(s.user_id, s.highest_checkout)
+        average = self.board("average", game_mode_id)
+        # Zu wenige Darts → kein aussagekräftiger Average
+        if s.total_throws >= self.min_throws:
+            average.set(s.user_id, round(s.average_score_per_throw * 3, 2))
+        else:
+            average.remove(s.user_id)
+
+    def update(self, standings) -> None:
+        """Geänderte statistics-Zeilen einsortieren (nach dem Commit aufrufen)."""
+        touched = set()
+        for s in standings:
+            self.standings.setdefault(s.user_id, {})[s.game_mode_id] = s
+            # Zeilen ohne Modus zählen nur in die Gesamtliste
+            if s.game_mode_id is not None:
+                self._place(s, s.game_mode_id)
+            touched.add(s.user_id)
+            self.updates += 1
+        for user_id in touched:
+            self._place(combine(user_id, self.standings[user_id].values()), None)
+
+    async def rebuild(self, db: AsyncSession) -> int:
+        """Alles aus der statistics-Tabelle neu aufbauen (nur die benötigten Spalten)."""
+        result = await db.execute(select(
+            Statistic.user_id, Statistic.game_mode_id, Statistic.wins,
+            Statistic.total_throws, Statistic.average_score_per_throw, Statistic.highest_checkout,
+        ))
+        rows = [Standing(*row) for row in result.all()]
+        self.clear()
+        self.update(rows)
+        self.rebuilds += 1
+        return len(rows)
+
+    # -------------------------------------------------------------------------
+    # Periodischer Neuaufbau (Lifespan) – übernimmt Flushes anderer Worker
+    # -------------------------------------------------------------------------
+    async def start(self, session_factory) -> None:
+        if session_factory is None or self._task is not None:
+            return
+        self._session_factory = session_factory
+        async with session_factory() as db:
+            await self.rebuild(db)
+        if self.refresh_interval > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                async with self._session_factory() as db:
+                    await self.rebuild(db)
+            except Exception:
+                # Alte Listen bleiben bestehen, nächster Versuch im nächsten Intervall
+                self.failed_rebuilds += 1
+                logger.exception("Bestenlisten-Neuaufbau fehlgeschlagen")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "boards": len(self.boards),
+            "players": len(self.standings),
+            "updates": self.updates,
+            "rebuilds": self.rebuilds,
+            "failed_rebuilds": self.failed_rebuilds,
+            "min_throws": self.min_throws,
+            "refresh_interval": self.refresh_interval,
+        }
+
+
+leaderboards = Leaderboards(
+    min_throws=int(os.getenv("LEADERBOARD_MIN_THROWS", 30)),
+    refresh_interval=float(os.getenv("LEADERBOARD_REFRESH_INTERVAL", 60)),
+)
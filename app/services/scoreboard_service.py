@@ -0,0 +1,137 @@
+"""
+Scoreboard-Projektion.
+
+Statt das Scoreboard bei jedem Lesen aus allen Würfen zu berechnen (O(Würfe)), schreibt der
+Wurf-Pfad pro Dart ein paar Zähler fort (record_dart). Gespeichert wird das in den
+Scoreboard-Spalten von game_participants (mit dem ohnehin fälligen UPDATE des Teilnehmers),
+im Speicher liegt es im LiveGameState (state.scoreboard).
+GET /games/{id}/scoreboard ist damit ein Cache-Hit oder genau eine Query.
+"""
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas.game_schemas import GameScoreboardOut, ParticipantInGame
+from app.services.checkout_service import get_checkout_path, get_checkout_suggestion
+from app.services.game_rules import GameRules
+from app.services.game_state_cache import LiveGameState, ParticipantState, ScoreboardState, live_games
+
+
+def is_checkout_attempt(score: int, rules: GameRules) -> bool:
+    """Dart auf ein mögliches 1-Dart-Finish (zählt für die Checkout-Quote)."""
+    return rules.scoring_type == "subtract" and get_checkout_path(score, 1, rules.checkout_rule) is not None
+
+
+class ScoreboardService:
+
+    # -------------------------------------------------------------------------
+    # 1️⃣ Inkrementelles Update pro Dart (reine Speicheroperation)
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def record_dart(
+        state: LiveGameState,
+        participant: ParticipantState,
+        score_before: int,
+        dart_score: int,
+        status: str,
+        throw_number: int,
+    ) -> ScoreboardState:
+        """
+        Schreibt den Scoreboard-Eintrag nach einem bereits angewendeten Dart fort.
+        score_before = Score vor dem Dart, participant.current_score = Score danach.
+        """
+        entry = state.scoreboard.get(participant.id)
+        if entry is None:
+            entry = state.scoreboard[participant.id] = ScoreboardState(
+                participant_id=participant.id, game_id=state.game_id, turn_start_score=score_before
+            )
+
+        # 🎯 Darts der laufenden Aufnahme
+        if throw_number == 1:
+            entry.turn_start_score = score_before
+            entry.dart1_score, entry.dart2_score, entry.dart3_score = dart_score, None, None
+        elif throw_number == 2:
+            entry.dart2_score = dart_score
+        else:
+            entry.dart3_score = dart_score
+
+        # ✅ Checkout-Quote / bestes Leg
+        if is_checkout_attempt(score_before, state.rules):
+            entry.checkout_attempts += 1
+        if status == "WIN":
+            entry.checkouts += 1
+            if entry.best_leg is None or participant.darts_thrown < entry.best_leg:
+                entry.best_leg = participant.darts_thrown
+
+        # 🔁 Aufnahme beendet → Turn-Statistiken
+        if participant.throw_in_turn == 3:
+            turn_points = abs(entry.turn_start_score - participant.current_score)
+            entry.score_last_turn = turn_points
+            entry.turns_completed += 1
+            entry.highest_score = max(entry.highest_score, turn_points)
+            if entry.turns_completed <= 3:
+                entry.first9_points += turn_points
+
+        return entry
+
+    # -------------------------------------------------------------------------
+    # 2️⃣ Lesen
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def participant_out(state: LiveGameState, participant: ParticipantState) -> ParticipantInGame:
+        entry = state.scoreboard.get(participant.id) or ScoreboardState(
+            participant_id=participant.id, game_id=state.game_id, turn_start_score=participant.current_score
+        )
+        rules = state.rules
+
+        points = abs((participant.starting_score or 0) - participant.current_score)
+        three_dart_average = round(points / participant.darts_thrown * 3, 2) if participant.darts_thrown else None
+        first_9_turns = min(entry.turns_completed, 3)
+        first_9_average = round(entry.first9_points / first_9_turns, 2) if first_9_turns else None
+        checkout_percentage = (
+            round(entry.checkouts / entry.checkout_attempts * 100, 2) if entry.checkout_attempts else None
+        )
+
+        checkout_suggestion = None
+        if rules.scoring_type == "subtract" and participant.current_score > 0:
+            in_turn = participant.throw_in_turn if 0 < participant.throw_in_turn < 3 else 0
+            checkout_suggestion = get_checkout_suggestion(
+                participant.current_score, 3 - in_turn, rules.checkout_rule, participant.user_id
+            )
+
+        return ParticipantInGame(
+            participant_id=participant.id,
+            user_id=participant.user_id,
+            username=participant.username,
+            current_score=entry.turn_start_score,
+            score_last_turn=entry.score_last_turn,
+            dart1_score=entry.dart1_score,
+            dart2_score=entry.dart2_score,
+            dart3_score=entry.dart3_score,
+            new_score=participant.current_score,
+            checkout_suggestion=checkout_suggestion,
+            three_dart_average=three_dart_average,
+            first_9_average=first_9_average,
+            highest_score=entry.highest_score,
+            checkout_percentage=checkout_percentage,
+            best_leg=entry.best_leg,
+        )
+
+    @staticmethod
+    def build(state: LiveGameState) -> GameScoreboardOut:
+        return GameScoreboardOut(
+            game_id=state.game_id,
+            status=state.status,
+            start_time=state.start_time,
+            end_time=state.end_time,
+            participants=[ScoreboardService.participant_out(state, p) for p in state.participants],
+        )
+
+    @staticmethod
+    async def get_scoreboard(db: AsyncSession, game_id: int, populate: bool = True) -> GameScoreboardOut | None:
+        """
+        Scoreboard eines Spiels: Live-Cache-Hit ohne Query, sonst EINE Query.
+        populate=False für Replica-Sessions (Ergebnis wird dann nicht gecacht).
+        """
+        state = await live_games.load(db, game_id, populate=populate)
+        if state is None:
+            return None
+        return ScoreboardService.build(state)
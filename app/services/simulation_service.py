@@ -0,0 +1,102 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from app.services.batch_engine import BatchX01Engine
+
+DEFAULT_CHUNK_SIZE = 50_000
+
+
+def _simulate_chunk(
+    num_legs: int,
+    seed_seq: np.random.SeedSequence,
+    num_players: int,
+    starting_score: int,
+    checkout_rule: str | None,
+    max_turns: int,
+) -> dict:
+    """
+    Worker-Funktion (muss auf Modulebene liegen, damit sie an Prozesse übergeben werden kann).
+    Simuliert einen Block von Legs komplett im Speicher und liefert nur Summen zurück.
+    """
+    engine = BatchX01Engine(starting_score=starting_score, checkout_rule=checkout_rule)
+    result = engine.simulate_legs(
+        num_legs,
+        num_players=num_players,
+        rng=np.random.default_rng(seed_seq),
+        max_turns=max_turns,
+    )
+
+    winner = result["winner"]
+    finished = winner >= 0
+
+    return {
+        "legs": num_legs,
+        "aborted": int((~finished).sum()),
+        "wins": np.bincount(winner[finished], minlength=num_players).tolist(),
+        "winner_darts": int(result["darts"][finished, winner[finished]].sum()),
+        "darts": int(result["darts"].sum()),
+        "busts": int(result["busts"].sum()),
+    }
+
+
+def _merge(partials: list[dict], num_players: int) -> dict:
+    """Fasst die Teilergebnisse aller Worker zu einer Gesamtstatistik zusammen."""
+    legs = sum(p["legs"] for p in partials)
+    aborted = sum(p["aborted"] for p in partials)
+    wins = [sum(p["wins"][i] for p in partials) for i in range(num_players)]
+    winner_darts = sum(p["winner_darts"] for p in partials)
+    darts = sum(p["darts"] for p in partials)
+    busts = sum(p["busts"] for p in partials)
+    finished = legs - aborted
+
+    return {
+        "legs": legs,
+        "finished": finished,
+        "aborted": aborted,
+        "wins": wins,
+        "win_rates": [round(w / finished, 4) if finished else 0.0 for w in wins],
+        "average_darts_per_leg": round(winner_darts / finished, 2) if finished else 0.0,
+        "bust_rate": round(busts / darts, 4) if darts else 0.0,
+        "total_darts": darts,
+    }
+
+
+class SimulationService:
+    """
+    Monte-Carlo-Simulation vieler X01-Legs über mehrere CPU-Kerne.
+    Keine DB-Zugriffe: jeder Worker spielt seine Legs mit der BatchX01Engine im Speicher.
+    """
+
+    @staticmethod
+    def run(
+        num_games: int,
+        num_players: int = 2,
+        starting_score: int = 501,
+        checkout_rule: str | None = "double",
+        workers: int | None = None,
+        seed: int | None = None,
+        max_turns: int = 150,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> dict:
+        """
+        Verteilt `num_games` Legs in Blöcken auf einen Prozess-Pool.
+        Jeder Block bekommt einen eigenen, aus `seed` abgeleiteten RNG-Stream –
+        das Ergebnis hängt damit nur von seed + chunk_size ab, nicht von der Anzahl Worker.
+        """
+        sizes = [chunk_size] * (num_games // chunk_size)
+        if num_games % chunk_size:
+            sizes.append(num_games % chunk_size)
+
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        args = [(n, s, num_players, starting_score, checkout_rule, max_turns) for n, s in zip(sizes, seeds)]
+
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(args) <= 1:
+            partials = [_simulate_chunk(*a) for a in args]
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(args))) as pool:
+                partials = list(pool.map(_simulate_chunk, *zip(*args)))
+
+        return _merge(partials, num_players)
@@ -1,10 +1,543 @@
+"""
+Spielerstatistiken als laufende Akkumulatoren.
+
+Pro Dart wird nur ein kleiner In-Memory-Akkumulator pro (User, Modus) fortgeschrieben –
+O(1), ohne Query. Mittelwert/Varianz nach Welford, zusammengeführt nach Chan et al.:
+zwei Akkumulatoren (gespeicherte Zeile + neue Darts) ergeben exakt denselben Mittelwert
+und dieselbe Varianz wie eine Neuberechnung über alle Würfe.
+
+Ablauf:
+1. apply_to_state → StatisticsService.update_after_throw in einen StatsBatch des Requests
+   (Schlüssel: User, Modus, UTC-Tag)
+2. nach erfolgreichem Write-through → stat_accumulators (ausstehend)
+3. Flush alle STATISTICS_FLUSH_INTERVAL Sekunden (Default) oder mit der Wurf-Transaktion
+   (STATISTICS_FLUSH_WITH_THROWS=1): Tages-Akkumulatoren werden zu Gesamt- (statistics) und
+   Zeitraum-Zeilen (statistic_rollups: Tag/Woche/Monat) zusammengeführt –
+   SELECT … FOR UPDATE + Merge + ein Commit. Fehlende Zeilen werden vorher per
+   INSERT … ON CONFLICT DO NOTHING angelegt und erneut gesperrt – parallele Flushes
+   (andere Worker, Import-Blöcke) scheitern so nicht am Unique-Constraint.
+
+Gegenprobe: `python -m app.scripts.verify_statistics` rechnet alles aus den Würfen neu.
+"""
+import asyncio
+import logging
+import math
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, UTC
+
+import numpy as np
+from sqlalchemy import and_, insert, or_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from app.crud import game_crud, statistic_crud
+from app.models.game import Game
 from app.models.statistic import Statistic
-from app.models.game_participant import GameParticipant
+from app.models.statistic_rollup import StatisticRollup
 from app.models.throw import Throw
 from app.models.user import User
+from app.services import dart_codec
+from app.services.aim_service import update_player_skill
+from app.services.leaderboard_service import leaderboards, standing, Standing
+from app.services.game_state_cache import build_state, LiveGameState, ParticipantState, ScoreboardState
+from app.services.scoreboard_service import is_checkout_attempt
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# Akkumulatoren
+# ============================================================
+
+@dataclass(slots=True)
+class RunningStats:
+    """Welford: Anzahl, Mittelwert, M2 (Summe der quadrierten Abweichungen), Maximum."""
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    maximum: int = 0
+
+    def add(self, x: int) -> None:
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        if x > self.maximum:
+            self.maximum = x
+
+    def merge(self, other: "RunningStats") -> None:
+        """Chan et al.: zwei Teilmengen → Gesamtmenge (ohne die Einzelwerte)."""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2, self.maximum = other.count, other.mean, other.m2, other.maximum
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.maximum = max(self.maximum, other.maximum)
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / self.count if self.count else 0.0
+
+
+@dataclass(slots=True)
+class StatAccumulator:
+    """Alle Zähler eines (User, Modus)-Paares bzw. eines Zeitraums."""
+    x01: bool = False
+    throws: RunningStats = field(default_factory=RunningStats)
+    turns: RunningStats = field(default_factory=RunningStats)
+    total_100s: int = 0
+    total_140s: int = 0
+    total_180s: int = 0
+    checkout_attempts: int = 0
+    checkouts_hit: int = 0
+    highest_checkout: int = 0
+
+    def record_dart(self, score: int) -> None:
+        self.throws.add(score)
+
+    def record_turn(self, points: int) -> None:
+        self.turns.add(points)
+        if points == 180:
+            self.total_180s += 1
+        elif points >= 140:
+            self.total_140s += 1
+        elif points >= 100:
+            self.total_100s += 1
+
+    def record_checkout_attempt(self, hit: bool, checkout: int) -> None:
+        self.checkout_attempts += 1
+        if hit:
+            self.checkouts_hit += 1
+            self.highest_checkout = max(self.highest_checkout, checkout)
+
+    def record_darts(self, darts: bytes, finished: bool = False) -> None:
+        """
+        Darts + Aufnahmen direkt aus einem gepackten X01-Puffer (dart_codec), z. B. aus
+        game_participants.darts. Checkout-Versuche brauchen den Score-Verlauf → nicht enthalten.
+        """
+        for points in dart_codec.codes(darts).translate(dart_codec.POINTS_TABLE):
+            self.throws.add(points)
+        for points in dart_codec.turn_points(darts, finished):
+            self.record_turn(points)
+
+    def merge(self, other: "StatAccumulator") -> None:
+        self.x01 = self.x01 or other.x01
+        self.throws.merge(other.throws)
+        self.turns.merge(other.turns)
+        self.total_100s += other.total_100s
+        self.total_140s += other.total_140s
+        self.total_180s += other.total_180s
+        self.checkout_attempts += other.checkout_attempts
+        self.checkouts_hit += other.checkouts_hit
+        self.highest_checkout = max(self.highest_checkout, other.highest_checkout)
+
+    # -------------------------------------------------------------------------
+    # Zeile ↔ Akkumulator
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def from_row(row: Statistic | StatisticRollup) -> "StatAccumulator":
+        return StatAccumulator(
+            throws=RunningStats(row.total_throws, row.average_score_per_throw, row.throw_m2, row.highest_score_per_throw),
+            turns=RunningStats(row.total_turns, row.average_score_per_turn, row.turn_m2, row.highest_score_per_turn),
+            total_100s=row.total_100s,
+            total_140s=row.total_140s,
+            total_180s=row.total_180s,
+            checkout_attempts=row.checkout_attempts,
+            checkouts_hit=row.checkouts_hit,
+            highest_checkout=row.highest_checkout,
+        )
+
+    def to_row(self, row: Statistic | StatisticRollup) -> None:
+        row.total_throws = self.throws.count
+        row.average_score_per_throw = self.throws.mean
+        row.throw_m2 = self.throws.m2
+        row.highest_score_per_throw = self.throws.maximum
+        row.total_turns = self.turns.count
+        row.average_score_per_turn = self.turns.mean
+        row.turn_m2 = self.turns.m2
+        row.highest_score_per_turn = self.turns.maximum
+        row.total_100s = self.total_100s
+        row.total_140s = self.total_140s
+        row.total_180s = self.total_180s
+        row.checkout_attempts = self.checkout_attempts
+        row.checkouts_hit = self.checkouts_hit
+        row.highest_checkout = self.highest_checkout
+        row.checkout_percentage = (
+            self.checkouts_hit / self.checkout_attempts * 100 if self.checkout_attempts else 0.0
+        )
+
+
+class StatsBatch(dict):
+    """(user_id, game_mode_id, Tag) → StatAccumulator. Sammelt die Darts eines Requests."""
+
+    def accumulator(self, user_id: int, game_mode_id: int | None, day: date, x01: bool = False) -> StatAccumulator:
+        acc = self.get((user_id, game_mode_id, day))
+        if acc is None:
+            acc = self[(user_id, game_mode_id, day)] = StatAccumulator(x01=x01)
+        return acc
+
+    def merge(self, other: "StatsBatch") -> None:
+        for key, acc in other.items():
+            own = self.get(key)
+            if own is None:
+                self[key] = own = StatAccumulator()
+            own.merge(acc)
+
+
+# ============================================================
+# Zeiträume
+# ============================================================
+
+PERIODS = ("day", "week", "month")
+
+
+def bucket_start(day: date, period: str) -> date:
+    """Erster Tag des Zeitraums: der Tag selbst, Montag der Woche, Monatserster."""
+    if period == "day":
+        return day
+    if period == "week":
+        return day - timedelta(days=day.weekday())
+    if period == "month":
+        return day.replace(day=1)
+    raise ValueError(f"Unknown period: {period}")
+
+
+def previous_bucket(start: date, period: str) -> date:
+    if period == "day":
+        return start - timedelta(days=1)
+    if period == "week":
+        return start - timedelta(days=7)
+    return (start - timedelta(days=1)).replace(day=1)
+
+
+def rollup_targets(batch: StatsBatch) -> tuple[dict, dict]:
+    """
+    Verdichtet Tages-Akkumulatoren zu
+    - Gesamt:    (user_id, game_mode_id) → StatAccumulator
+    - Zeiträume: (user_id, game_mode_id, period, bucket_start) → StatAccumulator
+    """
+    totals, rollups = {}, {}
+    for (user_id, mode_id, day), acc in batch.items():
+        targets = [(totals, (user_id, mode_id))]
+        targets += [(rollups, (user_id, mode_id, period, bucket_start(day, period))) for period in PERIODS]
+        for target, key in targets:
+            merged = target.get(key)
+            if merged is None:
+                target[key] = merged = StatAccumulator()
+            merged.merge(acc)
+    return totals, rollups
+
+
+def utc_day(timestamp: datetime) -> date:
+    """Kalendertag in UTC (naive Zeitstempel, z. B. aus SQLite, gelten bereits als UTC)."""
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(UTC)
+    return timestamp.date()
+
+
+def new_statistic(user_id: int, game_mode_id: int | None) -> Statistic:
+    """Leere Zeile mit expliziten Nullen (Column-Defaults greifen erst beim INSERT)."""
+    row = Statistic(user_id=user_id, game_mode_id=game_mode_id, games_played=0, wins=0, losses=0)
+    StatAccumulator().to_row(row)
+    return row
+
+
+def new_rollup(user_id: int, game_mode_id: int | None, period: str, start: date) -> StatisticRollup:
+    row = StatisticRollup(user_id=user_id, game_mode_id=game_mode_id, period=period, bucket_start=start)
+    StatAccumulator().to_row(row)
+    return row
+
+
+def _mode_condition(column, game_mode_id: int | None):
+    return column.is_(None) if game_mode_id is None else column == game_mode_id
+
+
+def _statistic_condition(key: tuple):
+    user_id, mode_id = key
+    return and_(Statistic.user_id == user_id, _mode_condition(Statistic.game_mode_id, mode_id))
+
+
+def _rollup_condition(key: tuple):
+    user_id, mode_id, period, start = key
+    return and_(
+        StatisticRollup.user_id == user_id,
+        _mode_condition(StatisticRollup.game_mode_id, mode_id),
+        StatisticRollup.period == period,
+        StatisticRollup.bucket_start == start,
+    )
+
+
+def _insert_values(row) -> dict:
+    """Spaltenwerte einer neuen ORM-Zeile für einen Core-INSERT (ohne id / Server-Defaults)."""
+    return {
+        column.name: getattr(row, column.name)
+        for column in row.__table__.columns
+        if not column.primary_key and column.server_default is None
+    }
+
+
+async def _lock_or_create(db: AsyncSession, model, keys, condition, key_of, new_row) -> dict:
+    """
+    Sperrt die Zeilen zu `keys` (SELECT … FOR UPDATE). Fehlende werden per
+    INSERT … ON CONFLICT DO NOTHING angelegt – legt ein paralleler Schreiber dieselbe Zeile
+    gerade an, gewinnt einer, kein IntegrityError – und danach ebenfalls gesperrt.
+    """
+    def locked(wanted):
+        return select(model).where(or_(*(condition(key) for key in wanted))).with_for_update()
+
+    rows = {key_of(row): row for row in (await db.scalars(locked(keys))).all()}
+    missing = [key for key in keys if key not in rows]
+    if missing:
+        dialect = (await db.connection()).dialect.name
+        if dialect == "postgresql":
+            stmt = postgresql_insert(model).on_conflict_do_nothing()
+        elif dialect == "sqlite":
+            stmt = sqlite_insert(model).on_conflict_do_nothing()
+        else:
+            stmt = insert(model)
+        await db.execute(stmt, [_insert_values(new_row(*key)) for key in missing])
+        rows.update((key_of(row), row) for row in (await db.scalars(locked(missing))).all())
+    return rows
+
+
+async def lock_statistics(db: AsyncSession, keys) -> dict:
+    """(user_id, game_mode_id) → gesperrte statistics-Zeile; fehlende werden angelegt."""
+    return await _lock_or_create(
+        db, Statistic, list(keys), _statistic_condition,
+        lambda row: (row.user_id, row.game_mode_id), new_statistic,
+    )
+
+
+async def lock_rollups(db: AsyncSession, keys) -> dict:
+    """(user_id, game_mode_id, period, bucket_start) → gesperrte statistic_rollups-Zeile."""
+    return await _lock_or_create(
+        db, StatisticRollup, list(keys), _rollup_condition,
+        lambda row: (row.user_id, row.game_mode_id, row.period, row.bucket_start), new_rollup,
+    )
+
+
+# ============================================================
+# Ausstehende Akkumulatoren + Flush
+# ============================================================
+
+class StatisticsAccumulators:
+
+    def __init__(self, flush_interval: float = 5.0, flush_with_throws: bool = False):
+        self.flush_interval = flush_interval
+        self.flush_with_throws = flush_with_throws
+        self.pending = StatsBatch()
+        self._task: asyncio.Task | None = None
+        self._session_factory = None
+
+        # Metriken
+        self.flushes = 0
+        self.rows_written = 0
+        self.failed_flushes = 0
+        self.last_flush_ms = 0.0
+
+    def add(self, batch: StatsBatch) -> None:
+        self.pending.merge(batch)
+
+    def clear(self) -> None:
+        self.pending = StatsBatch()
+
+    async def write(self, db: AsyncSession, batch: StatsBatch) -> list[Standing]:
+        """
+        Merged `batch` in statistics + statistic_rollups (Zeilen gesperrt per FOR UPDATE).
+        Committet NICHT – gibt die neuen Bestenlisten-Werte zurück (nach dem Commit → leaderboards.update).
+        """
+        if not batch:
+            return []
+        written = []
+        totals, rollups = rollup_targets(batch)
+
+        # 📈 Gesamt pro (User, Modus)
+        rows = await lock_statistics(db, totals)
+        for key, acc in totals.items():
+            row = rows[key]
+            merged = StatAccumulator.from_row(row)
+            merged.merge(acc)
+            merged.to_row(row)
+            written.append(standing(row))
+            # 🎯 Skill-Profil für Checkout-Empfehlungen (nur X01)
+            if acc.x01 and merged.turns.count:
+                update_player_skill(key[0], merged.turns.mean)
+
+        # 🗓️ Zeiträume (Tag / Woche / Monat)
+        existing = await lock_rollups(db, rollups)
+        for key, acc in rollups.items():
+            row = existing[key]
+            merged = StatAccumulator.from_row(row)
+            merged.merge(acc)
+            merged.to_row(row)
+
+        self.rows_written += len(totals) + len(rollups)
+        return written
+
+    async def flush(self, db: AsyncSession) -> int:
+        """Schreibt alle ausstehenden Akkumulatoren in EINER Transaktion."""
+        batch, self.pending = self.pending, StatsBatch()
+        if not batch:
+            return 0
+        started = time.perf_counter()
+        try:
+            written = await self.write(db, batch)
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            self.failed_flushes += 1
+            # Nichts verlieren: zurück in die Warteschlange (Merge ist kommutativ)
+            batch.merge(self.pending)
+            self.pending = batch
+            raise
+        leaderboards.update(written)
+        self.flushes += 1
+        self.last_flush_ms = (time.perf_counter() - started) * 1000
+        return len(batch)
+
+    # -------------------------------------------------------------------------
+    # Periodischer Flush (Lifespan)
+    # -------------------------------------------------------------------------
+    def start(self, session_factory) -> None:
+        if session_factory is None or self._task is not None:
+            return
+        self._session_factory = session_factory
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                async with self._session_factory() as db:
+                    await self.flush(db)
+            except Exception:
+                # flush() zählt failed_flushes und behält den Batch für den nächsten Versuch
+                logger.exception("Statistik-Flush fehlgeschlagen")
+
+    async def stop(self) -> None:
+        """Periodischen Flush beenden und Ausstehendes schreiben."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        async with self._session_factory() as db:
+            await self.flush(db)
+
+    def stats(self) -> dict:
+        return {
+            "pending": len(self.pending),
+            "flush_interval": self.flush_interval,
+            "flush_with_throws": self.flush_with_throws,
+            "flushes": self.flushes,
+            "failed_flushes": self.failed_flushes,
+            "rows_written": self.rows_written,
+            "last_flush_ms": round(self.last_flush_ms, 3),
+        }
+
+
+stat_accumulators = StatisticsAccumulators(
+    flush_interval=float(os.getenv("STATISTICS_FLUSH_INTERVAL", 5)),
+    flush_with_throws=os.getenv("STATISTICS_FLUSH_WITH_THROWS") == "1",
+)
+
+
+# ============================================================
+# Gegenprobe: Rohwerte für die vollständige Neuberechnung
+# ============================================================
+
+@dataclass(slots=True)
+class SampleLog:
+    """Gleiche Schnittstelle wie StatAccumulator, merkt sich aber alle Einzelwerte."""
+    x01: bool = False
+    throws: list[int] = field(default_factory=list)
+    turns: list[int] = field(default_factory=list)
+    attempts: list[tuple[bool, int]] = field(default_factory=list)
+
+    def record_dart(self, score: int) -> None:
+        self.throws.append(score)
+
+    def record_turn(self, points: int) -> None:
+        self.turns.append(points)
+
+    def record_checkout_attempt(self, hit: bool, checkout: int) -> None:
+        self.attempts.append((hit, checkout))
+
+    def extend(self, other: "SampleLog") -> None:
+        self.throws.extend(other.throws)
+        self.turns.extend(other.turns)
+        self.attempts.extend(other.attempts)
+
+    def accumulate(self) -> StatAccumulator:
+        """Dieselben Werte inkrementell (für --repair)."""
+        acc = StatAccumulator(x01=self.x01)
+        for score in self.throws:
+            acc.record_dart(score)
+        for points in self.turns:
+            acc.record_turn(points)
+        for hit, checkout in self.attempts:
+            acc.record_checkout_attempt(hit, checkout)
+        return acc
+
+    def recompute(self) -> dict:
+        """Alle Kennzahlen direkt aus den Einzelwerten (Zwei-Pass, NumPy)."""
+        throws = np.asarray(self.throws, dtype=np.float64)
+        turns = np.asarray(self.turns, dtype=np.int64)
+        hits = [checkout for hit, checkout in self.attempts if hit]
+        return {
+            "total_throws": throws.size,
+            "average_score_per_throw": float(throws.mean()) if throws.size else 0.0,
+            "throw_variance": float(throws.var()) if throws.size else 0.0,
+            "highest_score_per_throw": int(throws.max()) if throws.size else 0,
+            "total_turns": turns.size,
+            "average_score_per_turn": float(turns.mean()) if turns.size else 0.0,
+            "turn_variance": float(turns.var()) if turns.size else 0.0,
+            "highest_score_per_turn": int(turns.max()) if turns.size else 0,
+            "total_100s": int(np.count_nonzero((turns >= 100) & (turns < 140))),
+            "total_140s": int(np.count_nonzero((turns >= 140) & (turns < 180))),
+            "total_180s": int(np.count_nonzero(turns == 180)),
+            "checkout_attempts": len(self.attempts),
+            "checkouts_hit": len(hits),
+            "highest_checkout": max(hits, default=0),
+        }
+
+
+class SampleLogs(dict):
+    """(user_id, game_mode_id, Tag) → SampleLog – gleiche Schnittstelle wie StatsBatch."""
+
+    def accumulator(self, user_id: int, game_mode_id: int | None, day: date, x01: bool = False) -> SampleLog:
+        log = self.get((user_id, game_mode_id, day))
+        if log is None:
+            log = self[(user_id, game_mode_id, day)] = SampleLog(x01=x01)
+        return log
+
+    def targets(self) -> dict:
+        """
+        Einzelwerte pro Zielzeile:
+        ("total", user, modus, None) bzw. (period, user, modus, bucket_start).
+        """
+        targets = {}
+        for (user_id, mode_id, day), log in self.items():
+            keys = [("total", user_id, mode_id, None)]
+            keys += [(period, user_id, mode_id, bucket_start(day, period)) for period in PERIODS]
+            for key in keys:
+                target = targets.get(key)
+                if target is None:
+                    target = targets[key] = SampleLog(x01=log.x01)
+                target.extend(log)
+        return targets
 
 
 class StatisticsService:
@@ -15,53 +548,47 @@ class StatisticsService:
     # 🧾 Statistik-Objekt abrufen oder erstellen
     # ----------------------------------------------------------
     @staticmethod
-    async def get_or_create_stats(db: AsyncSession, user_id: int) -> Statistic:
+    async def get_or_create_stats(db: AsyncSession, user_id: int, game_mode_id: int | None = None) -> Statistic:
         """
-        Holt die Statistik eines Users oder legt sie neu an, falls nicht vorhanden.
+        Holt die Statistik eines Users (pro Modus) oder legt sie an – ohne Commit.
         """
-        result = await db.execute(select(Statistic).where(Statistic.user_id == user_id))
+        condition = Statistic.game_mode_id.is_(None) if game_mode_id is None else Statistic.game_mode_id == game_mode_id
+        result = await db.execute(select(Statistic).where(Statistic.user_id == user_id, condition))
         stats: Statistic | None = result.scalars().first()
 
         if not stats:
-            stats = Statistic(user_id=user_id)
+            stats = new_statistic(user_id, game_mode_id)
             db.add(stats)
-            await db.commit()
-            await db.refresh(stats)
 
         return stats
 
     # ----------------------------------------------------------
-    # 🎯 Nach einem Wurf aktualisieren
+    # 🎯 Nach einem Wurf aktualisieren (O(1), keine DB)
     # ----------------------------------------------------------
     @staticmethod
-    async def update_after_throw(
-        db: AsyncSession,
-        participant: GameParticipant,
-        throw: Throw,
-        result: dict
+    def update_after_throw(
+        stats: StatsBatch,
+        state: LiveGameState,
+        participant: ParticipantState,
+        entry: ScoreboardState,
+        score_before: int,
+        dart_score: int,
+        status: str,
+        timestamp: datetime,
     ) -> None:
         """
-        Aktualisiert die Wurf-bezogene Statistik eines Users.
+        Schreibt den Akkumulator nach einem bereits angewendeten Dart fort.
+        `entry` = Scoreboard-Eintrag NACH ScoreboardService.record_dart (Aufnahme-Start, Turn-Punkte).
+        Eine Aufnahme zählt zum Tag ihres letzten Darts.
         """
-        user = participant.user
-        stats = user.statistics
+        x01 = state.rules.scoring_type == "subtract"
+        acc = stats.accumulator(participant.user_id, state.game_mode_id, utc_day(timestamp), x01)
 
-        stats.total_throws += 1
-        score = throw.value * throw.multiplier
-
-        # Durchschnitt neu berechnen
-        total_points = stats.average_score_per_turn * (stats.total_throws - 1)
-        new_average = (total_points + score) / stats.total_throws
-        stats.average_score_per_turn = round(new_average, 2)
-
-        # High Scores (100+, 140+, 180)
-        if score >= 100:
-            stats.highest_score_per_turn = max(stats.highest_score_per_turn, score)
-            if score >= 180:
-                stats.total_180s += 1
-
-        await db.commit()
-        await db.refresh(user)
+        acc.record_dart(dart_score)
+        if is_checkout_attempt(score_before, state.rules):
+            acc.record_checkout_attempt(status == "WIN", entry.turn_start_score)
+        if participant.throw_in_turn == 3:  # Aufnahme beendet (3 Darts, BUST oder WIN)
+            acc.record_turn(entry.score_last_turn)
 
     # ----------------------------------------------------------
     # 🏁 Nach Spielende aktualisieren
@@ -71,17 +598,175 @@ class StatisticsService:
         db: AsyncSession,
         user: User,
         participants: list,
-        winner_id: int
+        winner_id: int,
+        game_mode_id: int | None = None,
     ) -> None:
         """
         Nach Spielende Gesamtstatistik aktualisieren (Win/Loss-Zähler).
         """
-        stats = user.statistics
+        stats = await StatisticsService.get_or_create_stats(db, user.id, game_mode_id)
         stats.games_played += 1
         if user.id == winner_id:
             stats.wins += 1
         else:
             stats.losses += 1
 
+        updated = standing(stats)
         await db.commit()
-        await db.refresh(user)
\ No newline at end of file
+        leaderboards.update([updated])
+
+    # ----------------------------------------------------------
+    # 🔍 Gegenprobe: alles aus den Würfen neu berechnen
+    # ----------------------------------------------------------
+    @staticmethod
+    async def recompute_from_throws(db: AsyncSession) -> SampleLogs:
+        """
+        Spielt jedes Spiel Wurf für Wurf über denselben Pfad wie live nach
+        (frischer Zustand, gleiche Engine/Turn-Logik) und sammelt die Einzelwerte.
+        """
+        from app.services.throw_service import ThrowService  # Zyklus: ThrowService → StatisticsService
+
+        logs = SampleLogs()
+        game_ids = (await db.scalars(select(Game.id).order_by(Game.id))).all()
+        for game_id in game_ids:
+            rows = await game_crud.get_live_game_rows(db, game_id)
+            state = build_state(rows)
+            state.scoreboard = {}
+            for p in state.participants:
+                p.current_score = p.starting_score
+                p.cricket_marks = p.turn_number = p.throw_in_turn = p.darts_thrown = 0
+                p.darts = bytearray()
+
+            throws = await db.execute(
+                select(Throw.participant_id, Throw.value, Throw.multiplier, Throw.timestamp)
+                .where(Throw.game_id == game_id)
+                .order_by(Throw.id)
+            )
+            for participant_id, value, multiplier, timestamp in throws:
+                participant = state.participant(participant_id)
+                ThrowService.apply_to_state(state, participant, value, multiplier, timestamp, stats=logs)
+        return logs
+
+    @staticmethod
+    async def verify(db: AsyncSession, repair: bool = False, rel_tol: float = 1e-9) -> list[dict]:
+        """
+        Vergleicht die gespeicherten Akkumulatoren (statistics + statistic_rollups) mit der
+        Neuberechnung. Gibt die Abweichungen zurück; repair=True überschreibt betroffene Zeilen.
+        """
+        targets = (await StatisticsService.recompute_from_throws(db)).targets()
+
+        rows = {("total", r.user_id, r.game_mode_id, None): r for r in (await db.scalars(select(Statistic))).all()}
+        rows.update(
+            ((r.period, r.user_id, r.game_mode_id, r.bucket_start), r)
+            for r in (await db.scalars(select(StatisticRollup))).all()
+        )
+
+        mismatches, repaired = [], []
+        for key in sorted(set(targets) | {k for k, r in rows.items() if r.total_throws}, key=str):
+            log = targets.get(key) or SampleLog()
+            expected = log.recompute()
+            row = rows.get(key)
+            actual = {name: getattr(row, name) for name in expected} if row else None
+
+            diff = {
+                name: {"expected": value, "actual": None if actual is None else actual[name]}
+                for name, value in expected.items()
+                if actual is None or not math.isclose(actual[name], value, rel_tol=rel_tol, abs_tol=1e-9)
+            }
+            if not diff:
+                continue
+            period, user_id, mode_id, start = key
+            mismatches.append({
+                "user_id": user_id,
+                "game_mode_id": mode_id,
+                "period": period,
+                "bucket_start": start,
+                "fields": diff,
+            })
+
+            if repair:
+                if row is None:
+                    row = new_statistic(user_id, mode_id) if period == "total" else new_rollup(user_id, mode_id, period, start)
+                    db.add(row)
+                log.accumulate().to_row(row)
+                if period == "total":
+                    repaired.append(standing(row))
+
+        if repair and mismatches:
+            await db.commit()
+            leaderboards.update(repaired)
+        return mismatches
+
+    # -------------------------------------------------------------------------
+    # Zeitreihen
+    # -------------------------------------------------------------------------
+    @staticmethod
+    async def timeseries(
+        db: AsyncSession,
+        user_id: int,
+        game_mode_id: int | None = None,
+        period: str = "day",
+        buckets: int = 30,
+        window: int = 7,
+        today: date | None = None,
+    ) -> dict:
+        """
+        Die letzten `buckets` Zeiträume bis einschließlich heute (UTC), lückenlos (leere Zeiträume = 0),
+        dazu rollende Fenster über `window` Zeiträume. Liest nur statistic_rollups:
+        ein Range-Scan über buckets + window - 1 Zeilen pro Modus.
+        Ohne game_mode_id werden alle Modi eines Zeitraums exakt zusammengeführt (Chan).
+        """
+        starts = [bucket_start(today or datetime.now(UTC).date(), period)]
+        for _ in range(buckets + window - 2):
+            starts.append(previous_bucket(starts[-1], period))
+        starts.reverse()
+
+        by_start = {start: StatAccumulator() for start in starts}
+        rows = await statistic_crud.get_rollups(db, user_id, period, starts[0], starts[-1], game_mode_id)
+        for row in rows:
+            by_start[row.bucket_start].merge(StatAccumulator.from_row(row))
+
+        # Laufende Summen: Punkte (Turns × Ø), Turns, Checkouts, 180er
+        points = []
+        sums = [0.0, 0, 0, 0, 0]
+        for i, start in enumerate(starts):
+            acc = by_start[start]
+            sums = _add_window(sums, acc, +1)
+            if i >= window:
+                sums = _add_window(sums, by_start[starts[i - window]], -1)
+            if i < window - 1:
+                continue
+
+            total_points, turns, attempts, hits, one_eighties = sums
+            points.append({
+                "bucket_start": start,
+                "throws": acc.throws.count,
+                "turns": acc.turns.count,
+                "average_score_per_turn": acc.turns.mean,
+                "total_180s": acc.total_180s,
+                "checkout_attempts": acc.checkout_attempts,
+                "checkouts_hit": acc.checkouts_hit,
+                "checkout_percentage": acc.checkouts_hit / acc.checkout_attempts * 100 if acc.checkout_attempts else 0.0,
+                "rolling_average_score_per_turn": total_points / turns if turns else 0.0,
+                "rolling_checkout_percentage": hits / attempts * 100 if attempts else 0.0,
+                "rolling_180s": one_eighties,
+            })
+
+        return {
+            "user_id": user_id,
+            "game_mode_id": game_mode_id,
+            "period": period,
+            "window": window,
+            "points": points,
+        }
+
+
+def _add_window(sums: list, acc: StatAccumulator, sign: int) -> list:
+    total_points, turns, attempts, hits, one_eighties = sums
+    return [
+        total_points + sign * acc.turns.mean * acc.turns.count,
+        turns + sign * acc.turns.count,
+        attempts + sign * acc.checkout_attempts,
+        hits + sign * acc.checkouts_hit,
+        one_eighties + sign * acc.total_180s,
+    ]
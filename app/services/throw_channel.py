@@ -0,0 +1,95 @@
+"""
+Persistenter Wurf-Kanal (/ws/games/{game_id}).
+
+Ein Gerät (E-Dartboard, App) authentifiziert sich EINMAL beim Verbindungsaufbau und
+streamt danach nur noch Darts. Pro Verbindung bleiben Spielzustand, Teilnehmer und
+Modus-Regeln resident – pro Dart gibt es weder JWT-Prüfung noch User-Lookup noch
+Request-Parsing durch den HTTP-Stack, nur Validierung → GameEngine → Write-through.
+
+Nachrichten (JSON):
+    → {"value": 20, "multiplier": 3, "participant_id": 7, "seq": 1}   (participant_id optional)
+    ← {"type": "result", "seq": 1, "status": "OK", "remaining": 441, "next": "anna", ...}
+    ← {"type": "error", "seq": 1, "detail": "..."}                    (Verbindung bleibt offen)
+    → {"type": "ping"}  ← {"type": "pong"}
+"""
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas.throw_schemas import ThrowOut
+from app.services.game_state_cache import live_games, LiveGameState, ParticipantState
+from app.services.throw_service import ThrowService
+from app.services.throw_validation_service import ValidationService
+
+
+class ThrowChannel:
+    """
+    Zustand EINER WebSocket-Verbindung.
+    Der Spielzustand selbst gehört weiter dem Live-Cache: wird er dort verworfen und neu
+    geladen (Write-Fehler, Spielende, Verdrängung), bindet sich der Kanal beim nächsten
+    Dart an das neue Objekt – sonst würden HTTP-Pfad und Kanal auf zwei Zuständen rechnen.
+    """
+
+    def __init__(self, game_id: int, user_id: int):
+        self.game_id = game_id
+        self.user_id = user_id
+        self.state: LiveGameState | None = None
+        self.participant: ParticipantState | None = None
+        self.darts = 0
+
+    # -------------------------------------------------------------------------
+    # 1️⃣ Verbindungsaufbau: Spiel + eigenen Teilnehmer einmal auflösen
+    # -------------------------------------------------------------------------
+    async def open(self, db: AsyncSession) -> None:
+        """ValueError: Spiel existiert nicht · PermissionError: User spielt nicht mit."""
+        await self._bind(db)
+
+    async def _bind(self, db: AsyncSession) -> LiveGameState:
+        state = self.state
+        if state is None or live_games.get(self.game_id) is not state:
+            state = await live_games.load(db, self.game_id)
+            if state is None:
+                raise ValueError("Game not found")
+
+            participant = state.participant_by_user(self.user_id)
+            if participant is None:
+                raise PermissionError("Not participant of this game")
+
+            self.state, self.participant = state, participant
+        return state
+
+    # -------------------------------------------------------------------------
+    # 2️⃣ Eine Nachricht verarbeiten → genau eine Antwort
+    # -------------------------------------------------------------------------
+    async def handle(self, db: AsyncSession, message) -> dict:
+        if not isinstance(message, dict):
+            return {"type": "error", "detail": "Message must be a JSON object"}
+
+        seq = message.get("seq")
+        kind = message.get("type", "throw")
+        if kind == "ping":
+            return {"type": "pong", "seq": seq}
+        if kind != "throw":
+            return {"type": "error", "seq": seq, "detail": f"Unknown message type: {kind}"}
+
+        value, multiplier = message.get("value"), message.get("multiplier")
+        if type(value) is not int or type(multiplier) is not int:
+            return {"type": "error", "seq": seq, "detail": "value and multiplier must be integers"}
+
+        try:
+            ValidationService.validate_throw_values(value, multiplier)
+            state = await self._bind(db)
+
+            participant_id = message.get("participant_id")
+            participant = self.participant if participant_id is None else state.participant(participant_id)
+            if participant is None:
+                raise ValueError("Participant not found")
+
+            result = await ThrowService.throw_on_state(db, state, participant, value, multiplier)
+        except HTTPException as e:
+            return {"type": "error", "seq": seq, "detail": e.detail}
+        except (ValueError, PermissionError) as e:
+            return {"type": "error", "seq": seq, "detail": str(e)}
+
+        self.darts += 1
+        result["throw"] = ThrowOut.model_validate(result["throw"]).model_dump()
+        return {"type": "result", "seq": seq, **result}
@@ -1,3 +1,4 @@
+from contextlib import AsyncExitStack
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, UTC
 from sqlalchemy import select
@@ -8,7 +9,15 @@ from app.models.throw import Throw
 from app.crud import throw_crud, game_crud, game_participant_crud
 from app.services.turn_service import TurnService
 from app.services.game_engine import GameEngine
-from app.schemas.throw_schemas import ThrowCreate
+from app.services.throw_validation_service import ValidationService
+from app.services.game_state_cache import live_games, LiveGameState, ParticipantState
+from app.services.throw_writer import throw_writer
+from app.services.scoreboard_service import ScoreboardService
+from app.services.broadcaster import scoreboard_broadcaster
+from app.services.statistics_service import StatisticsService, StatsBatch, stat_accumulators
+from app.services.leaderboard_service import leaderboards
+from app.services.dart_codec import Dart, append_dart
+from app.schemas.throw_schemas import ThrowCreate, ThrowBatchCreate
 
 
 # ============================================================
@@ -56,54 +65,208 @@ class ThrowService:
 
     @staticmethod
     async def process_throw(db: AsyncSession, data: ThrowCreate):
+        """
+        Ein Dart als Unit of Work:
+        - Wurfwerte validieren (vor jedem DB-Zugriff)
+        - Spielzustand aus dem Live-Cache (Miss → EINE Query, keine Relationen)
+        - Position, GameEngine und Turnwechsel im Speicher
+        - Throw + Teilnehmer (+ Spiel bei Turnwechsel) in EINEM Commit, ohne Refresh
+        """
+        ValidationService.validate_throw_values(data.value, data.multiplier)
 
-        game = await game_crud.get_game(db, data.game_id)
-        if not game:
+        state = await live_games.load(db, data.game_id)
+        if not state:
             raise ValueError("Game not found")
 
-        participant = await game_participant_crud.get_participant(db, data.participant_id)
+        participant = state.participant(data.participant_id)
         if not participant:
             raise ValueError("Participant not found")
 
-        previous_throws = await throw_crud.get_throws_for_participant(
-            db, data.game_id, data.participant_id
-        )
+        return await ThrowService.throw_on_state(db, state, participant, data.value, data.multiplier)
 
-        turn_info = TurnService.get_throw_position(previous_throws)
-
-        new_throw = await throw_crud.create_throw(
-            db=db,
-            game_id=data.game_id,
-            participant_id=data.participant_id,
-            value=data.value,
-            multiplier=data.multiplier,
-            turn_number=turn_info["turn_number"],
-            throw_number_in_turn=turn_info["throw_number"],
-            darts_thrown=turn_info["darts_thrown"],
-            timestamp=datetime.now(UTC)
-        )
+    @staticmethod
+    async def process_throw_batch(db: AsyncSession, data: ThrowBatchCreate) -> list[dict]:
+        """
+        Verarbeitet mehrere Würfe (eine oder mehrere Aufnahmen, ggf. aus mehreren Spielen):
+        - alle Werte vorab validieren
+        - Spielzustände aus dem Live-Cache (Misses → eine Query pro Spiel)
+        - GameEngine + Turnwechsel komplett im Speicher anwenden
+        - alle Throws per Bulk-Insert speichern, EIN Commit für alles
+        """
+        for t in data.throws:
+            ValidationService.validate_throw_values(t.value, t.multiplier)
 
-        engine_result = GameEngine.apply_throw(
-            game=game,
-            participant=participant,
-            throw=new_throw
-        )
+        states = {}
+        for game_id in sorted({t.game_id for t in data.throws}):
+            state = await live_games.load(db, game_id)
+            if not state:
+                raise ValueError(f"Game {game_id} not found")
+            states[game_id] = state
 
-        next_player_name = TurnService.handle_player_switch(
-            game=game,
-            participant=participant,
-            throw_result=engine_result["status"],
-            throw_number_in_turn=turn_info["throw_number"]
-        )
+        participants = {}
+        for t in data.throws:
+            participant = states[t.game_id].participant(t.participant_id)
+            if not participant:
+                raise ValueError(f"Participant {t.participant_id} not found in game {t.game_id}")
+            participants[participant.id] = participant
+
+        now = datetime.now(UTC)
+        rows, results = [], []
+        stats = StatsBatch()
+        async with AsyncExitStack() as stack:
+            # Locks immer in derselben Reihenfolge (sortierte game_ids) → keine Deadlocks
+            for state in states.values():
+                await stack.enter_async_context(state.lock)
 
-        await game_crud.update_game(db, game)
+            for t in data.throws:
+                row, result = ThrowService.apply_to_state(
+                    states[t.game_id], participants[t.participant_id], t.value, t.multiplier, now, stats
+                )
+                rows.append(row)
+                results.append(result)
 
-        return {
-            "throw": new_throw,
-            "player": participant.user.username,
+            # Bulk-Insert + Scores/Turn-Wechsel der Teilnehmer/Spiele in EINER Transaktion
+            saved = await ThrowService.write_through(db, states.values(), participants.values(), rows, stats)
+
+        for result, saved_throw in zip(results, saved):
+            result["throw"] = saved_throw
+        return results
+
+    # -------------------------------------------------------------------------
+    # Bausteine (auch für die Simulations-Routen)
+    # -------------------------------------------------------------------------
+    @staticmethod
+    async def throw_on_state(
+        db: AsyncSession,
+        state: LiveGameState,
+        participant: ParticipantState,
+        value: int,
+        multiplier: int,
+    ) -> dict:
+        """
+        Ein (bereits validierter) Dart auf einen geladenen Zustand: anwenden + durchschreiben
+        unter dem Spiel-Lock. Gemeinsamer Kern von HTTP-Route und WebSocket-Kanal.
+        """
+        stats = StatsBatch()
+        async with state.lock:
+            row, result = ThrowService.apply_to_state(
+                state, participant, value, multiplier, datetime.now(UTC), stats
+            )
+            saved = await ThrowService.write_through(db, [state], [participant], [row], stats)
+
+        result["throw"] = saved[0]
+        return result
+
+    @staticmethod
+    def apply_to_state(
+        state: LiveGameState,
+        participant: ParticipantState,
+        value: int,
+        multiplier: int,
+        timestamp: datetime,
+        stats: StatsBatch | None = None,
+    ) -> tuple[dict, dict]:
+        """
+        Wendet einen Dart auf den Live-Zustand an – reine Speicheroperation.
+        Gibt (Zeile für den Throw-Insert, Ergebnis im ThrowResponse-Format ohne "throw") zurück.
+        `stats`: sammelt die Statistik-Akkumulatoren dieses Darts (None = keine Statistik).
+        """
+        turn_info = TurnService.advance_position(participant)
+        # Kein ORM-Objekt pro Dart: der Engine reichen value/multiplier
+        dart = Dart(value, multiplier)
+
+        score_before = participant.current_score
+        engine_result = GameEngine.apply_throw(state, participant, dart, state.rules)
+        # 1 Byte pro Dart im Live-Zustand (+ Bust-Marker), persistiert mit abgeschlossener Aufnahme
+        append_dart(participant.darts, value, multiplier, bust=engine_result["status"] == "BUST")
+
+        next_player_name = participant.username
+        if TurnService.should_change_player(engine_result["status"], turn_info["throw_number"]):
+            TurnService.close_turn(participant)
+            participant.turn_closed = True
+            next_p = TurnService.get_next_player(state, participant)
+            next_player_name = next_p.username if next_p else None
+            if next_p and next_p.user_id != state.current_turn_user_id:
+                state.current_turn_user_id = next_p.user_id
+                state.dirty = True
+
+        # 📊 Scoreboard-Projektion fortschreiben (nach dem Turn-Abschluss)
+        entry = ScoreboardService.record_dart(
+            state, participant, score_before, dart.score, engine_result["status"], turn_info["throw_number"]
+        )
+        # 📈 Spielerstatistik (O(1), erst nach dem Commit in stat_accumulators)
+        if stats is not None:
+            StatisticsService.update_after_throw(
+                stats, state, participant, entry, score_before, dart.score, engine_result["status"], timestamp
+            )
+
+        row = {
+            "game_id": state.game_id,
+            "participant_id": participant.id,
+            "value": value,
+            "multiplier": multiplier,
+            "turn_number": turn_info["turn_number"],
+            "throw_number_in_turn": turn_info["throw_number"],
+            "darts_thrown": turn_info["darts_thrown"],
+            "timestamp": timestamp,
+        }
+        result = {
+            "player": participant.username,
             "remaining": participant.current_score,
             "status": engine_result["status"],
             "throw_in_turn": f"{turn_info['throw_number']}/3",
             "darts_thrown": turn_info["darts_thrown"],
             "next": next_player_name,
-        }
\ No newline at end of file
+        }
+        return row, result
+
+    @staticmethod
+    async def write_through(db: AsyncSession, states, participants, rows: list[dict],
+                            stats: StatsBatch | None = None) -> list[Throw]:
+        """
+        Schreibt Throws, Teilnehmer-Zustände (inkl. Scoreboard-Spalten) und Turn-Zeiger in EINER Transaktion.
+        Mit aktivem Group-Commit (throw_writer) teilt sich diese Transaktion mit anderen Requests.
+        Schlägt das fehl, ist der Cache-Zustand weiter als die DB → Spiele verwerfen.
+        Statistik-Akkumulatoren (`stats`) zählen erst nach dem Commit – entweder in derselben
+        Transaktion (STATISTICS_FLUSH_WITH_THROWS=1) oder im nächsten periodischen Flush.
+        """
+        states = list(states)
+        participants = list(participants)
+        # games-Zeile nur schreiben, wenn sich Turn-Zeiger/Status geändert haben
+        changed = [state for state in states if state.dirty]
+        entries = {pid: entry for state in states for pid, entry in state.scoreboard.items()}
+
+        batched = throw_writer.enabled and throw_writer.session_factory is not None
+        with_throws = bool(stats) and stat_accumulators.flush_with_throws and not batched
+        standings = []
+
+        try:
+            if batched:
+                saved = await throw_writer.submit(rows, participants, changed, entries)
+            else:
+                saved = await throw_crud.bulk_create_throws(db, rows)
+                for participant in participants:
+                    await game_participant_crud.save_participant_state(db, participant, entries.get(participant.id))
+                for state in changed:
+                    await game_crud.save_game_turn(db, state.game_id, state.current_turn_user_id, state.status)
+                if with_throws:
+                    standings = await stat_accumulators.write(db, stats)
+                await db.commit()
+        except Exception:
+            if not batched:
+                await db.rollback()
+            for state in states:
+                live_games.invalidate(state.game_id)
+            raise
+
+        for state in changed:
+            state.dirty = False
+        for participant in participants:
+            participant.turn_closed = False
+        if stats and not with_throws:
+            stat_accumulators.add(stats)
+        leaderboards.update(standings)
+        # 📡 Zuschauer erst nach dem Commit informieren (gebündelt, blockiert nicht)
+        for state in states:
+            scoreboard_broadcaster.notify(state)
+        return saved
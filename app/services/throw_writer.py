@@ -0,0 +1,201 @@
+"""
+Group-Commit für Würfe.
+
+Statt pro Dart eine eigene Transaktion zu committen, sammelt der ThrowWriteBatcher die
+Schreibaufträge gleichzeitiger Requests (Throws + Teilnehmer-Zustände inkl. Scoreboard + Turn-Zeiger) zu
+Micro-Batches – begrenzt durch `max_batch` Darts und ein kurzes Zeitfenster `max_delay`.
+Pro Batch gibt es EIN Multi-Row-INSERT, je ein executemany-UPDATE und EINEN Commit.
+Jeder Request wird erst bestätigt, wenn sein Batch committet ist.
+
+Opt-in über THROW_WRITE_BATCHING=1 (Fenster/Größe: THROW_WRITE_BATCH_DELAY_MS / THROW_WRITE_BATCH_SIZE).
+"""
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import update
+
+from app.crud import throw_crud, scoreboard_crud
+from app.crud.game_participant_crud import darts_values
+from app.database import AsyncSessionLocal
+from app.models.game import Game
+from app.models.game_participant import GameParticipant
+from app.models.throw import Throw
+
+
+@dataclass(slots=True)
+class WriteRequest:
+    """Ein Schreibauftrag (ein Request). Zustände sind Schnappschüsse zum Zeitpunkt von submit()."""
+    rows: list[dict]
+    participants: list[dict]
+    games: list[dict]
+    future: asyncio.Future
+
+
+def participant_snapshot(participant, scoreboard=None) -> dict:
+    """Spalten des Teilnehmer-UPDATE – inklusive Scoreboard-Projektion (`scoreboard`, optional)."""
+    return {
+        "id": participant.id,
+        "current_score": participant.current_score,
+        "cricket_marks": participant.cricket_marks,
+        "turn_number": participant.turn_number,
+        "throw_in_turn": participant.throw_in_turn,
+        "darts_thrown": participant.darts_thrown,
+        **darts_values(participant),
+        **scoreboard_crud.entry_values(scoreboard),
+    }
+
+
+def game_snapshot(state) -> dict:
+    return {"id": state.game_id, "current_turn_user_id": state.current_turn_user_id, "status": state.status}
+
+
+class ThrowWriteBatcher:
+
+    def __init__(self, session_factory=None, max_batch: int = 64, max_delay: float = 0.005, enabled: bool = False):
+        self.session_factory = session_factory
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.enabled = enabled
+
+        self._pending: list[WriteRequest] = []
+        self._pending_darts = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._flushes: set[asyncio.Task] = set()
+
+        # Metriken
+        self.batches = 0
+        self.requests = 0
+        self.throws_written = 0
+        self.failed_batches = 0
+        self.max_batch_size = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+
+    def configure(self, session_factory=None, enabled: bool | None = None, max_batch: int | None = None,
+                  max_delay: float | None = None) -> None:
+        if session_factory is not None:
+            self.session_factory = session_factory
+        if enabled is not None:
+            self.enabled = enabled
+        if max_batch is not None:
+            self.max_batch = max_batch
+        if max_delay is not None:
+            self.max_delay = max_delay
+
+    # -------------------------------------------------------------------------
+    # 1️⃣ Auftrag einreihen und auf den Commit des Batches warten
+    # -------------------------------------------------------------------------
+    async def submit(self, rows: list[dict], participants, states, scoreboard=None) -> list[Throw]:
+        """
+        Reiht Throws + Zustände ein und wartet, bis der Batch dauerhaft gespeichert ist.
+        `scoreboard`: participant_id → ScoreboardState, wird mit dem Teilnehmer geschrieben.
+        Gibt die gespeicherten Throws in Eingabereihenfolge zurück.
+        """
+        loop = asyncio.get_running_loop()
+        scoreboard = scoreboard or {}
+        request = WriteRequest(
+            rows=list(rows),
+            participants=[participant_snapshot(p, scoreboard.get(p.id)) for p in participants],
+            games=[game_snapshot(s) for s in states],
+            future=loop.create_future(),
+        )
+        self._pending.append(request)
+        self._pending_darts += len(request.rows)
+
+        if self._pending_darts >= self.max_batch:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._start_flush)
+
+        return await request.future
+
+    def _start_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+
+        batch, self._pending, self._pending_darts = self._pending, [], 0
+        task = asyncio.ensure_future(self._flush(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def drain(self) -> None:
+        """Schreibt alles Ausstehende sofort (z. B. beim Shutdown)."""
+        self._start_flush()
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    # -------------------------------------------------------------------------
+    # 2️⃣ Ein Batch = ein INSERT, executemany-UPDATEs (Teilnehmer inkl. Scoreboard, Spiele), ein Commit
+    # -------------------------------------------------------------------------
+    async def _flush(self, batch: list[WriteRequest]) -> None:
+        started = time.perf_counter()
+
+        rows = [row for request in batch for row in request.rows]
+        # Spätere Schnappschüsse desselben Teilnehmers/Spiels überschreiben frühere
+        participants = {p["id"]: p for request in batch for p in request.participants}
+        games = {g["id"]: g for request in batch for g in request.games}
+
+        try:
+            async with self.session_factory() as session:
+                saved = await throw_crud.bulk_create_throws(session, rows)
+                if participants:
+                    await session.execute(update(GameParticipant), list(participants.values()))
+                if games:
+                    await session.execute(update(Game), list(games.values()))
+                await session.commit()
+        except Exception as exc:
+            self.failed_batches += 1
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(exc)
+            return
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.batches += 1
+        self.requests += len(batch)
+        self.throws_written += len(rows)
+        self.max_batch_size = max(self.max_batch_size, len(rows))
+        self.last_flush_ms = elapsed_ms
+        self.max_flush_ms = max(self.max_flush_ms, elapsed_ms)
+        self._total_flush_ms += elapsed_ms
+
+        offset = 0
+        for request in batch:
+            count = len(request.rows)
+            if not request.future.done():
+                request.future.set_result(saved[offset:offset + count])
+            offset += count
+
+    # -------------------------------------------------------------------------
+    # Metriken
+    # -------------------------------------------------------------------------
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "max_batch": self.max_batch,
+            "max_delay_ms": self.max_delay * 1000,
+            "pending": self._pending_darts,
+            "batches": self.batches,
+            "failed_batches": self.failed_batches,
+            "requests": self.requests,
+            "throws_written": self.throws_written,
+            "avg_batch_size": round(self.throws_written / self.batches, 2) if self.batches else 0.0,
+            "max_batch_size": self.max_batch_size,
+            "last_flush_ms": round(self.last_flush_ms, 3),
+            "avg_flush_ms": round(self._total_flush_ms / self.batches, 3) if self.batches else 0.0,
+            "max_flush_ms": round(self.max_flush_ms, 3),
+        }
+
+
+throw_writer = ThrowWriteBatcher(
+    session_factory=AsyncSessionLocal,
+    max_batch=int(os.getenv("THROW_WRITE_BATCH_SIZE", 64)),
+    max_delay=float(os.getenv("THROW_WRITE_BATCH_DELAY_MS", 5)) / 1000,
+    enabled=os.getenv("THROW_WRITE_BATCHING") == "1",
+)
@@ -30,6 +30,37 @@ class TurnService:
             "darts_thrown": darts_thrown
         }
 
+    @staticmethod
+    def advance_position(participant: GameParticipant) -> dict:
+        """
+        O(1)-Variante von get_throw_position: liest die Zähler am Participant
+        statt aller bisherigen Würfe und schreibt sie direkt fort.
+        """
+        turn_number = participant.turn_number or 0
+        throw_number = participant.throw_in_turn or 0
+        darts_thrown = (participant.darts_thrown or 0) + 1
+
+        if turn_number == 0 or throw_number >= 3:
+            turn_number += 1
+            throw_number = 1
+        else:
+            throw_number += 1
+
+        participant.turn_number = turn_number
+        participant.throw_in_turn = throw_number
+        participant.darts_thrown = darts_thrown
+
+        return {
+            "turn_number": turn_number,
+            "throw_number": throw_number,
+            "darts_thrown": darts_thrown,
+        }
+
+    @staticmethod
+    def close_turn(participant: GameParticipant) -> None:
+        """Markiert die Aufnahme als beendet (z. B. nach BUST mit dem 1. Dart)."""
+        participant.throw_in_turn = 3
+
     @staticmethod
     def should_change_player(status: str, throw_number_in_turn: int) -> bool:
         return status in ("WIN", "BUST") or throw_number_in_turn == 3
@@ -52,6 +83,7 @@ class TurnService:
         und gibt Username des nächsten Spielers zurück.
         """
         if TurnService.should_change_player(throw_result, throw_number_in_turn):
+            TurnService.close_turn(participant)
             next_p = TurnService.get_next_player(game, participant)
             if next_p and next_p.user:
                 return next_p.user.username
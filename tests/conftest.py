@@ -1,11 +1,31 @@
+from contextlib import asynccontextmanager
+
+import pytest
 import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from app.database import Base, get_db
+from app.database import (
+    Base, get_db, get_read_db, get_analytics_db, get_analytics_session_factory, get_background_session_factory,
+)
 from app.main import app
+from app.services.game_state_cache import live_games
+from app.services.statistics_service import stat_accumulators
+from app.services.leaderboard_service import leaderboards
+from app.auth.auth_cache import token_cache, principal_cache
+from app.services.aim_service import clear_player_skills
+
+
+# ---------------------------------------------------------
+# 0) Keine Hintergrund-Tasks (Statistik-Flush, Bestenlisten) gegen die globale Engine
+# ---------------------------------------------------------
+@pytest.fixture(autouse=True)
+def no_background_tasks():
+    app.dependency_overrides[get_background_session_factory] = lambda: None
+    yield
+    app.dependency_overrides.pop(get_background_session_factory, None)
 
 
 # ---------------------------------------------------------
@@ -28,6 +48,14 @@ async def async_session():
         class_=AsyncSession
     )
 
+    # Jede Test-DB fängt wieder bei game_id=1 an → Live-Cache leeren
+    live_games.clear()
+    stat_accumulators.clear()
+    leaderboards.clear()
+    token_cache.clear()
+    principal_cache.clear()
+    clear_player_skills()
+
     async with TestSession() as session:
         yield session
 
@@ -41,7 +69,17 @@ async def client(async_session: AsyncSession):
     async def override_get_db():
         yield async_session
 
+    # Tests: Primary, Replica und Analytics teilen sich dieselbe In-Memory-DB
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_analytics_db] = override_get_db
+
+    # Streaming-Exporte öffnen ihre Session selbst → dieselbe Test-Session, ohne sie zu schließen
+    @asynccontextmanager
+    async def shared_session():
+        yield async_session
+
+    app.dependency_overrides[get_analytics_session_factory] = lambda: shared_session
 
     transport = ASGITransport(app=app)
 
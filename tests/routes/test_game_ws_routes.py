@@ -0,0 +1,164 @@
+import pytest
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from app.auth.jwt_handler import create_access_token
+from app.crud.user_crud import create_user
+from app.crud.game_mode_crud import create_game_mode
+from app.database import get_db, get_read_db
+from app.main import app
+from app.models.throw import Throw
+from app.schemas.game_mode_schemas import GameModeCreate
+from app.services.game_service import GameService
+from app.services.broadcaster import scoreboard_broadcaster
+
+
+async def _setup_game(db: AsyncSession):
+    host = await create_user(db, username="board", email="board@example.com", password_hash="x")
+    guest = await create_user(db, username="guest", email="guest@example.com", password_hash="x")
+    await create_user(db, username="outsider", email="out@example.com", password_hash="x")
+    mode = await create_game_mode(
+        db,
+        GameModeCreate(name="501", starting_score=501, scoring_type="subtract", checkout_rule="double"),
+    )
+    game = await GameService.start_game(
+        db=db, host=host, game_mode=mode, opponent_ids=[guest.id], first_to=None, first_shot=host.id
+    )
+    return game
+
+
+@pytest.fixture
+def ws_client(async_session: AsyncSession):
+    async def override_get_db():
+        yield async_session
+
+    app.dependency_overrides[get_db] = override_get_db
+    with TestClient(app) as tc:
+        yield tc
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_ws_streams_darts_and_switches_player(async_session: AsyncSession, ws_client: TestClient):
+    """
+    Einmal authentifizieren, dann 3 Darts + 1 Dart des Gegners über denselben Socket:
+    Antworten tragen status/remaining/next, alle Würfe landen in der DB.
+    """
+    game = await _setup_game(async_session)
+    host_pid, guest_pid = game.participants[0].id, game.participants[1].id
+    token = create_access_token({"sub": "board"})
+
+    with ws_client.websocket_connect(f"/ws/games/{game.id}?token={token}") as ws:
+        ready = ws.receive_json()
+        assert ready == {"type": "ready", "game_id": game.id, "participant_id": host_pid}
+
+        replies = []
+        for seq in range(1, 4):
+            ws.send_json({"value": 20, "multiplier": 3, "seq": seq})
+            replies.append(ws.receive_json())
+
+        assert [r["seq"] for r in replies] == [1, 2, 3]
+        assert [r["remaining"] for r in replies] == [441, 381, 321]
+        assert all(r["type"] == "result" and r["status"] == "OK" for r in replies)
+        assert replies[1]["next"] == "board"
+        assert replies[2]["next"] == "guest"
+        assert replies[0]["throw"]["score"] == 60
+
+        ws.send_json({"value": 19, "multiplier": 1, "participant_id": guest_pid})
+        reply = ws.receive_json()
+        assert reply["player"] == "guest"
+        assert reply["remaining"] == 482
+
+    count = await async_session.scalar(select(func.count()).select_from(Throw).where(Throw.game_id == game.id))
+    assert count == 4
+
+
+@pytest.mark.asyncio
+async def test_ws_invalid_dart_keeps_connection_open(async_session: AsyncSession, ws_client: TestClient):
+    game = await _setup_game(async_session)
+    token = create_access_token({"sub": "board"})
+
+    with ws_client.websocket_connect(f"/ws/games/{game.id}") as ws:
+        # Browser-Variante: Token als erste Nachricht
+        ws.send_json({"type": "auth", "token": token})
+        assert ws.receive_json()["type"] == "ready"
+
+        ws.send_json({"value": 21, "multiplier": 1, "seq": 7})
+        error = ws.receive_json()
+        assert error["type"] == "error" and error["seq"] == 7
+
+        ws.send_text("not json")
+        assert ws.receive_json()["type"] == "error"
+
+        ws.send_json({"type": "ping"})
+        assert ws.receive_json()["type"] == "pong"
+
+        ws.send_json({"value": 20, "multiplier": 1})
+        assert ws.receive_json()["remaining"] == 481
+
+
+@pytest.mark.asyncio
+async def test_ws_rejects_bad_token_and_outsiders(async_session: AsyncSession, ws_client: TestClient):
+    game = await _setup_game(async_session)
+
+    with ws_client.websocket_connect(f"/ws/games/{game.id}?token=garbage") as ws:
+        with pytest.raises(WebSocketDisconnect) as exc:
+            ws.receive_json()
+        assert exc.value.code == 4401
+
+    outsider = create_access_token({"sub": "outsider"})
+    with ws_client.websocket_connect(f"/ws/games/{game.id}?token={outsider}") as ws:
+        with pytest.raises(WebSocketDisconnect) as exc:
+            ws.receive_json()
+        assert exc.value.code == 4403
+
+    board = create_access_token({"sub": "board"})
+    with ws_client.websocket_connect(f"/ws/games/9999?token={board}") as ws:
+        with pytest.raises(WebSocketDisconnect) as exc:
+            ws.receive_json()
+        assert exc.value.code == 4404
+
+
+@pytest.mark.asyncio
+async def test_spectator_gets_snapshot_then_coalesced_delta(async_session: AsyncSession, ws_client: TestClient):
+    """Zuschauer-Socket: erst Snapshot, dann EIN Delta für eine komplette Aufnahme."""
+    async def override_get_db():
+        yield async_session
+
+    app.dependency_overrides[get_read_db] = override_get_db
+    interval = scoreboard_broadcaster.interval
+    scoreboard_broadcaster.configure(interval=0.5)
+
+    game = await _setup_game(async_session)
+    host_pid = game.participants[0].id
+    token = create_access_token({"sub": "board"})
+    try:
+        with ws_client.websocket_connect(f"/ws/games/{game.id}/spectate") as spectator:
+            snapshot = spectator.receive_json()
+            assert snapshot["type"] == "snapshot"
+            assert snapshot["scoreboard"]["participants"][0]["new_score"] == 501
+
+            with ws_client.websocket_connect(f"/ws/games/{game.id}?token={token}") as board:
+                board.receive_json()
+                for _ in range(3):
+                    board.send_json({"value": 20, "multiplier": 3})
+                    board.receive_json()
+
+            delta = spectator.receive_json()
+            assert delta["type"] == "delta" and delta["seq"] == 1
+            changed = {p["participant_id"]: p for p in delta["changes"]["participants"]}
+            assert changed[host_pid]["new_score"] == 321
+            assert changed[host_pid]["dart3_score"] == 60
+            assert "username" not in changed[host_pid]
+    finally:
+        scoreboard_broadcaster.configure(interval=interval)
+
+    assert scoreboard_broadcaster.subscriber_count(game.id) == 0
+
+
+@pytest.mark.asyncio
+async def test_scoreboard_stream_unknown_game(client):
+    response = await client.get("/games/9999/scoreboard/stream")
+    assert response.status_code == 404
@@ -0,0 +1,45 @@
+import json
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.game_mode_crud import create_game_mode
+from app.schemas.game_mode_schemas import GameModeCreate
+
+
+async def _token(client: AsyncClient) -> dict:
+    await client.post("/users/register", json={"username": "admin", "email": "admin@example.com", "password": "12345"})
+    r = await client.post("/users/login", json={"username": "admin", "password": "12345"})
+    return {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+
+@pytest.mark.asyncio
+async def test_import_matches_endpoint(client: AsyncClient, async_session: AsyncSession):
+    await create_game_mode(
+        async_session, GameModeCreate(name="301", starting_score=301, scoring_type="subtract", checkout_rule="double")
+    )
+    headers = await _token(client)
+    darts = [("anna", 20, 3)] * 3 + [("ben", 1, 1)] * 3 + [("anna", 20, 3), ("anna", 11, 3), ("anna", 14, 2)]
+    body = json.dumps({
+        "external_id": "m1",
+        "game_mode": "301",
+        "started_at": "2024-03-01T19:00:00Z",
+        "throws": [{"player": p, "value": v, "multiplier": m} for p, v, m in darts],
+    }) + "\n"
+
+    r = await client.post("/imports/matches", params={"name": "upload"}, content=body, headers=headers)
+    assert r.status_code == 200, r.text
+    result = r.json()
+    assert (result["status"], result["matches_imported"], result["throws_imported"]) == ("completed", 1, 9)
+
+    r = await client.get("/imports/upload", headers=headers)
+    assert r.status_code == 200 and r.json()["records_done"] == 1
+    assert (await client.get("/imports/missing", headers=headers)).status_code == 404
+
+    # Importierte User haben kein Passwort
+    r = await client.post("/users/login", json={"username": "anna", "password": ""})
+    assert r.status_code == 401
+
+    r = await client.post("/imports/matches", params={"name": "other", "format": "xml"}, content=body, headers=headers)
+    assert r.status_code == 422
@@ -0,0 +1,47 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.user_crud import create_user
+from app.crud.game_mode_crud import create_game_mode
+from app.schemas.game_mode_schemas import GameModeCreate
+from app.services.game_service import GameService
+from app.services.statistics_service import stat_accumulators
+
+
+@pytest.mark.asyncio
+async def test_leaderboard_follows_statistics_flush(async_session: AsyncSession, client: AsyncClient):
+    host = await create_user(async_session, username="host", email="host@example.com", password_hash="x")
+    guest = await create_user(async_session, username="guest", email="guest@example.com", password_hash="x")
+    mode = await create_game_mode(
+        async_session, GameModeCreate(name="501", starting_score=501, scoring_type="subtract", checkout_rule="double")
+    )
+    game = await GameService.start_game(
+        db=async_session, host=host, game_mode=mode, opponent_ids=[guest.id], first_to=1, first_shot="host"
+    )
+    host_p, guest_p = sorted(game.participants, key=lambda p: p.id)
+
+    for participant, value in ((host_p, 20), (guest_p, 5)):
+        for _ in range(3):
+            response = await client.post("/throws/", json={
+                "game_id": game.id, "participant_id": participant.id, "value": value, "multiplier": 1,
+            })
+            assert response.status_code == 200, response.text
+
+    # Vor dem Flush: noch nichts in den Listen
+    response = await client.get(f"/leaderboards/highest_checkout/users/{host.id}")
+    assert response.status_code == 404
+
+    await stat_accumulators.flush(async_session)
+
+    response = await client.get("/leaderboards/wins", params={"game_mode_id": mode.id})
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["total"] == 2
+    assert {e["username"] for e in body["entries"]} == {"host", "guest"}
+    assert all(e["rank"] == 1 for e in body["entries"])   # beide 0 Siege
+
+    response = await client.get(f"/leaderboards/wins/users/{guest.id}")
+    assert response.json()["rank"] == 1 and response.json()["total"] == 2
+
+    assert (await client.get("/leaderboards/longest_leg")).status_code == 422
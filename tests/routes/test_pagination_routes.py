@@ -0,0 +1,87 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.friendship_crud import create_friendship
+from app.crud.game_crud import get_games_page_by_user
+from app.crud.game_mode_crud import create_game_mode
+from app.crud.user_crud import create_user
+from app.schemas.friendship_schemas import FriendshipCreate
+from app.schemas.game_mode_schemas import GameModeCreate
+from app.services.game_service import GameService
+
+
+async def collect(client: AsyncClient, url: str, limit: int) -> tuple[list, int]:
+    """Alle Seiten abholen → (alle Einträge, Anzahl Requests)."""
+    items, cursor, requests = [], None, 0
+    while True:
+        params = {"limit": limit} | ({"cursor": cursor} if cursor else {})
+        response = await client.get(url, params=params)
+        assert response.status_code == 200, response.text
+        requests += 1
+        page = response.json()
+        assert len(page["items"]) <= limit
+        items += page["items"]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return items, requests
+
+
+@pytest.mark.asyncio
+async def test_users_and_friendships_paginate_without_gaps(async_session: AsyncSession, client: AsyncClient):
+    users = [
+        await create_user(async_session, username=f"user{i}", email=f"u{i}@example.com", password_hash="x")
+        for i in range(7)
+    ]
+    items, requests = await collect(client, "/users/", limit=3)
+    assert [u["username"] for u in items] == [f"user{i}" for i in range(7)]
+    assert requests == 3
+
+    # user0 steht mal als user_id1, mal als user_id2 in der Freundschaft
+    me = users[0]
+    for i, other in enumerate(users[1:]):
+        pair = (me.id, other.id) if i % 2 else (other.id, me.id)
+        await create_friendship(async_session, FriendshipCreate(user_id1=pair[0], user_id2=pair[1]))
+    await create_friendship(async_session, FriendshipCreate(user_id1=users[1].id, user_id2=users[2].id))
+
+    items, _ = await collect(client, f"/friendships/user/{me.id}", limit=4)
+    ids = [f["id"] for f in items]
+    assert len(ids) == 6 and ids == sorted(ids)
+    assert all(me.id in (f["user_id1"], f["user_id2"]) for f in items)
+
+
+@pytest.mark.asyncio
+async def test_throws_participants_and_games_paginate(async_session: AsyncSession, client: AsyncClient):
+    host = await create_user(async_session, username="host", email="host@example.com", password_hash="x")
+    guest = await create_user(async_session, username="guest", email="guest@example.com", password_hash="x")
+    mode = await create_game_mode(
+        async_session, GameModeCreate(name="501", starting_score=501, scoring_type="subtract", checkout_rule="double")
+    )
+    game = await GameService.start_game(
+        db=async_session, host=host, game_mode=mode, opponent_ids=[guest.id], first_to=1, first_shot="host"
+    )
+    host_p, guest_p = sorted(game.participants, key=lambda p: p.id)
+    for participant in (host_p, guest_p, host_p):
+        for value in (20, 19, 18):
+            response = await client.post("/throws/", json={
+                "game_id": game.id, "participant_id": participant.id, "value": value, "multiplier": 1,
+            })
+            assert response.status_code == 200, response.text
+
+    throws, requests = await collect(client, f"/throws/game/{game.id}", limit=4)
+    assert requests == 3
+    assert [(t["turn_number"], t["throw_number_in_turn"], t["value"]) for t in throws[:4]] == [
+        (1, 1, 20), (1, 2, 19), (1, 3, 18), (1, 1, 20),
+    ]
+    assert len(throws) == 9
+
+    participants, _ = await collect(client, f"/participants/game/{game.id}", limit=1)
+    assert [p["username"] for p in participants] == ["host", "guest"]
+
+    # GET /games/user/{id} nutzt dieselbe Seite (GameOut selbst wird hier nicht geprüft)
+    games, next_cursor = await get_games_page_by_user(async_session, host.id, limit=1)
+    assert [g.id for g in games] == [game.id] and next_cursor is None
+
+    assert (await client.get(f"/throws/game/{game.id}", params={"cursor": "not-a-cursor"})).status_code == 400
+    assert (await client.get("/users/", params={"limit": 0})).status_code == 422
+    assert (await client.get("/throws/game/9999")).status_code == 404
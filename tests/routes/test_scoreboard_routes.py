@@ -0,0 +1,70 @@
+import random
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.user_crud import create_user
+from app.crud.game_mode_crud import create_game_mode
+from app.schemas.game_mode_schemas import GameModeCreate
+from app.services.game_service import GameService
+from app.services.game_state_cache import live_games
+
+
+async def start_game(db: AsyncSession):
+    host = await create_user(db, username="host", email="host@example.com", password_hash="x")
+    guest = await create_user(db, username="guest", email="guest@example.com", password_hash="x")
+    mode = await create_game_mode(
+        db, GameModeCreate(name="501 Double Out", starting_score=501, scoring_type="subtract", checkout_rule="double")
+    )
+    return await GameService.start_game(
+        db=db, host=host, game_mode=mode, opponent_ids=[guest.id], first_to=1, first_shot="host"
+    )
+
+
+@pytest.mark.asyncio
+async def test_scoreboard_follows_throws_and_survives_cache_eviction(async_session: AsyncSession, client: AsyncClient):
+    game = await start_game(async_session)
+    host_p = min(game.participants, key=lambda p: p.id)
+
+    for value, multiplier in [(20, 3), (19, 3), (18, 1)]:
+        response = await client.post("/throws/", json={
+            "game_id": game.id, "participant_id": host_p.id, "value": value, "multiplier": multiplier,
+        })
+        assert response.status_code == 200, response.text
+
+    response = await client.get(f"/games/{game.id}/scoreboard")
+    assert response.status_code == 200, response.text
+    live = response.json()
+    host = next(p for p in live["participants"] if p["username"] == "host")
+    assert (host["dart1_score"], host["dart2_score"], host["dart3_score"]) == (60, 57, 18)
+    assert host["score_last_turn"] == 135
+    assert host["new_score"] == 366
+    assert host["three_dart_average"] == 135.0
+
+    # Ohne Live-Cache: gleiche Antwort aus den game_participants-Spalten (eine Query)
+    live_games.clear()
+    response = await client.get(f"/games/{game.id}/scoreboard")
+    assert response.json() == live
+
+
+@pytest.mark.asyncio
+async def test_scoreboard_unknown_game(async_session: AsyncSession, client: AsyncClient):
+    response = await client.get("/games/999/scoreboard")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_simulate_turn_returns_scoreboard(async_session: AsyncSession, client: AsyncClient, monkeypatch):
+    game = await start_game(async_session)
+    # Deterministisch: erster Versuch ist ein ungültiger 25x3 (muss neu gezogen werden), dann T20
+    draws = iter([25, 3] + [20, 3] * 3)
+    monkeypatch.setattr(random, "choice", lambda options: next(draws))
+
+    response = await client.post(f"/game-simulation/{game.id}/simulate-turn")
+    assert response.status_code == 200, response.text
+
+    data = response.json()
+    host = next(p for p in data["participants"] if p["username"] == "host")
+    assert host["dart1_score"] == 60
+    assert host["new_score"] == 321
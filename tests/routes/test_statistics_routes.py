@@ -0,0 +1,44 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.user_crud import create_user
+from app.crud.game_mode_crud import create_game_mode
+from app.schemas.game_mode_schemas import GameModeCreate
+from app.services.game_service import GameService
+from app.services.statistics_service import stat_accumulators
+
+
+@pytest.mark.asyncio
+async def test_timeseries_after_flush(async_session: AsyncSession, client: AsyncClient):
+    host = await create_user(async_session, username="host", email="host@example.com", password_hash="x")
+    guest = await create_user(async_session, username="guest", email="guest@example.com", password_hash="x")
+    mode = await create_game_mode(
+        async_session, GameModeCreate(name="501", starting_score=501, scoring_type="subtract", checkout_rule="double")
+    )
+    game = await GameService.start_game(
+        db=async_session, host=host, game_mode=mode, opponent_ids=[guest.id], first_to=1, first_shot="host"
+    )
+    host_p = min(game.participants, key=lambda p: p.id)
+
+    for _ in range(3):
+        response = await client.post("/throws/", json={
+            "game_id": game.id, "participant_id": host_p.id, "value": 20, "multiplier": 3,
+        })
+        assert response.status_code == 200, response.text
+    await stat_accumulators.flush(async_session)
+
+    response = await client.get(
+        f"/statistics/user/{host.id}/timeseries", params={"game_mode_id": mode.id, "buckets": 5, "window": 2}
+    )
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["period"] == "day" and len(body["points"]) == 5
+
+    today = body["points"][-1]
+    assert today["throws"] == 3 and today["total_180s"] == 1
+    assert today["rolling_average_score_per_turn"] == 180.0
+    assert all(p["throws"] == 0 for p in body["points"][:-1])
+
+    response = await client.get(f"/statistics/user/{host.id}/timeseries", params={"period": "year"})
+    assert response.status_code == 422
@@ -1,9 +1,12 @@
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.auth.jwt_handler import create_access_token
 from app.models.user import User
 from app.models.game_mode import GameMode
+from app.models.throw import Throw
 from app.crud.user_crud import create_user
 from app.crud.game_mode_crud import create_game_mode
 from app.schemas.game_mode_schemas import GameModeCreate
@@ -93,4 +96,171 @@ async def test_throw_route_invalid_input(async_session: AsyncSession, client: As
         "participant_id": 1,
     })
 
-    assert response.status_code == 400
\ No newline at end of file
+    assert response.status_code == 400
+
+@pytest.mark.asyncio
+async def test_throw_batch_route_whole_turn(async_session: AsyncSession, client: AsyncClient):
+    """
+    Eine komplette Aufnahme (3 Darts) + erster Dart des Gegners in einem Request.
+    """
+    host = await create_user(async_session, username="host", email="host@example.com", password_hash="x")
+    guest = await create_user(async_session, username="guest", email="guest@example.com", password_hash="x")
+    mode = await create_game_mode(
+        async_session,
+        GameModeCreate(name="301 Double Out", starting_score=301, scoring_type="subtract", checkout_rule="double")
+    )
+    game = await GameService.start_game(
+        db=async_session, host=host, game_mode=mode, opponent_ids=[guest.id], first_to=1, first_shot="host"
+    )
+    host_p, guest_p = sorted(game.participants, key=lambda p: p.id)
+
+    payload = {"throws": [
+        {"game_id": game.id, "participant_id": host_p.id, "value": 20, "multiplier": 3},
+        {"game_id": game.id, "participant_id": host_p.id, "value": 20, "multiplier": 3},
+        {"game_id": game.id, "participant_id": host_p.id, "value": 19, "multiplier": 1},
+        {"game_id": game.id, "participant_id": guest_p.id, "value": 25, "multiplier": 2},
+    ]}
+
+    response = await client.post("/throws/batch", json=payload)
+    assert response.status_code == 200, response.text
+    data = response.json()
+
+    assert [d["throw_in_turn"] for d in data] == ["1/3", "2/3", "3/3", "1/3"]
+    assert [d["remaining"] for d in data] == [241, 181, 162, 251]
+    assert data[2]["next"] == "guest"
+    assert data[0]["throw"]["score"] == 60
+    assert all(d["throw"]["id"] for d in data)
+
+    throws = await async_session.execute(select(Throw).where(Throw.game_id == game.id))
+    assert len(throws.scalars().all()) == 4
+
+
+@pytest.mark.asyncio
+async def test_throw_batch_across_turn_change_keeps_darts_after_reload(async_session: AsyncSession, client: AsyncClient):
+    """
+    Eine Aufnahme endet und die nächste beginnt im selben Request: der Puffer der beendeten
+    Aufnahme muss trotzdem geschrieben werden, sonst fehlen die Darts nach einem Cache-Reload.
+    """
+    from app.services import dart_codec
+    from app.services.game_state_cache import live_games
+
+    host = await create_user(async_session, username="host", email="host@example.com", password_hash="x")
+    mode = await create_game_mode(
+        async_session,
+        GameModeCreate(name="501 Double Out", starting_score=501, scoring_type="subtract", checkout_rule="double")
+    )
+    game = await GameService.start_game(
+        db=async_session, host=host, game_mode=mode, opponent_ids=[], first_to=1, first_shot="host"
+    )
+    host_p = game.participants[0]
+
+    payload = {"throws": [
+        {"game_id": game.id, "participant_id": host_p.id, "value": value, "multiplier": 3}
+        for value in (20, 20, 20, 19)
+    ]}
+    response = await client.post("/throws/batch", json=payload)
+    assert response.status_code == 200, response.text
+
+    live_games.clear()
+    state = await live_games.load(async_session, game.id)
+    participant = state.participant(host_p.id)
+    assert [dart_codec.label(c) for c in participant.darts] == ["T20", "T20", "T20", "T19"]
+    assert dart_codec.dart_count(participant.darts) == participant.darts_thrown == 4
+
+@pytest.mark.asyncio
+async def test_throw_batch_route_rejects_invalid_dart(async_session: AsyncSession, client: AsyncClient):
+    response = await client.post("/throws/batch", json={"throws": [
+        {"game_id": 1, "participant_id": 1, "value": 20, "multiplier": 1},
+        {"game_id": 1, "participant_id": 1, "value": 25, "multiplier": 3},
+    ]})
+    assert response.status_code == 400
+
+    response = await client.post("/throws/batch", json={"throws": [
+        {"game_id": 999, "participant_id": 1, "value": 20, "multiplier": 1},
+    ]})
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_throw_route_uses_live_cache_and_writes_through(async_session: AsyncSession, client: AsyncClient):
+    """
+    Zweiter Dart kommt aus dem Live-Cache, Scores + Turn-Zeiger landen trotzdem in der DB.
+    """
+    from app.models.game import Game
+    from app.models.game_participant import GameParticipant
+    from app.services.game_state_cache import live_games
+
+    host = await create_user(async_session, username="host", email="host@example.com", password_hash="x")
+    guest = await create_user(async_session, username="guest", email="guest@example.com", password_hash="x")
+    mode = await create_game_mode(
+        async_session,
+        GameModeCreate(name="501 Double Out", starting_score=501, scoring_type="subtract", checkout_rule="double")
+    )
+    game = await GameService.start_game(
+        db=async_session, host=host, game_mode=mode, opponent_ids=[guest.id], first_to=1, first_shot="host"
+    )
+    host_p = min(game.participants, key=lambda p: p.id)
+
+    for _ in range(3):
+        response = await client.post("/throws/", json={
+            "game_id": game.id, "participant_id": host_p.id, "value": 20, "multiplier": 3,
+        })
+        assert response.status_code == 200, response.text
+
+    assert response.json()["next"] == "guest"
+    assert live_games.hits == 2
+    assert live_games.misses == 1
+
+    row = (await async_session.execute(
+        select(GameParticipant.current_score, GameParticipant.darts_thrown, GameParticipant.throw_in_turn)
+        .where(GameParticipant.id == host_p.id)
+    )).one()
+    assert tuple(row) == (321, 3, 3)
+
+    current_turn = await async_session.scalar(select(Game.current_turn_user_id).where(Game.id == game.id))
+    assert current_turn == guest.id
+
+    metrics = await client.get("/metrics/live-games")
+    assert metrics.json()["size"] == 1
+
+
+@pytest.mark.asyncio
+async def test_throw_export_streams_ndjson(async_session: AsyncSession, client: AsyncClient):
+    user = await create_user(async_session, username="exporter", email="exp@example.com", password_hash="x")
+    mode = await create_game_mode(
+        async_session,
+        GameModeCreate(name="301", starting_score=301, scoring_type="subtract", checkout_rule="double"),
+    )
+    game = await GameService.start_game(
+        db=async_session, host=user, game_mode=mode, opponent_ids=[], first_to=1, first_shot="host"
+    )
+    participant_id = game.participants[0].id
+    for value in (20, 19, 18):
+        response = await client.post("/throws/", json={
+            "game_id": game.id, "participant_id": participant_id, "value": value, "multiplier": 1,
+        })
+        assert response.status_code == 200, response.text
+
+    # Ohne Token kein Export
+    response = await client.get("/throws/export", params={"game_mode_id": mode.id})
+    assert response.status_code in (401, 403)
+
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': 'exporter'})}"}
+    response = await client.get(
+        "/throws/export", params={"game_mode_id": mode.id, "chunk_size": 100}, headers=headers
+    )
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = response.text.splitlines()
+    assert [line.count('"value"') for line in lines] == [1, 1, 1]
+    assert '"value":19' in lines[1]
+
+    # Fremde Spiele bleiben außen vor
+    await create_user(async_session, username="outsider", email="out@example.com", password_hash="x")
+    outsider = {"Authorization": f"Bearer {create_access_token({'sub': 'outsider'})}"}
+    response = await client.get("/throws/export", params={"game_id": game.id}, headers=outsider)
+    assert response.status_code == 200 and response.text == ""
+
+    response = await client.get("/throws/export", params={"format": "xml"}, headers=headers)
+    assert response.status_code == 422
+
@@ -1,7 +1,13 @@
 import pytest
 from httpx import AsyncClient
+from passlib.context import CryptContext
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.auth import auth_utils
+from app.auth.password_pool import password_pool
+from app.crud.user_crud import create_user, get_user_by_username
+
+
 @pytest.mark.asyncio
 async def test_register_and_login(client: AsyncClient, async_session: AsyncSession):
     """
@@ -40,4 +46,27 @@ async def test_register_and_login(client: AsyncClient, async_session: AsyncSessi
 
     token = r.json()
     assert "access_token" in token
-    assert token["token_type"] == "bearer"
\ No newline at end of file
+    assert token["token_type"] == "bearer"
+
+
+@pytest.mark.asyncio
+async def test_login_rehashes_outdated_bcrypt_cost(client: AsyncClient, async_session: AsyncSession, monkeypatch):
+    old_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("12345")
+    await create_user(async_session, "olduser", "old@example.com", old_hash)
+    monkeypatch.setattr(auth_utils, "pwd_context", CryptContext(
+        schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=5, bcrypt__min_rounds=5, bcrypt__max_rounds=5
+    ))
+
+    r = await client.post("/users/login", json={"username": "olduser", "password": "12345"})
+    assert r.status_code == 200
+
+    user = await get_user_by_username(async_session, "olduser")
+    assert user.password_hash.startswith("$2b$05$")
+
+
+@pytest.mark.asyncio
+async def test_register_returns_503_when_password_pool_is_full(client: AsyncClient, monkeypatch):
+    monkeypatch.setattr(password_pool, "max_pending", 0)
+    r = await client.post("/users/register", json={"username": "x", "email": "x@example.com", "password": "12345"})
+    assert r.status_code == 503
+    assert r.headers["retry-after"] == "1"
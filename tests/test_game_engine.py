@@ -143,19 +143,79 @@ def test_subtract_mode_bust_win_on_single(game_501_double_out):
 # --------------------------------------------------------------------------
 
 def test_add_mode_initial_hit(game_cricket, participant_cricket):
-    """Testet den ersten Wurf im Add-Modus (z.B. Cricket)."""
-    # Start: 0, Wurf: Triple 19 (57 Punkte)
+    """Testet den ersten Wurf im Add-Modus (Cricket)."""
+    # Start: 0, Wurf: Triple 19 → schließt die 19, aber noch keine Punkte
     throw = MockThrow(value=19, multiplier=3)
 
     result = GameEngine.apply_throw(game_cricket, participant_cricket, throw)
 
     # Erwartungen prüfen
     assert result["status"] == "OK"
+    assert result["remaining"] == 0
+    assert participant_cricket.current_score == 0
+
+    # Weiterer Triple 19 auf geschlossener Zahl → 57 Punkte
+    result = GameEngine.apply_throw(game_cricket, participant_cricket, throw)
     assert result["remaining"] == 57
-    assert participant_cricket.current_score == 57
 
 
 def test_add_mode_subsequent_hit(game_cricket):
     """Testet einen Folgewurf im Add-Modus."""
     participant = MockGameParticipant(initial_score=100)
-    # Wurf: Double Bull (50 Punkte) ->
\ No newline at end of file
+    # Wurf: Double Bull (50 Punkte) ->
+
+# --------------------------------------------------------------------------
+# 5. Kompilierte Regeln: Master-Out, Double-In, Cache
+# --------------------------------------------------------------------------
+
+def test_master_out_allows_triple_finish():
+    """Master-Out: Finish auf Triple ist erlaubt, Rest 1 ist Bust."""
+    game = MockGame(game_mode=MockGameMode(scoring_type="subtract", checkout_rule="master"))
+
+    result = GameEngine.apply_throw(game, MockGameParticipant(initial_score=60), MockThrow(20, 3))
+    assert result["status"] == "WIN"
+
+    result = GameEngine.apply_throw(game, MockGameParticipant(initial_score=21), MockThrow(20, 1))
+    assert result["status"] == "BUST"
+
+
+def test_double_in_ignores_darts_before_check_in():
+    """Double-In: Solange nicht eingecheckt wurde, zählen nur Doubles."""
+    mode = MockGameMode(scoring_type="subtract", checkout_rule="double")
+    mode.checkin_rule = "double"
+    game = MockGame(game_mode=mode)
+    participant = MockGameParticipant(initial_score=501)
+    participant.starting_score = 501
+
+    result = GameEngine.apply_throw(game, participant, MockThrow(20, 3))
+    assert result == {"status": "OK", "remaining": 501}
+
+    result = GameEngine.apply_throw(game, participant, MockThrow(20, 2))
+    assert result["remaining"] == 461
+
+    # Nach dem Check-in zählt jeder Dart
+    result = GameEngine.apply_throw(game, participant, MockThrow(20, 3))
+    assert result["remaining"] == 401
+
+
+def test_rules_are_cached_per_game_mode_id():
+    from app.services.game_rules import get_rules, invalidate_rules
+
+    mode = MockGameMode(scoring_type="subtract", checkout_rule="double")
+    mode.id = 9001
+    game = MockGame(game_mode=mode)
+    game.game_mode_id = 9001
+
+    first = get_rules(game)
+    mode.checkout_rule = "straight"
+    assert get_rules(game) is first  # kein erneuter Zugriff auf den GameMode
+
+    invalidate_rules(9001)
+    assert get_rules(game).checkout_rule == "straight"
+
+
+def test_unsupported_scoring_type_raises(participant_501):
+    game = MockGame(game_mode=MockGameMode(scoring_type="golf"))
+
+    with pytest.raises(ValueError):
+        GameEngine.apply_throw(game, participant_501, MockThrow(20, 1))
@@ -0,0 +1,71 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from app.services import aim_service
+from app.services.checkout_service import get_checkout_suggestion
+
+
+@pytest.fixture(autouse=True)
+def no_player_skills():
+    yield
+    aim_service.clear_player_skills()
+
+
+# ------------------------------------------
+# Board-Modell
+# ------------------------------------------
+def test_segment_codes_on_known_points():
+    codes = aim_service._segment_codes(
+        np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0]),
+        np.array([0.0, 10.0, 50.0, 103.0, 166.0, 200.0]),
+    )
+    assert codes.tolist() == [62, 61, 20, 60, 40, 0]
+
+
+def test_hit_probabilities_are_distributions():
+    probs = aim_service.hit_probabilities(20)
+    assert np.allclose(probs.sum(axis=1), 1.0)
+
+    # Wer auf T20 zielt, trifft am häufigsten die 20 (Single oder Triple)
+    t20 = aim_service.AIM_LABELS.index("T20")
+    assert probs[t20].argmax() in (20, 60)
+
+
+def test_better_players_finish_more_often():
+    good, _ = aim_service.success_table(15, "double")
+    weak, _ = aim_service.success_table(50, "double")
+    assert good[3][40] > weak[3][40]
+    assert good[3][1] == 0.0  # 1 Punkt ist bei Double-Out nicht auscheckbar
+
+
+# ------------------------------------------
+# Integration in checkout_service
+# ------------------------------------------
+def test_checkout_suggestion_uses_player_skill():
+    aim_service.success_table(15, "double")
+    aim_service.set_player_sigma(4242, 15)
+    suggestion = get_checkout_suggestion(40, darts_left=1, user_id=4242)
+    assert suggestion == "D20"
+
+    recommendation = aim_service.recommend_checkout(40, 1, "double", 15)
+    assert 0 < recommendation["probability"] < 1
+
+
+def test_unknown_player_falls_back_to_static_table():
+    assert get_checkout_suggestion(100, user_id=987654) == "T20, D20"
+
+
+@pytest.mark.asyncio
+async def test_cold_skill_bucket_falls_back_and_builds_in_executor():
+    aim_service._TABLES.pop((60, "double"), None)
+    aim_service.set_player_sigma(4242, 60)
+
+    # Kalter Bucket: sofort die statische Tabelle, Berechnung läuft im Hintergrund
+    assert get_checkout_suggestion(100, user_id=4242) == "T20, D20"
+    building = aim_service._BUILDING[(60, "double")]
+    await asyncio.wait_for(building, timeout=30)
+
+    assert aim_service.table_ready(60, "double")
+    assert get_checkout_suggestion(100, user_id=4242) == aim_service.recommend_checkout(100, 3, "double", 60)["path"]
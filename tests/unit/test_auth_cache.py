@@ -0,0 +1,71 @@
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from app.auth.auth_cache import TTLCache, Principal, decode_token_cached, principal_cache, token_cache
+from app.auth.auth_utils import resolve_principal
+from app.auth.jwt_handler import create_access_token
+from app.crud.user_crud import create_user
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_cache_evicts_lru_and_expires_absolutely():
+    clock = FakeClock()
+    cache = TTLCache(max_entries=2, ttl=10, clock=clock)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1          # a ist jetzt zuletzt benutzt
+    cache.put("c", 3)                   # → b fliegt raus
+    assert cache.get("b") is None and cache.evictions == 1
+
+    clock.now = 9
+    assert cache.get("a") == 1          # Zugriff verlängert NICHT
+    clock.now = 10
+    assert cache.get("a") is None and cache.expirations == 1
+
+    cache.put("d", 4, ttl=-1)           # abgelaufenes Token → gar nicht cachen
+    assert cache.get("d") is None
+    cache.invalidate("c")
+    assert len(cache) == 0 and cache.invalidations == 1
+
+
+def test_token_cache_stores_valid_tokens_only():
+    token = create_access_token({"sub": "anna"}, expires_delta=timedelta(minutes=5))
+
+    assert decode_token_cached(token)["sub"] == "anna"
+    assert decode_token_cached(token)["sub"] == "anna"
+    assert (token_cache.misses, token_cache.hits) == (1, 1)
+    # Der Schlüssel ist der Digest, nicht das Token
+    assert token not in token_cache._entries
+
+    expired = create_access_token({"sub": "anna"}, expires_delta=timedelta(seconds=-1))
+    with pytest.raises(HTTPException):
+        decode_token_cached(expired)
+    assert len(token_cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_principal_is_cached_and_invalidated_on_user_change(async_session):
+    user = await create_user(async_session, username="anna", email="anna@example.com", password_hash="x")
+    token = create_access_token({"sub": "anna"})
+
+    principal = await resolve_principal(async_session, token)
+    assert principal == Principal(id=user.id, username="anna")
+    assert await resolve_principal(async_session, token) is principal
+    assert principal_cache.hits == 1
+
+    # Umbenennen über die ORM-Session → alter Name fliegt aus dem Cache
+    user.username = "anna2"
+    await async_session.commit()
+    assert principal_cache.invalidations == 1
+    with pytest.raises(HTTPException) as exc:
+        await resolve_principal(async_session, token)
+    assert exc.value.status_code == 401
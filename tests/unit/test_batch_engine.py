@@ -0,0 +1,123 @@
+import numpy as np
+import pytest
+
+from app.services.batch_engine import (
+    BatchX01Engine,
+    STATUS_NAMES,
+    STATUS_SKIPPED,
+)
+from app.services.game_engine import GameEngine
+from app.services.turn_service import TurnService
+
+
+# ---------------------------------------------------------
+# Hilfsobjekte für die skalare GameEngine
+# ---------------------------------------------------------
+class Mode:
+    def __init__(self, checkout_rule, checkin_rule=None):
+        self.scoring_type = "subtract"
+        self.starting_score = 501
+        self.checkout_rule = checkout_rule
+        self.checkin_rule = checkin_rule
+
+
+class Game:
+    def __init__(self, checkout_rule, checkin_rule=None):
+        self.game_mode = Mode(checkout_rule, checkin_rule)
+
+
+class Participant:
+    def __init__(self, score):
+        self.current_score = score
+        self.starting_score = 501
+
+
+class Dart:
+    def __init__(self, value, multiplier):
+        self.value = value
+        self.multiplier = multiplier
+
+
+# Alle gültigen Felder inkl. Miss (0) und Bull (25 / 25x2)
+SEGMENTS = [(0, 1)] + [(v, m) for v in range(1, 21) for m in (1, 2, 3)] + [(25, 1), (25, 2)]
+
+
+# ---------------------------------------------------------
+# Parität: ein Dart, alle Scores × alle Felder
+# ---------------------------------------------------------
+@pytest.mark.parametrize(
+    "checkout_rule, checkin_rule",
+    [("double", None), ("master", None), ("straight", None), (None, None), ("double", "double")],
+)
+def test_apply_darts_matches_scalar_engine(checkout_rule, checkin_rule):
+    engine = BatchX01Engine(checkout_rule=checkout_rule, checkin_rule=checkin_rule)
+    game = Game(checkout_rule, checkin_rule)
+
+    grid = [(s, v, m) for s in list(range(0, 200)) + [501] for v, m in SEGMENTS]
+    scores = np.array([g[0] for g in grid])
+    values = np.array([g[1] for g in grid])
+    multipliers = np.array([g[2] for g in grid])
+
+    new_scores, status = engine.apply_darts(scores, values, multipliers)
+
+    for i, (score, value, multiplier) in enumerate(grid):
+        participant = Participant(score)
+        expected = GameEngine.apply_throw(game, participant, Dart(value, multiplier))
+
+        assert STATUS_NAMES[int(status[i])] == expected["status"]
+        assert new_scores[i] == expected["remaining"]
+
+
+# ---------------------------------------------------------
+# Parität: komplette Aufnahmen inkl. Turn-Ende bei BUST/WIN
+# ---------------------------------------------------------
+@pytest.mark.parametrize("checkout_rule", ["double", "master", "straight"])
+def test_play_turn_matches_scalar_turns(checkout_rule):
+    rng = np.random.default_rng(42)
+    engine = BatchX01Engine(checkout_rule=checkout_rule)
+    game = Game(checkout_rule)
+
+    n = 2000
+    picks = rng.integers(0, len(SEGMENTS), size=(n, 3))
+    values = np.array([[SEGMENTS[p][0] for p in row] for row in picks])
+    multipliers = np.array([[SEGMENTS[p][1] for p in row] for row in picks])
+    scores = rng.integers(2, 120, size=n)
+
+    new_scores, status = engine.play_turn(scores, values, multipliers)
+
+    for i in range(n):
+        participant = Participant(int(scores[i]))
+        for dart in range(3):
+            result = GameEngine.apply_throw(
+                game, participant, Dart(int(values[i, dart]), int(multipliers[i, dart]))
+            )
+            assert STATUS_NAMES[int(status[i, dart])] == result["status"]
+            if TurnService.should_change_player(result["status"], dart + 1):
+                break
+
+        assert (status[i, dart + 1:] == STATUS_SKIPPED).all()
+        assert new_scores[i] == participant.current_score
+
+
+# ---------------------------------------------------------
+# Komplette Legs
+# ---------------------------------------------------------
+def test_simulate_legs_is_reproducible_with_seed():
+    engine = BatchX01Engine(starting_score=301)
+
+    a = engine.simulate_legs(500, rng=np.random.default_rng(7))
+    b = engine.simulate_legs(500, rng=np.random.default_rng(7))
+
+    assert np.array_equal(a["winner"], b["winner"])
+    assert np.array_equal(a["darts"], b["darts"])
+
+
+def test_simulate_legs_winner_reaches_zero():
+    engine = BatchX01Engine(starting_score=501)
+    result = engine.simulate_legs(1000, num_players=3, rng=np.random.default_rng(1))
+
+    finished = result["winner"] >= 0
+    assert finished.mean() > 0.9
+    # Der Gewinner hat mindestens 9 Darts gebraucht (perfektes 501-Leg)
+    winner_darts = result["darts"][finished, result["winner"][finished]]
+    assert (winner_darts >= 9).all()
@@ -0,0 +1,149 @@
+import asyncio
+
+import pytest
+
+from app.services.broadcaster import ScoreboardBroadcaster, BroadcastBackend, scoreboard_delta
+
+
+class State:
+    """Minimaler Spielzustand – der Snapshot kommt aus der Test-Snapshot-Funktion."""
+    def __init__(self, game_id, score):
+        self.game_id = game_id
+        self.score = score
+
+
+def snapshot(state):
+    return {
+        "game_id": state.game_id,
+        "status": "ongoing",
+        "participants": [
+            {"participant_id": 1, "new_score": state.score, "username": "anna"},
+            {"participant_id": 2, "new_score": 501, "username": "ben"},
+        ],
+    }
+
+
+def base(score=501):
+    return snapshot(State(1, score))
+
+
+def drain(sub):
+    frames = []
+    while not sub.queue.empty():
+        frames.append(sub.queue.get_nowait())
+    return frames
+
+
+def test_scoreboard_delta_only_changed_fields():
+    old = base(501)
+    new = base(441)
+    new["status"] = "finished"
+
+    assert scoreboard_delta(old, new) == {
+        "status": "finished",
+        "participants": [{"participant_id": 1, "new_score": 441}],
+    }
+    assert scoreboard_delta(new, new) == {}
+
+
+@pytest.mark.asyncio
+async def test_burst_is_coalesced_into_one_delta():
+    broadcaster = ScoreboardBroadcaster(interval=0.01, snapshot=snapshot)
+    sub = broadcaster.subscribe(1, base())
+    assert drain(sub) == [{"type": "snapshot", "game_id": 1, "seq": 0, "scoreboard": base()}]
+
+    state = State(1, 501)
+    for score in (481, 461, 441):
+        state.score = score
+        broadcaster.notify(state)
+    await asyncio.sleep(0.05)
+
+    frames = drain(sub)
+    assert frames == [
+        {"type": "delta", "game_id": 1, "seq": 1, "changes": {"participants": [{"participant_id": 1, "new_score": 441}]}}
+    ]
+    assert broadcaster.stats()["notifications"] == 3
+    assert broadcaster.stats()["published"] == 1
+
+
+@pytest.mark.asyncio
+async def test_notify_without_local_subscribers_is_a_noop():
+    broadcaster = ScoreboardBroadcaster(interval=0.01, snapshot=snapshot)
+    broadcaster.notify(State(1, 441))
+    assert broadcaster.stats()["pending"] == 0
+    assert broadcaster._timer is None
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_is_downsampled_then_dropped():
+    broadcaster = ScoreboardBroadcaster(queue_size=2, max_overflows=1, snapshot=snapshot)
+    fast = broadcaster.subscribe(1, base())
+    slow = broadcaster.subscribe(1, base())
+    drain(fast)
+
+    # Queue des langsamen Zuschauers: Snapshot + 1 Delta → beim 2. Delta voll
+    broadcaster.deliver(1, base(481))
+    broadcaster.deliver(1, base(461))
+
+    frames = drain(slow)
+    assert [f["type"] for f in frames] == ["snapshot"]
+    assert frames[0]["scoreboard"]["participants"][0]["new_score"] == 461
+    assert slow.dropped == 3
+
+    # Schneller Zuschauer hat alle Deltas bekommen
+    assert [f["seq"] for f in drain(fast)] == [1, 2]
+
+    # Nochmal überlaufen → getrennt (None), schneller Zuschauer bleibt angemeldet
+    for score in (441, 421, 401):
+        broadcaster.deliver(1, base(score))
+    assert slow.closed
+    assert drain(slow) == [None]
+    assert broadcaster.subscriber_count(1) == 1
+    assert broadcaster.stats()["slow_disconnects"] == 1
+
+
+@pytest.mark.asyncio
+async def test_new_subscriber_starts_from_last_distributed_snapshot():
+    broadcaster = ScoreboardBroadcaster(snapshot=snapshot)
+    first = broadcaster.subscribe(1, base())
+    broadcaster.deliver(1, base(441))
+
+    # Veralteter Basis-Snapshot (z. B. von der Replica) wird ignoriert
+    second = broadcaster.subscribe(1, base(501))
+    frame = drain(second)[0]
+    assert frame["seq"] == 1
+    assert frame["scoreboard"]["participants"][0]["new_score"] == 441
+
+    broadcaster.unsubscribe(first)
+    broadcaster.unsubscribe(second)
+    assert broadcaster.stats()["games"] == 0
+
+
+@pytest.mark.asyncio
+async def test_custom_backend_carries_snapshots_between_workers():
+    class LoopbackBackend(BroadcastBackend):
+        """Simuliert einen Pub/Sub-Kanal: publish → alle gebundenen Worker."""
+        def __init__(self):
+            self.workers = []
+            self.published = []
+
+        def bind(self, deliver):
+            self.workers.append(deliver)
+
+        def publish(self, game_id, snap):
+            self.published.append(game_id)
+            for deliver in self.workers:
+                deliver(game_id, snap)
+
+    backend = LoopbackBackend()
+    publisher = ScoreboardBroadcaster(interval=0.01, backend=backend, snapshot=snapshot)
+    spectator_worker = ScoreboardBroadcaster(backend=backend, snapshot=snapshot)
+    sub = spectator_worker.subscribe(1, base())
+    drain(sub)
+
+    # Publisher hat selbst keine Zuschauer, muss aber trotzdem veröffentlichen
+    publisher.notify(State(1, 441))
+    await asyncio.sleep(0.05)
+
+    assert backend.published == [1]
+    assert drain(sub)[0]["changes"] == {"participants": [{"participant_id": 1, "new_score": 441}]}
@@ -0,0 +1,71 @@
+import pytest
+
+from app.services.checkout_service import (
+    CHECKOUT_RULES,
+    MAX_SCORE,
+    get_checkout_path,
+    get_checkout_suggestion,
+)
+
+
+# ------------------------------------------
+# Alle Tabelleneinträge sind gültige Finishes
+# ------------------------------------------
+@pytest.mark.parametrize("rule", CHECKOUT_RULES)
+@pytest.mark.parametrize("darts_left", [1, 2, 3])
+def test_every_path_is_a_valid_finish(rule, darts_left):
+    for score in range(1, MAX_SCORE + 1):
+        path = get_checkout_path(score, darts_left, rule)
+        if path is None:
+            continue
+
+        assert len(path) <= darts_left
+        assert sum(v * m for v, m in path) == score
+
+        _, last_multiplier = path[-1]
+        if rule == "double":
+            assert last_multiplier == 2
+        if rule == "master":
+            assert last_multiplier in (2, 3)
+
+
+# ------------------------------------------
+# Bekannte Finishes
+# ------------------------------------------
+def test_known_double_out_finishes():
+    assert get_checkout_suggestion(170) == "T20, T20, Bull"
+    assert get_checkout_suggestion(100) == "T20, D20"
+    assert get_checkout_suggestion(50) == "Bull"
+    assert get_checkout_suggestion(40) == "D20"
+    assert get_checkout_suggestion(32) == "D16"
+
+
+def test_impossible_double_out_scores():
+    for score in (1, 159, 162, 163, 165, 166, 168, 169, 171):
+        assert get_checkout_suggestion(score) is None
+
+
+# ------------------------------------------
+# Bereits geworfene Darts im Turn werden berücksichtigt
+# ------------------------------------------
+def test_darts_left_limits_the_finish():
+    assert get_checkout_suggestion(100, darts_left=3) == "T20, D20"
+    assert get_checkout_suggestion(100, darts_left=1) is None
+    assert get_checkout_suggestion(60, darts_left=1) is None
+    assert get_checkout_suggestion(40, darts_left=1) == "D20"
+
+
+# ------------------------------------------
+# Straight-Out / Master-Out
+# ------------------------------------------
+def test_straight_and_master_out():
+    assert get_checkout_suggestion(180, checkout_rule="straight") == "T20, T20, T20"
+    assert get_checkout_suggestion(180, checkout_rule="double") is None
+    assert get_checkout_suggestion(57, darts_left=1, checkout_rule="master") == "T19"
+    assert get_checkout_suggestion(1, checkout_rule="straight") == "1"
+    assert get_checkout_suggestion(1, checkout_rule="master") is None
+
+
+def test_unknown_rule_falls_back_to_straight():
+    assert get_checkout_suggestion(1, checkout_rule=None) == "1"
+    assert get_checkout_suggestion(1, checkout_rule="none") == "1"
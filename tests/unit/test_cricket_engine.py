@@ -0,0 +1,120 @@
+import numpy as np
+
+from app.services.cricket_engine import (
+    ALL_CLOSED,
+    CricketEngine,
+    TARGETS,
+    closed_mask,
+    marks_on,
+)
+from app.services.game_engine import GameEngine
+
+
+class Mode:
+    scoring_type = "add"
+    checkout_rule = "none"
+
+
+class Game:
+    def __init__(self, participants):
+        self.game_mode = Mode()
+        self.participants = participants
+
+
+class Player:
+    def __init__(self, score=0, marks=0):
+        self.current_score = score
+        self.cricket_marks = marks
+
+
+class Dart:
+    def __init__(self, value, multiplier):
+        self.value = value
+        self.multiplier = multiplier
+
+
+def closed_state(*values):
+    """Zustand, in dem die angegebenen Ziele geschlossen sind."""
+    state = 0
+    for v in values:
+        state, _ = CricketEngine.apply_dart(state, v, 3, 0)
+    return state
+
+
+# ---------------------------------------------------------
+# Marks, Schließen, Punkten
+# ---------------------------------------------------------
+def test_marks_accumulate_and_close():
+    state, points = CricketEngine.apply_dart(0, 20, 2, 0)
+    assert marks_on(state, TARGETS.index(20)) == 2
+    assert points == 0
+    assert closed_mask(state) == 0
+
+    state, points = CricketEngine.apply_dart(state, 20, 3, 0)
+    assert marks_on(state, TARGETS.index(20)) == 3
+    assert closed_mask(state) == 1 << TARGETS.index(20)
+    assert points == 40  # 2 überzählige Marks × 20
+
+
+def test_no_points_on_numbers_closed_by_all_opponents():
+    state = closed_state(19)
+    opponents_closed = 1 << TARGETS.index(19)
+
+    _, points = CricketEngine.apply_dart(state, 19, 3, opponents_closed)
+    assert points == 0
+
+
+def test_non_cricket_numbers_are_ignored():
+    assert CricketEngine.apply_dart(0, 7, 3, 0) == (0, 0)
+    assert CricketEngine.apply_dart(0, 0, 1, 0) == (0, 0)
+
+
+# ---------------------------------------------------------
+# Integration in die GameEngine + Siegprüfung
+# ---------------------------------------------------------
+def test_game_engine_win_when_all_closed_and_ahead():
+    player = Player(score=10, marks=closed_state(15, 16, 17, 18, 19, 20))
+    opponent = Player(score=0)
+    game = Game([player, opponent])
+
+    result = GameEngine.apply_throw(game, player, Dart(25, 2))
+    assert result["status"] == "OK"  # Bull erst 2 Marks
+
+    result = GameEngine.apply_throw(game, player, Dart(25, 1))
+    assert closed_mask(player.cricket_marks) == ALL_CLOSED
+    assert result["status"] == "WIN"
+
+
+def test_game_engine_no_win_when_behind():
+    player = Player(score=0, marks=closed_state(15, 16, 17, 18, 19, 20))
+    opponent = Player(score=100)
+    game = Game([player, opponent])
+
+    GameEngine.apply_throw(game, player, Dart(25, 2))
+    result = GameEngine.apply_throw(game, player, Dart(25, 1))
+    assert result["status"] == "OK"
+
+
+# ---------------------------------------------------------
+# Batch-Auswertung = skalare Auswertung
+# ---------------------------------------------------------
+def test_batch_matches_scalar():
+    rng = np.random.default_rng(3)
+    n = 5000
+    states = np.zeros(n, dtype=np.int64)
+    opponents_closed = rng.integers(0, ALL_CLOSED + 1, size=n)
+    expected_states = [0] * n
+
+    for _ in range(12):
+        values = rng.choice([0, 1, 14, 15, 16, 17, 18, 19, 20, 25], size=n)
+        multipliers = np.where(values == 25, rng.integers(1, 3, size=n), rng.integers(1, 4, size=n))
+
+        states, points = CricketEngine.apply_darts(states, values, multipliers, opponents_closed)
+
+        for i in range(n):
+            expected_states[i], expected_points = CricketEngine.apply_dart(
+                expected_states[i], int(values[i]), int(multipliers[i]), int(opponents_closed[i])
+            )
+            assert points[i] == expected_points
+
+    assert states.tolist() == expected_states
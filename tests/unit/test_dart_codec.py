@@ -0,0 +1,125 @@
+import sys
+
+import pytest
+from sqlalchemy import select
+
+from app.crud.game_mode_crud import create_game_mode
+from app.crud.user_crud import create_user
+from app.models.game_participant import GameParticipant
+from app.models.throw import Throw
+from app.schemas.game_mode_schemas import GameModeCreate
+from app.schemas.throw_schemas import ThrowCreate
+from app.services import dart_codec
+from app.services.aim_service import SEGMENT_POINTS
+from app.services.game_service import GameService
+from app.services.game_state_cache import live_games
+from app.services.statistics_service import StatAccumulator, stat_accumulators
+from app.services.throw_service import ThrowService
+
+
+def test_codes_roundtrip_and_match_aim_layout():
+    for code in range(dart_codec.NUM_CODES):
+        dart = dart_codec.decode(code)
+        if code:
+            assert dart_codec.encode(dart.value, dart.multiplier) == code
+        assert dart.score == SEGMENT_POINTS[code]
+
+    assert dart_codec.encode(0, 3) == dart_codec.MISS
+    assert [dart_codec.label(c) for c in (0, 20, 36, 60, 61, 62)] == ["MISS", "S20", "D16", "T20", "25", "BULL"]
+    for bad in ((25, 3), (21, 1), (20, 4)):
+        with pytest.raises(ValueError):
+            dart_codec.encode(*bad)
+
+
+def test_turns_from_buffer():
+    darts = bytearray()
+    for value, multiplier, bust in [
+        (20, 3, False), (20, 3, False), (20, 3, False),     # 180
+        (19, 3, False), (20, 3, True),                      # Bust nach 2 Darts
+        (5, 1, False), (1, 1, False), (20, 3, True),        # Bust mit dem 3. Dart
+        (16, 2, False),                                     # offene Aufnahme / Checkout
+    ]:
+        dart_codec.append_dart(darts, value, multiplier, bust)
+
+    assert dart_codec.dart_count(darts) == 9
+    assert dart_codec.total_points(darts) == 180 + 117 + 66 + 32
+    # Bust-Dart zählt nicht, die Darts davor schon
+    assert dart_codec.turn_points(darts) == [180, 57, 6]
+    assert dart_codec.turn_points(darts, finished=True) == [180, 57, 6, 32]
+    # 1 Byte pro Dart (+ Marker) statt eines ORM-Objekts pro Dart
+    assert len(darts) == 11 < sys.getsizeof(Throw(value=20, multiplier=3))
+
+
+@pytest.mark.asyncio
+async def test_live_buffer_is_persisted_and_matches_scoreboard(async_session):
+    host = await create_user(async_session, username="anna", email="anna@example.com", password_hash="x")
+    guest = await create_user(async_session, username="ben", email="ben@example.com", password_hash="x")
+    mode = await create_game_mode(
+        async_session, GameModeCreate(name="101", starting_score=101, scoring_type="subtract", checkout_rule="double")
+    )
+    game = await GameService.start_game(
+        db=async_session, host=host, game_mode=mode, opponent_ids=[guest.id], first_to=1, first_shot="host"
+    )
+    host_p, guest_p = sorted(game.participants, key=lambda p: p.id)
+
+    # Host: 60 + Bust (60 > 41) | Gast: 3 Darts | Host: 1 + D20 → Checkout
+    for participant, value, multiplier in [
+        (host_p, 20, 3), (host_p, 20, 3),
+        (guest_p, 20, 1), (guest_p, 0, 1), (guest_p, 25, 2),
+        (host_p, 1, 1), (host_p, 20, 2),
+    ]:
+        await ThrowService.process_throw(
+            async_session, ThrowCreate(game_id=game.id, participant_id=participant.id, value=value, multiplier=multiplier)
+        )
+
+    live_games.clear()
+    state = await live_games.load(async_session, game.id)
+    host_darts = state.participant(host_p.id).darts
+    assert [dart_codec.label(c) for c in dart_codec.codes(host_darts)] == ["T20", "T20", "S1", "D20"]
+    assert dart_codec.turn_points(host_darts, finished=True) == [60, 41]
+    assert dart_codec.turn_points(state.participant(guest_p.id).darts) == [state.scoreboard[guest_p.id].score_last_turn]
+
+    stored = (await async_session.scalars(select(GameParticipant.darts).order_by(GameParticipant.id))).all()
+    assert stored == [bytes(host_darts), bytes(state.participant(guest_p.id).darts)]
+
+    # Statistik direkt aus dem Puffer = live fortgeschriebene Akkumulatoren (ohne Checkouts)
+    from_buffer = StatAccumulator()
+    from_buffer.record_darts(host_darts, finished=True)
+    live = next(acc for (user_id, *_), acc in stat_accumulators.pending.items() if user_id == host.id)
+    assert from_buffer.throws == live.throws
+    assert from_buffer.turns == live.turns
+
+
+@pytest.mark.asyncio
+async def test_buffer_is_written_per_turn_and_open_turn_restored_from_throws(async_session):
+    host = await create_user(async_session, username="anna", email="anna@example.com", password_hash="x")
+    guest = await create_user(async_session, username="ben", email="ben@example.com", password_hash="x")
+    mode = await create_game_mode(
+        async_session, GameModeCreate(name="501", starting_score=501, scoring_type="subtract", checkout_rule="double")
+    )
+    game = await GameService.start_game(
+        db=async_session, host=host, game_mode=mode, opponent_ids=[guest.id], first_to=1, first_shot="host"
+    )
+    host_p = min(game.participants, key=lambda p: p.id)
+
+    async def throw(value, multiplier):
+        await ThrowService.process_throw(
+            async_session, ThrowCreate(game_id=game.id, participant_id=host_p.id, value=value, multiplier=multiplier)
+        )
+
+    async def stored():
+        return await async_session.scalar(select(GameParticipant.darts).where(GameParticipant.id == host_p.id))
+
+    # Offene Aufnahme: Blob bleibt unverändert, die Darts stehen nur in throws
+    await throw(20, 3)
+    await throw(19, 3)
+    assert await stored() == b""
+
+    # Kalter Cache mitten in der Aufnahme → Darts aus throws angehängt
+    live_games.clear()
+    state = await live_games.load(async_session, game.id)
+    assert [dart_codec.label(c) for c in state.participant(host_p.id).darts] == ["T20", "T19"]
+
+    # Aufnahme beendet → ganzer Puffer in einem UPDATE
+    await throw(18, 3)
+    assert [dart_codec.label(c) for c in await stored()] == ["T20", "T19", "T18"]
@@ -0,0 +1,80 @@
+import pytest
+from sqlalchemy import select
+
+from app.database import Base, EngineFactory, PoolProfile, create_engine_for, get_read_db, pool_profile
+from app.main import app
+from app.models.user import User
+
+
+def test_pool_profile_env_override(monkeypatch):
+    monkeypatch.setenv("DB_INGEST_POOL_SIZE", "42")
+    monkeypatch.setenv("DB_INGEST_POOL_PRE_PING", "0")
+
+    profile = pool_profile("ingest")
+    assert profile.pool_size == 42
+    assert profile.pool_pre_ping is False
+    # Nicht überschriebene Felder kommen aus dem Workload-Profil
+    assert profile.max_overflow == 10
+
+
+@pytest.mark.asyncio
+async def test_create_engine_applies_pool_settings(tmp_path):
+    engine = create_engine_for(f"sqlite+aiosqlite:///{tmp_path / 'a.db'}", PoolProfile(pool_size=3, max_overflow=1))
+    try:
+        assert engine.pool.size() == 3
+        assert engine.pool._max_overflow == 1
+    finally:
+        await engine.dispose()
+
+
+# ---------------------------------------------------------
+# Read/Write-Routing: zweite SQLite-Datei als Replica
+# ---------------------------------------------------------
+@pytest.fixture
+def factory(tmp_path):
+    return EngineFactory(
+        primary_url=f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}",
+        replica_url=f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}",
+    )
+
+
+async def setup_databases(factory):
+    for workload in ("ingest", "read"):
+        async with factory.engine(workload).begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    # Nur auf der Replica vorhanden → zeigt, welche DB gelesen wurde
+    async with factory.sessionmaker("read")() as db:
+        db.add(User(username="replica_only", email="r@example.com", password_hash="x"))
+        await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_engine_factory_routes_reads_to_replica(factory):
+    await setup_databases(factory)
+    try:
+        async with factory.sessionmaker("read")() as db:
+            assert (await db.scalars(select(User.username))).all() == ["replica_only"]
+        async with factory.sessionmaker("ingest")() as db:
+            assert (await db.scalars(select(User.username))).all() == []
+
+        # Analytics ohne eigene URL → Replica
+        assert factory.urls["analytics"] == factory.urls["read"]
+    finally:
+        await factory.dispose()
+
+
+@pytest.mark.asyncio
+async def test_read_endpoint_uses_get_read_db(factory, client):
+    await setup_databases(factory)
+
+    async def override_get_read_db():
+        async with factory.sessionmaker("read")() as session:
+            yield session
+
+    app.dependency_overrides[get_read_db] = override_get_read_db
+    try:
+        response = await client.get("/users/")
+        assert [u["username"] for u in response.json()["items"]] == ["replica_only"]
+    finally:
+        await factory.dispose()
@@ -0,0 +1,68 @@
+import csv
+import io
+import json
+from datetime import datetime, timedelta, UTC
+
+import pytest
+
+from app.crud.game_mode_crud import create_game_mode
+from app.crud.user_crud import create_user
+from app.schemas.game_mode_schemas import GameModeCreate
+from app.schemas.throw_schemas import ThrowCreate
+from app.services.export_service import ExportFilter, ExportRun, ExportService, FIELDS, export_metrics
+from app.services.game_service import GameService
+from app.services.throw_service import ThrowService
+
+
+async def _game_with_throws(db, darts_per_player=6):
+    host = await create_user(db, username="anna", email="anna@example.com", password_hash="x")
+    guest = await create_user(db, username="ben", email="ben@example.com", password_hash="x")
+    mode = await create_game_mode(
+        db, GameModeCreate(name="501", starting_score=501, scoring_type="subtract", checkout_rule="double")
+    )
+    game = await GameService.start_game(
+        db=db, host=host, game_mode=mode, opponent_ids=[guest.id], first_to=1, first_shot="host"
+    )
+    host_p, guest_p = sorted(game.participants, key=lambda p: p.id)
+    for _ in range(darts_per_player // 3):
+        for participant in (host_p, guest_p):
+            for _ in range(3):
+                await ThrowService.process_throw(
+                    db, ThrowCreate(game_id=game.id, participant_id=participant.id, value=20, multiplier=1)
+                )
+    return game, host, guest
+
+
+async def collect(db, filters, fmt, chunk_size):
+    run = ExportRun(fmt)
+    chunks = [chunk async for chunk in ExportService.stream(db, filters, fmt, chunk_size, run)]
+    return chunks, run
+
+
+@pytest.mark.asyncio
+async def test_ndjson_export_is_chunked_by_cursor_partitions(async_session):
+    game, host, guest = await _game_with_throws(async_session)
+
+    chunks, run = await collect(async_session, ExportFilter(game_id=game.id), "ndjson", chunk_size=5)
+    rows = [json.loads(line) for chunk in chunks for line in chunk.splitlines()]
+
+    assert (run.rows, run.chunks, len(chunks)) == (12, 3, 3)
+    assert [r["throw_id"] for r in rows] == sorted(r["throw_id"] for r in rows)
+    assert set(rows[0]) == set(FIELDS)
+    assert rows[0]["score"] == 20 and rows[0]["user_id"] == host.id
+    assert export_metrics.last is run and run.rows_per_second > 0
+
+
+@pytest.mark.asyncio
+async def test_csv_export_filters_by_user_and_date(async_session):
+    game, host, guest = await _game_with_throws(async_session)
+
+    chunks, _ = await collect(async_session, ExportFilter(user_id=guest.id), "csv", chunk_size=4)
+    table = list(csv.reader(io.StringIO("".join(chunks))))
+    assert table[0] == FIELDS                       # Kopfzeile genau einmal
+    assert len(table) == 1 + 6
+    assert {row[FIELDS.index("user_id")] for row in table[1:]} == {str(guest.id)}
+
+    future = datetime.now(UTC) + timedelta(days=1)
+    chunks, run = await collect(async_session, ExportFilter(since=future), "csv", chunk_size=4)
+    assert run.rows == 0 and "".join(chunks).strip() == ",".join(FIELDS)
@@ -0,0 +1,156 @@
+import asyncio
+
+import pytest
+
+from app.services.game_rules import build_rules
+from app.services import game_state_cache
+from app.services.game_state_cache import LiveGameCache, LiveGameState, ParticipantState
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_state(game_id: int) -> LiveGameState:
+    return LiveGameState(
+        game_id=game_id,
+        game_mode_id=1,
+        status="ongoing",
+        current_turn_user_id=1,
+        rules=build_rules("subtract", 501, "double"),
+        participants=[ParticipantState(1, 1, "host", 501, 501, 0, 0, 0, 0)],
+    )
+
+
+# ---------------------------------------------------------
+# Hits / Misses
+# ---------------------------------------------------------
+def test_get_counts_hits_and_misses():
+    cache = LiveGameCache(max_games=4, idle_ttl=60, clock=FakeClock())
+
+    assert cache.get(1) is None
+    cache.put(make_state(1))
+    assert cache.get(1).game_id == 1
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+# ---------------------------------------------------------
+# LRU-Verdrängung
+# ---------------------------------------------------------
+def test_lru_evicts_least_recently_used():
+    cache = LiveGameCache(max_games=2, idle_ttl=60, clock=FakeClock())
+    cache.put(make_state(1))
+    cache.put(make_state(2))
+
+    cache.get(1)               # 1 ist jetzt "frischer" als 2
+    cache.put(make_state(3))   # → 2 fliegt raus
+
+    assert 1 in cache and 3 in cache
+    assert 2 not in cache
+    assert cache.evictions == 1
+
+
+# ---------------------------------------------------------
+# Idle-TTL
+# ---------------------------------------------------------
+def test_idle_ttl_expires_entries():
+    clock = FakeClock()
+    cache = LiveGameCache(max_games=10, idle_ttl=60, clock=clock)
+    cache.put(make_state(1))
+    cache.put(make_state(2))
+
+    clock.now = 50
+    assert cache.get(1) is not None   # Zugriff verlängert die Lebenszeit von 1
+
+    clock.now = 100
+    assert cache.get(2) is None       # 2 seit 100 s unbenutzt → abgelaufen
+    assert cache.get(1) is not None
+    assert cache.expirations == 1
+
+
+def test_put_drops_expired_entries_first():
+    clock = FakeClock()
+    cache = LiveGameCache(max_games=2, idle_ttl=60, clock=clock)
+    cache.put(make_state(1))
+
+    clock.now = 120
+    cache.put(make_state(2))
+
+    assert len(cache) == 1
+    assert cache.expirations == 1
+    assert cache.evictions == 0
+
+
+def test_invalidate_and_clear():
+    cache = LiveGameCache(clock=FakeClock())
+    cache.put(make_state(1))
+    cache.invalidate(1)
+    assert 1 not in cache
+
+    cache.put(make_state(2))
+    cache.get(2)
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats()["hits"] == 0
+
+
+def test_participant_lookup():
+    state = make_state(1)
+    assert state.participant(1).username == "host"
+    assert state.participant_by_user(1).id == 1
+    assert state.participant(99) is None
+
+
+
+# ---------------------------------------------------------
+# Singleflight beim Cache-Miss
+# ---------------------------------------------------------
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_state(monkeypatch):
+    calls = []
+
+    async def slow_rows(db, game_id):
+        calls.append(game_id)
+        await asyncio.sleep(0.01)
+        return [object()]
+
+    monkeypatch.setattr(game_state_cache.game_crud, "get_live_game_rows", slow_rows)
+    monkeypatch.setattr(game_state_cache, "build_state", lambda rows: make_state(7))
+    cache = LiveGameCache(max_games=4, idle_ttl=60)
+
+    states = await asyncio.gather(*(cache.load(None, 7) for _ in range(5)))
+
+    assert calls == [7]
+    assert all(state is states[0] for state in states)
+    assert cache.get(7) is states[0]
+    assert cache.stats()["coalesced_loads"] == 4
+
+
+@pytest.mark.asyncio
+async def test_failed_load_propagates_to_waiters_and_is_retried(monkeypatch):
+    attempts = []
+
+    async def flaky_rows(db, game_id):
+        attempts.append(game_id)
+        await asyncio.sleep(0.01)
+        if len(attempts) == 1:
+            raise RuntimeError("db down")
+        return [object()]
+
+    monkeypatch.setattr(game_state_cache.game_crud, "get_live_game_rows", flaky_rows)
+    monkeypatch.setattr(game_state_cache, "build_state", lambda rows: make_state(3))
+    cache = LiveGameCache(max_games=4, idle_ttl=60)
+
+    results = await asyncio.gather(cache.load(None, 3), cache.load(None, 3), return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+    assert (await cache.load(None, 3)).game_id == 3
+    assert len(attempts) == 2
@@ -0,0 +1,164 @@
+import io
+import json
+
+import pytest
+from sqlalchemy import func
+from sqlalchemy.future import select
+
+from app.crud.game_mode_crud import create_game_mode
+from app.crud.user_crud import create_user
+from app.models.game import Game
+from app.models.game_participant import GameParticipant
+from app.models.statistic import Statistic
+from app.models.throw import Throw
+from app.models.user import User
+from app.schemas.game_mode_schemas import GameModeCreate
+from app.services import import_service
+from app.services.dart_codec import dart_count
+from app.services.import_service import ImportService, UNUSABLE_PASSWORD
+from app.services.leaderboard_service import leaderboards
+from app.services.statistics_service import StatisticsService
+
+STARTED = "2024-03-01T19:00:00+00:00"
+
+# 301 Double-Out: anna 180 → 121, ben 3 → 298, anna T20 T11 D14 → Checkout 121
+DARTS = [("anna", 20, 3)] * 3 + [("ben", 1, 1)] * 3 + [("anna", 20, 3), ("anna", 11, 3), ("anna", 14, 2)]
+
+
+def match(external_id, darts=DARTS, players=("anna", "ben"), game_mode="301"):
+    return json.dumps({
+        "external_id": external_id,
+        "game_mode": game_mode,
+        "started_at": STARTED,
+        "players": list(players),
+        "throws": [{"player": p, "value": v, "multiplier": m} for p, v, m in darts],
+    })
+
+
+async def _mode(db):
+    return await create_game_mode(
+        db, GameModeCreate(name="301", starting_score=301, scoring_type="subtract", checkout_rule="double")
+    )
+
+
+async def count(db, model):
+    return await db.scalar(select(func.count()).select_from(model))
+
+
+@pytest.mark.asyncio
+async def test_ndjson_import_replays_matches_and_writes_statistics_per_chunk(async_session):
+    mode = await _mode(async_session)
+    existing = await create_user(async_session, username="anna", email="anna@example.com", password_hash="x")
+    lines = io.StringIO("\n".join([match("m1"), match("m2")]) + "\n")
+
+    result = await ImportService.run(async_session, lines, "ndjson", "liga", chunk_size=1)
+
+    assert (result["status"], result["matches_imported"], result["matches_rejected"]) == ("completed", 2, 0)
+    assert (result["throws_imported"], result["users_created"]) == (18, 1)
+
+    games = (await async_session.scalars(select(Game).order_by(Game.id))).all()
+    assert [g.status for g in games] == ["finished", "finished"]
+    assert all(g.user_id == existing.id and g.game_mode_id == mode.id for g in games)
+
+    winner = (await async_session.scalars(
+        select(GameParticipant).where(GameParticipant.user_id == existing.id).order_by(GameParticipant.id)
+    )).first()
+    assert (winner.current_score, winner.finish_order, dart_count(winner.darts)) == (0, 1, 6)
+
+    stats = (await async_session.scalars(
+        select(Statistic).where(Statistic.user_id == existing.id, Statistic.game_mode_id == mode.id)
+    )).one()
+    assert (stats.games_played, stats.wins, stats.total_throws, stats.highest_checkout) == (2, 2, 12, 121)
+    assert leaderboards.board("wins", mode.id).rank(existing.id) == 1
+
+    # Pro Block geschriebene Statistik = Neuberechnung aus den Würfen
+    assert await StatisticsService.verify(async_session) == []
+
+
+@pytest.mark.asyncio
+async def test_unfinished_match_is_aborted_and_not_counted_as_played(async_session):
+    mode = await _mode(async_session)
+    await ImportService.run(async_session, io.StringIO(match("open", darts=DARTS[:6]) + "\n"), "ndjson", "open")
+
+    assert (await async_session.scalars(select(Game.status))).all() == ["aborted"]
+    stats = (await async_session.scalars(
+        select(Statistic).where(Statistic.game_mode_id == mode.id).order_by(Statistic.user_id)
+    )).all()
+    # Darts zählen, das Match nicht (wie live: games_played erst bei Spielende)
+    assert [(s.games_played, s.wins, s.losses, s.total_throws) for s in stats] == [(0, 0, 0, 3), (0, 0, 0, 3)]
+    assert await StatisticsService.verify(async_session) == []
+
+
+@pytest.mark.asyncio
+async def test_csv_import_groups_rows_by_match(async_session):
+    await _mode(async_session)
+    rows = ["match_id,game_mode,started_at,player,value,multiplier,timestamp"]
+    for external_id in ("c1", "c2"):
+        rows += [f"{external_id},301,{STARTED},{p},{v},{m}," for p, v, m in DARTS]
+
+    result = await ImportService.run(async_session, io.StringIO("\n".join(rows) + "\n"), "csv", "csv-liga")
+
+    assert (result["matches_imported"], result["throws_imported"], result["users_created"]) == (2, 18, 2)
+    assert await count(async_session, Game) == 2
+    assert await count(async_session, GameParticipant) == 4
+    # Neue User ohne Passwort → kein Login möglich
+    hashes = (await async_session.scalars(select(User.password_hash))).all()
+    assert hashes == [UNUSABLE_PASSWORD] * 2
+
+
+@pytest.mark.asyncio
+async def test_invalid_matches_are_rejected_with_reason(async_session):
+    await _mode(async_session)
+    lines = io.StringIO("\n".join([
+        match("out-of-turn", darts=[("ben", 20, 1)]),
+        match("bad-value", darts=[("anna", 21, 1)]),
+        match("after-win", darts=DARTS + [("ben", 20, 1)]),
+        match("unknown-mode", game_mode="999"),
+        "{not json",
+        match("ok"),
+    ]))
+
+    result = await ImportService.run(async_session, lines, "ndjson", "mixed")
+
+    assert (result["matches_imported"], result["matches_rejected"], result["records_done"]) == (1, 5, 6)
+    reasons = {r["external_id"]: r["reason"] for r in result["rejected"]}
+    assert reasons["out-of-turn"] == "Dart 1: It is not your turn."
+    assert reasons["bad-value"].startswith("Dart 1: Value must be")
+    assert reasons["after-win"].startswith("Dart 10: match was already won")
+    assert reasons["unknown-mode"] == "Unknown game mode: 999"
+    assert reasons["line 5"].startswith("Unreadable record")
+    assert await count(async_session, Game) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_import_resumes_after_last_committed_chunk(async_session, monkeypatch):
+    await _mode(async_session)
+    content = "\n".join(match(f"m{i}") for i in range(3))
+    copy_rows = import_service.copy_rows
+    calls = []
+
+    async def failing_copy(db, model, rows):
+        calls.append(len(rows))
+        if len(calls) == 2:
+            raise RuntimeError("connection lost")
+        await copy_rows(db, model, rows)
+
+    monkeypatch.setattr(import_service, "copy_rows", failing_copy)
+    with pytest.raises(RuntimeError):
+        await ImportService.run(async_session, io.StringIO(content), "ndjson", "resume", chunk_size=1)
+
+    job = await ImportService.get_job(async_session, "resume")
+    assert (job.status, job.records_done, job.matches_imported) == ("failed", 1, 1)
+    assert "connection lost" in job.error
+    assert await count(async_session, Game) == 1
+
+    monkeypatch.setattr(import_service, "copy_rows", copy_rows)
+    result = await ImportService.run(async_session, io.StringIO(content), "ndjson", "resume", chunk_size=1)
+
+    assert (result["status"], result["records_done"], result["matches_imported"]) == ("completed", 3, 3)
+    assert await count(async_session, Game) == 3
+    assert await count(async_session, Throw) == 27
+
+    # Abgeschlossener Job → kein zweiter Import
+    again = await ImportService.run(async_session, io.StringIO(content), "ndjson", "resume")
+    assert again["matches_imported"] == 3 and await count(async_session, Game) == 3
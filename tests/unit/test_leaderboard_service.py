@@ -0,0 +1,85 @@
+import asyncio
+import random
+
+import pytest
+
+from app.crud.user_crud import create_user
+from app.services.leaderboard_service import Leaderboard, Leaderboards, Standing
+from app.services.statistics_service import new_statistic
+
+
+def test_rank_and_page_match_full_sort_with_ties():
+    rng = random.Random(1)
+    board = Leaderboard()
+    values = {}
+    for _ in range(500):
+        user_id, value = rng.randint(1, 80), rng.randint(0, 20)
+        board.set(user_id, value)
+        values[user_id] = value
+        if rng.random() < 0.1:
+            board.remove(user_id)
+            values.pop(user_id)
+
+    expected = sorted(values.items(), key=lambda kv: (-kv[1], kv[0]))
+    competition_rank = {u: 1 + sum(1 for v in values.values() if v > value) for u, value in values.items()}
+
+    assert len(board) == len(values)
+    assert all(board.rank(u) == competition_rank[u] for u in values)
+    assert board.page(0, len(values)) == [(competition_rank[u], u, v) for u, v in expected]
+    # Seite mitten in einer Gleichstand-Gruppe → Rang trotzdem korrekt
+    assert board.page(7, 5) == [(competition_rank[u], u, v) for u, v in expected[7:12]]
+    assert board.rank(999) is None
+
+
+def test_overall_board_combines_modes_and_requires_min_throws():
+    boards = Leaderboards(min_throws=30)
+    boards.update([
+        Standing(1, 10, wins=3, total_throws=30, average_score_per_throw=20.0, highest_checkout=100),
+        Standing(1, 11, wins=1, total_throws=10, average_score_per_throw=40.0, highest_checkout=121),
+        Standing(2, 10, wins=2, total_throws=60, average_score_per_throw=21.0, highest_checkout=40),
+    ])
+
+    assert boards.board("wins", 10).page() == [(1, 1, 3), (2, 2, 2)]
+    assert boards.board("wins").page() == [(1, 1, 4), (2, 2, 2)]
+    # Modus 11: nur 10 Darts → nicht im Average-Ranking
+    assert boards.board("average", 11).rank(1) is None
+    # Gesamt: (30·20 + 10·40) / 40 = 25 pro Dart → 75 Average
+    assert boards.board("average").values == {1: 75.0, 2: 63.0}
+    assert boards.board("highest_checkout").rank(1) == 1
+
+    boards.update([Standing(2, 10, wins=5, total_throws=60, average_score_per_throw=21.0, highest_checkout=40)])
+    assert boards.board("wins").page() == [(1, 2, 5), (2, 1, 4)]
+
+
+@pytest.mark.asyncio
+async def test_rebuild_from_statistics_table(async_session):
+    anna = await create_user(async_session, username="anna", email="anna@example.com", password_hash="x")
+    ben = await create_user(async_session, username="ben", email="ben@example.com", password_hash="x")
+    for user, wins in ((anna, 2), (ben, 7)):
+        row = new_statistic(user.id, None)
+        row.wins = wins
+        async_session.add(row)
+    await async_session.commit()
+
+    boards = Leaderboards()
+    assert await boards.rebuild(async_session) == 2
+    assert boards.board("wins").page() == [(1, ben.id, 7), (2, anna.id, 2)]
+    # Zeilen ohne Modus nur in der Gesamtliste
+    assert list(boards.boards) == [("wins", None), ("highest_checkout", None), ("average", None)]
+
+
+@pytest.mark.asyncio
+async def test_failed_periodic_rebuild_is_counted_and_keeps_boards():
+    index = Leaderboards(min_throws=0, refresh_interval=0.01)
+    index.update([Standing(1, 1, 3, 30, 20.0, 40)])
+
+    def broken_factory():
+        raise RuntimeError("database down")
+
+    index._session_factory = broken_factory
+    index._task = asyncio.create_task(index._run())
+    await asyncio.sleep(0.05)
+    await index.stop()
+
+    assert index.stats()["failed_rebuilds"] >= 1
+    assert index.board("wins", 1).rank(1) == 1
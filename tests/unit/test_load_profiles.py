@@ -0,0 +1,79 @@
+import pytest
+from sqlalchemy import event, select, func
+from sqlalchemy.exc import InvalidRequestError
+
+from app.crud.load_profiles import load_profile
+from app.crud.user_crud import create_user, get_user_by_username
+from app.crud.game_mode_crud import create_game_mode, delete_game_mode
+from app.crud.game_participant_crud import get_participant
+from app.models.game import Game
+from app.schemas.game_mode_schemas import GameModeCreate
+from app.services.game_service import GameService
+
+
+async def make_game(db):
+    host = await create_user(db, username="host", email="host@example.com", password_hash="x")
+    guest = await create_user(db, username="guest", email="guest@example.com", password_hash="x")
+    mode = await create_game_mode(
+        db, GameModeCreate(name="501 Double Out", starting_score=501, scoring_type="subtract", checkout_rule="double")
+    )
+    game = await GameService.start_game(
+        db=db, host=host, game_mode=mode, opponent_ids=[guest.id], first_to=1, first_shot="host"
+    )
+    return host, mode, game
+
+
+def test_unknown_profile_raises():
+    with pytest.raises(ValueError):
+        load_profile("everything")
+
+
+# ---------------------------------------------------------
+# Auth: genau eine Query, kein Fan-out in Spiele/Statistiken
+# ---------------------------------------------------------
+@pytest.mark.asyncio
+async def test_auth_profile_loads_only_user_columns(async_session):
+    await make_game(async_session)
+    async_session.expunge_all()
+
+    statements = []
+    engine = async_session.bind.sync_engine
+    on_execute = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", on_execute)
+    try:
+        user = await get_user_by_username(async_session, "host")
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+
+    assert user.username == "host"
+    assert len(statements) == 1
+
+    # Guard: unerwarteter Lazy-Load → Fehler statt stiller Query
+    with pytest.raises(InvalidRequestError):
+        user.games
+
+
+# ---------------------------------------------------------
+# game_list: Teilnehmer + User geladen, Würfe nicht
+# ---------------------------------------------------------
+@pytest.mark.asyncio
+async def test_game_list_profile_loads_participants_without_throws(async_session):
+    _, _, game = await make_game(async_session)
+
+    assert sorted(p.user.username for p in game.participants) == ["guest", "host"]
+    assert game.game_mode.starting_score == 501
+    with pytest.raises(InvalidRequestError):
+        game.throws
+
+    participant = await get_participant(async_session, game.participants[0].id)
+    assert participant.user.username in ("host", "guest")
+    with pytest.raises(InvalidRequestError):
+        participant.throws
+
+
+@pytest.mark.asyncio
+async def test_delete_game_mode_cascades_with_profile(async_session):
+    _, mode, _ = await make_game(async_session)
+
+    assert await delete_game_mode(async_session, mode.id) is True
+    assert await async_session.scalar(select(func.count(Game.id))) == 0
@@ -0,0 +1,30 @@
+import pytest
+
+from app.crud.pagination import decode_cursor, encode_cursor, page_of
+
+
+def test_cursor_roundtrip_is_opaque_and_url_safe():
+    cursor = encode_cursor(123456)
+    assert "123456" not in cursor
+    assert all(c.isalnum() or c in "-_" for c in cursor)
+    assert decode_cursor(cursor) == 123456
+    assert decode_cursor(None) is None
+
+
+@pytest.mark.parametrize("cursor", ["garbage!", encode_cursor("x"), "eyJmb28iOjF9", "W10"])
+def test_invalid_cursor(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_page_of_uses_extra_row_only_as_marker():
+    class Row:
+        def __init__(self, id):
+            self.id = id
+
+    items, next_cursor = page_of([Row(1), Row(2), Row(3)], limit=2)
+    assert [r.id for r in items] == [1, 2]
+    assert decode_cursor(next_cursor) == 2
+
+    items, next_cursor = page_of([Row(1), Row(2)], limit=2)
+    assert len(items) == 2 and next_cursor is None
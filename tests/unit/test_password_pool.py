@@ -0,0 +1,72 @@
+import asyncio
+import threading
+
+import pytest
+from passlib.context import CryptContext
+
+from app.auth import auth_utils
+from app.auth.password_pool import PasswordHashPool, PasswordPoolBusy
+
+
+@pytest.mark.asyncio
+async def test_pool_runs_off_loop_and_rejects_when_full():
+    pool = PasswordHashPool(workers=1, max_pending=2)
+    release = threading.Event()
+    loop_thread = threading.get_ident()
+
+    def slow():
+        release.wait(5)
+        return threading.get_ident()
+
+    first = asyncio.create_task(pool.run(slow))
+    second = asyncio.create_task(pool.run(slow))
+    await asyncio.sleep(0)
+    assert (pool.pending, pool.queue_depth) == (2, 1)
+
+    # Warteschlange voll → sofort abgewiesen, kein weiterer Rückstau
+    with pytest.raises(PasswordPoolBusy):
+        await pool.run(slow)
+
+    release.set()
+    threads = await asyncio.gather(first, second)
+    assert loop_thread not in threads
+    stats = pool.stats()
+    assert (stats["completed"], stats["rejected"], stats["pending"], stats["max_queue_depth"]) == (2, 1, 0, 1)
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_keeps_slot_until_job_finishes():
+    pool = PasswordHashPool(workers=1, max_pending=1)
+    release = threading.Event()
+    task = asyncio.create_task(pool.run(release.wait, 5))
+    await asyncio.sleep(0)
+
+    # Request abgebrochen, der Thread rechnet weiter → Slot bleibt belegt
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert pool.pending == 1
+    with pytest.raises(PasswordPoolBusy):
+        await pool.run(release.wait, 5)
+
+    release.set()
+    while pool.pending:
+        await asyncio.sleep(0.01)
+    assert pool.stats()["completed"] == 1
+    pool.shutdown()
+
+@pytest.mark.asyncio
+async def test_verify_rehashes_when_cost_factor_changes(monkeypatch):
+    old = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("secret")
+    current = CryptContext(
+        schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=5, bcrypt__min_rounds=5, bcrypt__max_rounds=5
+    )
+    monkeypatch.setattr(auth_utils, "pwd_context", current)
+
+    valid, new_hash = await auth_utils.verify_password_async("secret", old)
+    assert valid and new_hash.startswith("$2b$05$")
+    assert await auth_utils.verify_password_async("secret", new_hash) == (True, None)
+    assert await auth_utils.verify_password_async("wrong", old) == (False, None)
+    # Importierte User ohne Hash
+    assert await auth_utils.verify_password_async("", "!") == (False, None)
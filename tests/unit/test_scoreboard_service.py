@@ -0,0 +1,81 @@
+from datetime import datetime, UTC
+
+from app.services.game_rules import build_rules
+from app.services.game_state_cache import LiveGameState, ParticipantState
+from app.services.throw_service import ThrowService
+from app.services.scoreboard_service import ScoreboardService, is_checkout_attempt
+
+
+def make_state(score=501, checkout_rule="double"):
+    return LiveGameState(
+        game_id=1,
+        game_mode_id=1,
+        status="ongoing",
+        current_turn_user_id=10,
+        rules=build_rules("subtract", 501, checkout_rule),
+        participants=[
+            ParticipantState(1, 10, "host", 501, score, 0, 0, 0, 0),
+            ParticipantState(2, 20, "guest", 501, 501, 0, 0, 0, 0),
+        ],
+        start_time=datetime.now(UTC),
+    )
+
+
+def throw(state, participant_id, value, multiplier):
+    participant = state.participant(participant_id)
+    return ThrowService.apply_to_state(state, participant, value, multiplier, datetime.now(UTC))
+
+
+def test_checkout_attempt_depends_on_rule():
+    double = build_rules("subtract", 501, "double")
+    assert is_checkout_attempt(40, double)
+    assert is_checkout_attempt(50, double)
+    assert not is_checkout_attempt(41, double)
+    assert is_checkout_attempt(57, build_rules("subtract", 501, "straight"))
+    assert not is_checkout_attempt(40, build_rules("add", 0, None))
+
+
+def test_turn_statistics_after_full_turns():
+    state = make_state()
+    for value, multiplier in [(20, 3), (20, 3), (20, 3)]:
+        throw(state, 1, value, multiplier)
+    for value, multiplier in [(20, 1), (5, 1), (1, 1)]:
+        throw(state, 2, value, multiplier)
+    # Zweite Aufnahme des Hosts, erst ein Dart
+    throw(state, 1, 19, 3)
+
+    host, guest = (ScoreboardService.participant_out(state, p) for p in state.participants)
+
+    assert host.score_last_turn == 180
+    assert host.highest_score == 180
+    assert (host.dart1_score, host.dart2_score, host.dart3_score) == (57, None, None)
+    assert host.current_score == 321   # Score vor der laufenden Aufnahme
+    assert host.new_score == 264
+    assert host.three_dart_average == round(237 / 4 * 3, 2)
+    assert host.first_9_average == 180
+
+    assert guest.score_last_turn == 26
+    assert guest.checkout_suggestion is None  # 475 → kein Finish
+
+
+def test_checkout_percentage_and_best_leg():
+    state = make_state(score=40)
+    throw(state, 1, 20, 1)        # 40 → 20, Versuch auf D20 vergeben
+    _, result = throw(state, 1, 10, 2)  # D10 → Check-out
+
+    assert result["status"] == "WIN"
+    host = ScoreboardService.participant_out(state, state.participant(1))
+    assert host.checkout_percentage == 50.0
+    assert host.best_leg == 2
+    assert host.score_last_turn == 40
+
+
+def test_checkout_suggestion_uses_darts_left():
+    state = make_state(score=100)
+    host = ScoreboardService.participant_out(state, state.participant(1))
+    assert host.checkout_suggestion == "T20, D20"
+
+    throw(state, 1, 0, 1)  # daneben
+    throw(state, 1, 0, 1)
+    host = ScoreboardService.participant_out(state, state.participant(1))
+    assert host.checkout_suggestion is None  # 100 mit einem Dart nicht checkbar
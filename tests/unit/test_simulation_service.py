@@ -0,0 +1,24 @@
+from app.services.simulation_service import SimulationService
+
+
+# ---------------------------------------------------------
+# Test: Ergebnis hängt nur vom Seed ab, nicht von der Worker-Anzahl
+# ---------------------------------------------------------
+def test_run_is_independent_of_worker_count():
+    single = SimulationService.run(3000, seed=123, workers=1, chunk_size=1000)
+    pooled = SimulationService.run(3000, seed=123, workers=2, chunk_size=1000)
+
+    assert single == pooled
+
+
+# ---------------------------------------------------------
+# Test: zusammengeführte Zähler sind konsistent
+# ---------------------------------------------------------
+def test_run_merges_partial_results():
+    stats = SimulationService.run(2500, num_players=3, starting_score=301, seed=5, workers=1, chunk_size=1000)
+
+    assert stats["legs"] == 2500
+    assert sum(stats["wins"]) == stats["finished"]
+    assert stats["finished"] + stats["aborted"] == 2500
+    assert stats["average_darts_per_leg"] >= 6  # 301 geht frühestens mit 6 Darts
+    assert 0 < stats["bust_rate"] < 1
@@ -0,0 +1,240 @@
+import random
+from datetime import date
+
+import numpy as np
+import pytest
+from sqlalchemy import event, select
+
+from app.crud.user_crud import create_user
+from app.crud.game_mode_crud import create_game_mode
+from app.models.statistic import Statistic
+from app.models.statistic_rollup import StatisticRollup
+from app.schemas.game_mode_schemas import GameModeCreate
+from app.schemas.throw_schemas import ThrowCreate
+from app.services.aim_service import get_player_sigma
+from app.services.game_service import GameService
+from app.services.statistics_service import (
+    RunningStats,
+    StatAccumulator,
+    StatisticsService,
+    StatsBatch,
+    bucket_start,
+    new_rollup,
+    stat_accumulators,
+)
+from app.services.throw_service import ThrowService
+
+
+def test_running_stats_matches_two_pass_and_merge_is_exact():
+    rng = random.Random(7)
+    values = [rng.choice([0, 1, 5, 19, 20, 40, 57, 60]) for _ in range(2000)]
+
+    streamed = RunningStats()
+    for v in values:
+        streamed.add(v)
+
+    # Beliebig zerlegt + zusammengeführt (wie mehrere Flushes) → gleiches Ergebnis
+    merged = RunningStats()
+    start = 0
+    while start < len(values):
+        end = start + rng.randint(1, 300)
+        part = RunningStats()
+        for v in values[start:end]:
+            part.add(v)
+        merged.merge(part)
+        start = end
+
+    for acc in (streamed, merged):
+        assert acc.count == len(values)
+        assert acc.mean == pytest.approx(np.mean(values), rel=1e-12)
+        assert acc.variance == pytest.approx(np.var(values), rel=1e-12)
+        assert acc.maximum == max(values)
+
+
+def test_turn_buckets():
+    acc = StatAccumulator()
+    for points in (99, 100, 139, 140, 179, 180, 26):
+        acc.record_turn(points)
+    assert (acc.total_100s, acc.total_140s, acc.total_180s) == (2, 2, 1)
+    assert acc.turns.maximum == 180
+
+
+async def _play_random_game(db, seed=3, darts=120):
+    """Zufällige Darts über den echten Wurf-Pfad (inkl. Bust, ggf. Checkout)."""
+    host = await create_user(db, username="anna", email="anna@example.com", password_hash="x")
+    guest = await create_user(db, username="ben", email="ben@example.com", password_hash="x")
+    mode = await create_game_mode(
+        db, GameModeCreate(name="301 Double Out", starting_score=301, scoring_type="subtract", checkout_rule="double")
+    )
+    game = await GameService.start_game(
+        db=db, host=host, game_mode=mode, opponent_ids=[guest.id], first_to=1, first_shot="host"
+    )
+    order = sorted(p.id for p in game.participants)
+
+    rng = random.Random(seed)
+    turn_of, in_turn = 0, 0
+    for _ in range(darts):
+        value, multiplier = rng.choice([20, 19, 18, 5, 1, 25]), rng.choice([1, 1, 2, 3])
+        if value == 25 and multiplier == 3:
+            multiplier = 2
+        result = await ThrowService.process_throw(
+            db, ThrowCreate(game_id=game.id, participant_id=order[turn_of], value=value, multiplier=multiplier)
+        )
+        in_turn += 1
+        if result["status"] == "WIN":
+            break
+        if result["status"] == "BUST" or in_turn == 3:
+            turn_of, in_turn = 1 - turn_of, 0
+    return game, mode, host
+
+
+@pytest.mark.asyncio
+async def test_accumulators_equal_full_recompute(async_session):
+    game, mode, host = await _play_random_game(async_session)
+
+    # Nichts geschrieben, bevor geflusht wird
+    assert (await async_session.scalars(select(Statistic))).all() == []
+    assert len(stat_accumulators.pending) == 2
+
+    # Zwei Flushes (Zeile existiert beim zweiten schon → Merge mit der Zeile)
+    await stat_accumulators.flush(async_session)
+    await _play_more(async_session, game)
+    await stat_accumulators.flush(async_session)
+
+    rows = (await async_session.scalars(select(Statistic))).all()
+    assert {r.game_mode_id for r in rows} == {mode.id}
+    assert sum(r.total_throws for r in rows) > 0
+    assert await StatisticsService.verify(async_session) == []
+
+    host_row = next(r for r in rows if r.user_id == host.id)
+    assert host_row.average_score_per_turn > 0
+
+    # Alle Darts heute → je Zeitraum genau ein Bucket, identisch mit der Gesamtzeile
+    rollups = (await async_session.scalars(
+        select(StatisticRollup).where(StatisticRollup.user_id == host.id)
+    )).all()
+    assert sorted(r.period for r in rollups) == ["day", "month", "week"]
+    for rollup in rollups:
+        assert rollup.total_throws == host_row.total_throws
+        assert rollup.average_score_per_turn == pytest.approx(host_row.average_score_per_turn)
+        assert rollup.turn_variance == pytest.approx(host_row.turn_variance)
+    assert get_player_sigma(host.id) is not None
+
+
+async def _play_more(db, game):
+    participant_id = min(p.id for p in game.participants)
+    for _ in range(3):
+        result = await ThrowService.process_throw(
+            db, ThrowCreate(game_id=game.id, participant_id=participant_id, value=1, multiplier=1)
+        )
+        if result["status"] == "WIN":
+            break
+
+
+@pytest.mark.asyncio
+async def test_verify_detects_and_repairs_drift(async_session):
+    await _play_random_game(async_session, seed=11, darts=30)
+    await stat_accumulators.flush(async_session)
+
+    row = (await async_session.scalars(select(Statistic).order_by(Statistic.id))).first()
+    row.total_180s += 1
+    row.average_score_per_throw += 0.5
+    await async_session.commit()
+
+    mismatches = await StatisticsService.verify(async_session)
+    assert len(mismatches) == 1
+    assert set(mismatches[0]["fields"]) == {"average_score_per_throw", "total_180s"}
+
+    await StatisticsService.verify(async_session, repair=True)
+    assert await StatisticsService.verify(async_session) == []
+
+
+@pytest.mark.asyncio
+async def test_flush_with_throw_transaction(async_session):
+    stat_accumulators.flush_with_throws = True
+    try:
+        await _play_random_game(async_session, seed=5, darts=6)
+    finally:
+        stat_accumulators.flush_with_throws = False
+
+    assert len(stat_accumulators.pending) == 0
+    rows = (await async_session.scalars(select(Statistic))).all()
+    assert sum(r.total_throws for r in rows) == 6
+    assert await StatisticsService.verify(async_session) == []
+
+
+@pytest.mark.asyncio
+async def test_write_survives_concurrent_insert_of_missing_rows(async_session):
+    user = await create_user(async_session, username="anna", email="anna@example.com", password_hash="x")
+    mode = await create_game_mode(
+        async_session, GameModeCreate(name="501", starting_score=501, scoring_type="subtract", checkout_rule="double")
+    )
+    batch = StatsBatch()
+    batch.accumulator(user.id, mode.id, date(2024, 3, 1), x01=True).record_dart(60)
+
+    # Ein anderer Worker legt die Zeilen zwischen unserem SELECT und unserem INSERT an
+    engine = async_session.bind.sync_engine
+    raced = []
+
+    def concurrent_insert(conn, cursor, statement, parameters, context, executemany):
+        for table in ("statistics", "statistic_rollups"):
+            if statement.startswith(f"INSERT INTO {table} ") and table not in raced:
+                raced.append(table)
+                cursor.executemany(statement, parameters if executemany else [parameters])
+
+    event.listen(engine, "before_cursor_execute", concurrent_insert)
+    try:
+        await stat_accumulators.write(async_session, batch)
+        await async_session.commit()
+    finally:
+        event.remove(engine, "before_cursor_execute", concurrent_insert)
+
+    assert raced == ["statistics", "statistic_rollups"]
+    row = (await async_session.scalars(select(Statistic).where(Statistic.user_id == user.id))).one()
+    assert (row.total_throws, row.highest_score_per_throw) == (1, 60)
+    rollups = (await async_session.scalars(select(StatisticRollup))).all()
+    assert sorted(r.period for r in rollups) == ["day", "month", "week"]
+    assert all(r.total_throws == 1 for r in rollups)
+
+def test_bucket_start():
+    day = date(2025, 3, 13)  # Donnerstag
+    assert bucket_start(day, "day") == day
+    assert bucket_start(day, "week") == date(2025, 3, 10)
+    assert bucket_start(day, "month") == date(2025, 3, 1)
+
+
+@pytest.mark.asyncio
+async def test_timeseries_fills_gaps_and_rolls_windows(async_session):
+    user = await create_user(async_session, username="cara", email="cara@example.com", password_hash="x")
+
+    def day_row(day, turns, attempts=0, hits=0):
+        acc = StatAccumulator()
+        for points in turns:
+            acc.record_turn(points)
+        for i in range(attempts):
+            acc.record_checkout_attempt(i < hits, 40)
+        row = new_rollup(user.id, None, "day", day)
+        acc.to_row(row)
+        return row
+
+    async_session.add_all([
+        day_row(date(2025, 3, 1), [60, 100], attempts=2, hits=1),
+        day_row(date(2025, 3, 3), [180], attempts=2, hits=0),
+        day_row(date(2025, 2, 27), [20]),   # nur im Fenster des ersten Punkts
+    ])
+    await async_session.commit()
+
+    result = await StatisticsService.timeseries(
+        async_session, user.id, period="day", buckets=3, window=3, today=date(2025, 3, 3)
+    )
+    points = result["points"]
+    assert [p["bucket_start"] for p in points] == [date(2025, 3, 1), date(2025, 3, 2), date(2025, 3, 3)]
+    assert [p["turns"] for p in points] == [2, 0, 1]
+    assert points[0]["checkout_percentage"] == 50.0
+
+    # Fenster 27.2.–1.3. → (20 + 60 + 100) / 3; 1.3.–3.3. → (60 + 100 + 180) / 3
+    assert points[0]["rolling_average_score_per_turn"] == pytest.approx(60.0)
+    assert points[1]["rolling_average_score_per_turn"] == pytest.approx(80.0)
+    assert points[2]["rolling_average_score_per_turn"] == pytest.approx(340 / 3)
+    assert points[2]["rolling_checkout_percentage"] == 25.0
+    assert [p["rolling_180s"] for p in points] == [0, 0, 1]
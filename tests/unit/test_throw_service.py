@@ -1,6 +1,12 @@
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
+from sqlalchemy import event
 
+from app.crud.game_mode_crud import create_game_mode
+from app.crud.user_crud import create_user
+from app.schemas.game_mode_schemas import GameModeCreate
+from app.schemas.throw_schemas import ThrowCreate
+from app.services.game_service import GameService
 from app.services.throw_service import ThrowService
 from app.models.game import Game
 from app.models.game_participant import GameParticipant
@@ -150,4 +156,56 @@ async def test_throw_service_win():
                     )
 
     assert response.status == "WIN"
-    assert response.remaining == 0
\ No newline at end of file
+    assert response.remaining == 0
+
+
+# ---------------------------------------------------------
+# Unit of Work: Statements pro Dart zählen
+# ---------------------------------------------------------
+@pytest.mark.asyncio
+async def test_process_throw_round_trips(async_session):
+    host = await create_user(async_session, username="host", email="host@example.com", password_hash="x")
+    guest = await create_user(async_session, username="guest", email="guest@example.com", password_hash="x")
+    mode = await create_game_mode(
+        async_session,
+        GameModeCreate(name="501 Double Out", starting_score=501, scoring_type="subtract", checkout_rule="double")
+    )
+    game = await GameService.start_game(
+        db=async_session, host=host, game_mode=mode, opponent_ids=[guest.id], first_to=1, first_shot="host"
+    )
+    host_p = min(game.participants, key=lambda p: p.id)
+
+    statements, commits = [], []
+    engine = async_session.bind.sync_engine
+
+    def on_execute(conn, cursor, statement, *args):
+        statements.append(statement.split()[0].upper())
+
+    def on_commit(conn):
+        commits.append(1)
+
+    event.listen(engine, "before_cursor_execute", on_execute)
+    event.listen(engine, "commit", on_commit)
+
+    async def throw():
+        statements.clear()
+        commits.clear()
+        await ThrowService.process_throw(
+            async_session, ThrowCreate(game_id=game.id, participant_id=host_p.id, value=20, multiplier=3)
+        )
+        return list(statements), len(commits)
+
+    try:
+        # Kalter Cache: eine Lese-Query, dann Throw + Teilnehmer in einem Commit
+        cold, cold_commits = await throw()
+        # Warmer Cache: kein SELECT mehr
+        warm, warm_commits = await throw()
+        # 3. Dart → Turnwechsel: zusätzlich die games-Zeile
+        switch, _ = await throw()
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+        event.remove(engine, "commit", on_commit)
+
+    assert cold == ["SELECT", "INSERT", "UPDATE"] and cold_commits == 1
+    assert warm == ["INSERT", "UPDATE"] and warm_commits == 1
+    assert switch == ["INSERT", "UPDATE", "UPDATE"]
@@ -0,0 +1,149 @@
+import asyncio
+from datetime import datetime, UTC
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models.game import Game
+from app.models.game_mode import GameMode
+from app.models.game_participant import GameParticipant
+from app.models.throw import Throw
+from app.models.user import User
+from app.services import throw_service
+from app.services.throw_service import ThrowService
+from app.services.throw_writer import ThrowWriteBatcher
+
+
+class State:
+    def __init__(self, game_id, current_turn_user_id):
+        self.game_id = game_id
+        self.current_turn_user_id = current_turn_user_id
+        self.status = "ongoing"
+
+
+class Participant:
+    def __init__(self, id, score):
+        self.id = id
+        self.current_score = score
+        self.cricket_marks = 0
+        self.turn_number = 1
+        self.throw_in_turn = 1
+        self.darts_thrown = 1
+        self.darts = bytearray()
+
+
+def throw_row(game_id, participant_id, value):
+    return {
+        "game_id": game_id,
+        "participant_id": participant_id,
+        "value": value,
+        "multiplier": 1,
+        "turn_number": 1,
+        "throw_number_in_turn": 1,
+        "darts_thrown": 1,
+        "timestamp": datetime.now(UTC),
+    }
+
+
+# ---------------------------------------------------------
+# Eigene Datei-DB: der Batcher öffnet eigene Sessions
+# ---------------------------------------------------------
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'writer.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    factory = sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+    async with factory() as db:
+        db.add(User(id=1, username="host", email="host@example.com", password_hash="x"))
+        db.add(GameMode(id=1, name="501", starting_score=501, scoring_type="subtract"))
+        for game_id in range(1, 11):
+            db.add(Game(id=game_id, game_mode_id=1, user_id=1, first_shot="host", status="ongoing"))
+            db.add(GameParticipant(id=game_id, game_id=game_id, user_id=1, starting_score=501, current_score=501))
+        await db.commit()
+
+    yield factory
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_submits_share_one_batch(session_factory):
+    writer = ThrowWriteBatcher(session_factory=session_factory, max_batch=64, max_delay=0.01, enabled=True)
+
+    results = await asyncio.gather(*[
+        writer.submit([throw_row(g, g, 20)], [Participant(g, 481)], [State(g, None)])
+        for g in range(1, 11)
+    ])
+
+    assert all(len(saved) == 1 and saved[0].id for saved in results)
+    assert [saved[0].game_id for saved in results] == list(range(1, 11))
+
+    stats = writer.stats()
+    assert stats["batches"] == 1
+    assert stats["max_batch_size"] == 10
+    assert stats["requests"] == 10
+
+    async with session_factory() as db:
+        assert await db.scalar(select(func.count(Throw.id))) == 10
+        scores = (await db.scalars(select(GameParticipant.current_score))).all()
+        assert set(scores) == {481}
+
+
+@pytest.mark.asyncio
+async def test_batch_size_limit_flushes_early(session_factory):
+    writer = ThrowWriteBatcher(session_factory=session_factory, max_batch=4, max_delay=10, enabled=True)
+
+    # Zeitfenster von 10 s würde den Test blockieren → Größenlimit muss vorher flushen
+    await asyncio.wait_for(asyncio.gather(*[
+        writer.submit([throw_row(g, g, 5)], [Participant(g, 496)], [State(g, 1)])
+        for g in range(1, 9)
+    ]), timeout=2)
+
+    assert writer.batches == 2
+    assert writer.max_batch_size == 4
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_rejects_all_requests(session_factory):
+    writer = ThrowWriteBatcher(session_factory=session_factory, max_batch=64, max_delay=0.001, enabled=True)
+
+    bad_row = throw_row(1, 1, 20)
+    bad_row["participant_id"] = None  # NOT NULL verletzt → ganzer Batch scheitert
+
+    results = await asyncio.gather(
+        writer.submit([throw_row(2, 2, 20)], [Participant(2, 481)], [State(2, None)]),
+        writer.submit([bad_row], [], []),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, Exception) for r in results)
+    assert writer.failed_batches == 1
+    async with session_factory() as db:
+        assert await db.scalar(select(func.count(Throw.id))) == 0
+
+
+@pytest.mark.asyncio
+async def test_direct_write_is_rolled_back_when_writer_has_no_session_factory(monkeypatch):
+    class Session:
+        rolled_back = False
+
+        async def rollback(self):
+            self.rolled_back = True
+
+    async def failing_insert(db, rows):
+        raise RuntimeError("insert failed")
+
+    # Writer aktiv, aber ohne Session-Factory → direkter Pfad auf der Request-Session
+    monkeypatch.setattr(throw_service.throw_writer, "enabled", True)
+    monkeypatch.setattr(throw_service.throw_writer, "session_factory", None)
+    monkeypatch.setattr(throw_service.throw_crud, "bulk_create_throws", failing_insert)
+    db = Session()
+
+    with pytest.raises(RuntimeError):
+        await ThrowService.write_through(db, [], [], [throw_row(1, 1, 20)])
+    assert db.rolled_back
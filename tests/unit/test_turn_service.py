@@ -38,4 +38,32 @@ def test_third_throw_same_turn():
 def test_new_turn_after_three_darts():
     prev = [make_throw(1, 1), make_throw(1, 2), make_throw(1, 3)]
     result = TurnService.get_throw_position(prev)
-    assert result == (2, 1, 4)
\ No newline at end of file
+    assert result == (2, 1, 4)
+
+
+# ---------------------------------------------------------
+# O(1)-Zähler am Participant
+# ---------------------------------------------------------
+class Participant:
+    turn_number = 0
+    throw_in_turn = 0
+    darts_thrown = 0
+
+
+def test_advance_position_counts_turns():
+    p = Participant()
+    positions = [TurnService.advance_position(p) for _ in range(4)]
+
+    assert [(x["turn_number"], x["throw_number"], x["darts_thrown"]) for x in positions] == [
+        (1, 1, 1), (1, 2, 2), (1, 3, 3), (2, 1, 4)
+    ]
+    assert (p.turn_number, p.throw_in_turn, p.darts_thrown) == (2, 1, 4)
+
+
+def test_advance_position_starts_new_turn_after_early_bust():
+    p = Participant()
+    TurnService.advance_position(p)
+    TurnService.close_turn(p)  # BUST mit dem 1. Dart
+
+    position = TurnService.advance_position(p)
+    assert (position["turn_number"], position["throw_number"], position["darts_thrown"]) == (2, 1, 2)